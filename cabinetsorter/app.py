@@ -24,18 +24,24 @@
 import os
 import re
 import sys
-import git
+import time
 import json
-import lzma
 import html
-import jinja2
+import hashlib
 import logging
 import datetime
 import traceback
+import subprocess
 import collections
-import Levenshtein
+import collections.abc
 import configparser
 import urllib.parse
+import concurrent.futures
+
+# Most of our runs find that there's nothing to do, and exit right away, so
+# some of our heavier dependencies (GitPython, Jinja, Levenshtein, SQLite
+# and the compression libraries) are only imported when they're actually
+# needed.
 
 class Re(object):
     """
@@ -49,6 +55,8 @@ class Re(object):
     Taken from http://stackoverflow.com/questions/597476/how-to-concisely-cascade-through-multiple-regex-statements-in-python
     """
 
+    __slots__ = ('last_match',)
+
     def __init__(self):
         self.last_match = None
 
@@ -66,16 +74,26 @@ class DirInfo(object):
     and provide some useful methods to get at it.
     """
 
-    def __init__(self, repo_dir, dirpath, filenames):
+    __slots__ = ('repo_dir', 'blob_hashes', 'dirpath', 'rel_dirpath',
+            'dir_author', 'cur_path', 'lower_mapping', 'extension_map',
+            'no_extension', 'readme', 'entries')
+
+    def __init__(self, repo_dir, dirpath, filenames, blob_hashes=None):
         """
-        Initialize given our current dir path, and a list of filenames
+        Initialize given our current dir path, and a list of filenames.
+        The filenames may also be `os.DirEntry` objects (as returned by
+        `scan_dir`), in which case we can hand out file stats without
+        having to go back to the filesystem for them.  `blob_hashes`, if
+        passed in, should be a dict mapping repo-relative filenames to their
+        git blob hashes.
         """
         self.repo_dir = repo_dir
+        self.blob_hashes = blob_hashes
         self.dirpath = dirpath
         self.rel_dirpath = dirpath[len(self.repo_dir)+1:]
         path_components = self.rel_dirpath.split(os.sep)
         if len(path_components) > 1:
-            self.dir_author = path_components[1]
+            self.dir_author = sys.intern(path_components[1])
         else:
             self.dir_author = '(unknown)'
         self.cur_path = path_components[-1]
@@ -83,7 +101,11 @@ class DirInfo(object):
         self.extension_map = {}
         self.no_extension = []
         self.readme = None
+        self.entries = {}
         for n in filenames:
+            if isinstance(n, os.DirEntry):
+                self.entries[n.name.lower()] = n
+                n = n.name
             lower = n.lower()
             if '.' in lower:
                 ext = lower.split('.')[-1]
@@ -135,6 +157,33 @@ class DirInfo(object):
         """
         return self.no_extension
 
+    def get_stat(self, filename):
+        """
+        Returns an `os.stat_result` for the given file.  If we were constructed
+        with `os.DirEntry` objects, this will use the entry's own (cached) stat
+        info, rather than doing a fresh `os.stat`.
+        """
+        lower = filename.lower()
+        if lower in self.entries:
+            return self.entries[lower].stat()
+        else:
+            return os.stat(self[filename])
+
+    def get_mtime(self, filename):
+        """
+        Returns the mtime of the given file
+        """
+        return self.get_stat(filename).st_mtime
+
+    def get_hash(self, filename):
+        """
+        Returns the git blob hash of the given file, or `None` if we don't
+        know it.
+        """
+        if self.blob_hashes is None:
+            return None
+        return self.blob_hashes.get(self.get_rel_path(filename)[1])
+
     def get_rel_path(self, filename):
         """
         Returns a tuple with the relative path to the directory containing
@@ -145,6 +194,157 @@ class DirInfo(object):
             self[filename][len(self.repo_dir)+1:],
             )
 
+    def __getstate__(self):
+        """
+        `os.DirEntry` objects can't be pickled, so we leave those behind
+        (along with our blob hashes, which could be rather large) when
+        being sent off to another process.
+        """
+        state = dict([(attr, getattr(self, attr)) for attr in DirInfo.__slots__])
+        state['entries'] = {}
+        state['blob_hashes'] = None
+        return (None, state)
+
+def scan_dir(dirpath):
+    """
+    Scans the given `dirpath` using `os.scandir`, returning a tuple containing
+    a list of `os.DirEntry` objects for the files inside, and a list of full
+    paths to the subdirectories inside.  Like `os.walk`, symlinks to dirs are
+    not reported as subdirectories (or files).  Both lists are sorted by
+    name, so that we don't depend on whatever order the filesystem uses.
+    """
+    files = []
+    subdirs = []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                files.append(entry)
+    files.sort(key=lambda entry: entry.name)
+    subdirs.sort()
+    return (files, subdirs)
+
+def walk_dir(top):
+    """
+    A replacement for `os.walk` which is built on `scan_dir`, so that the
+    stat info gathered while scanning can be passed along to `DirInfo`.
+    Yields a tuple of `(dirpath, entries)` for each directory found,
+    top-down, where `entries` is a list of `os.DirEntry` objects for the
+    files in that directory.  Like `os.walk`, unreadable dirs are skipped.
+    """
+    try:
+        (files, subdirs) = scan_dir(top)
+    except OSError:
+        return
+    yield (top, files)
+    for subdir in subdirs:
+        yield from walk_dir(subdir)
+
+def git_output(repo_dir, *args):
+    """
+    Runs the git command specified by `args` inside `repo_dir`, and returns
+    its output.  We use this rather than GitPython to check for mods repo
+    updates, since GitPython is slow to import, and most runs stop right
+    after that check.
+    """
+    result = subprocess.run(['git'] + list(args),
+            cwd=repo_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            )
+    if result.returncode != 0:
+        raise Exception('`git {}` failed in {}: {}'.format(
+            ' '.join(args), repo_dir, result.stderr.strip()))
+    return result.stdout.strip()
+
+def split_nul(stream, chunk_size=65536):
+    """
+    Reads the binary `stream` in chunks, yielding each of the NUL-separated
+    fields found in it as a string.  A trailing NUL doesn't produce a
+    final empty field.
+    """
+    pending = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b'\0')
+        pending = fields.pop()
+        for field in fields:
+            yield field.decode('utf-8', 'surrogateescape')
+    if pending:
+        yield pending.decode('utf-8', 'surrogateescape')
+
+def git_log_mtimes(fields, filenames):
+    """
+    Given an iterable of the NUL-separated `fields` from the output of
+    `git log -z --name-only --format=%x00%ct` (ie: newest commit first),
+    returns a dict mapping each of the given `filenames` to the timestamp
+    of the most recent commit which touched it.  Stops reading once all
+    `filenames` have been found.
+
+    Each commit shows up as an empty field, followed by its timestamp,
+    followed by the files it touched, the first of which gets a newline
+    prepended.  Filenames are never empty, and with `-z` git passes them
+    through without any quoting.
+    """
+    remaining = set(filenames)
+    mtimes = {}
+    cur_time = None
+    expect_time = False
+    first_file = False
+    for field in fields:
+        if field == '':
+            expect_time = True
+        elif expect_time:
+            cur_time = int(field)
+            expect_time = False
+            first_file = True
+        else:
+            if first_file and field.startswith("\n"):
+                field = field[1:]
+            first_file = False
+            if field in remaining:
+                mtimes[field] = cur_time
+                remaining.remove(field)
+                if len(remaining) == 0:
+                    break
+    return mtimes
+
+def intern_str(value):
+    """
+    Interns the given string, so that the many copies of things like author
+    names, category names and game abbreviations which our cached objects
+    hold all end up sharing the same object.  `None` is passed through.
+    """
+    if value is None:
+        return None
+    return sys.intern(value)
+
+def pack_lines(lines):
+    """
+    Packs a list of lines (which can't themselves contain newlines) into
+    a single string, which is much cheaper to keep around than a list of
+    lots of little strings.  An empty list is packed as `None`.
+    """
+    if not lines:
+        return None
+    return "\n".join(lines)
+
+def unpack_lines(packed):
+    """
+    Returns the list of lines stored in a string from `pack_lines`.  For
+    the benefit of older caches, an already-unpacked list is also accepted.
+    """
+    if packed is None:
+        return []
+    if isinstance(packed, list):
+        return packed
+    return packed.split("\n")
+
 class Cacheable(object):
     """
     A class which is intended to be used with our FileCache.  In order to
@@ -157,10 +357,16 @@ class Cacheable(object):
 
     Cacheable objects which do not have a file backend can omit the constructor,
     though you'll have to cope with having a "pretend" mtime with each object.
+
+    If we know the git blob hash of the file an object was loaded from, that'll
+    be stored in `blob_hash`, and will take precedence over the mtime when
+    checking to see if the object is stale.
     """
 
     cache_key = None
 
+    __slots__ = ('mtime', 'status', 'blob_hash')
+
     (S_UNKNOWN,
             S_CACHED,
             S_NEW,
@@ -186,24 +392,22 @@ class Cacheable(object):
         """
         self.mtime = mtime
         self.status = initial_status
+        self.blob_hash = None
 
-    def has_errors(self):
+    def is_dirty(self):
         """
-        Reimplement this in the inheriting class if you want to be able to
-        pretend that the file's mtime is in the past, in the event of
-        errors.
+        Returns whether or not we need to be written back out to our cache.
         """
-        return False
+        return self.status != Cacheable.S_CACHED
 
     def serialize(self):
         """
         Returns a serializable dict describing ourselves
         """
         d = self._serialize()
-        if self.has_errors():
-            d['m'] = 0
-        else:
-            d['m'] = self.mtime
+        d['m'] = self.mtime
+        if self.blob_hash:
+            d['h'] = self.blob_hash
         return d
 
     def _serialize(self): # pragma: nocover
@@ -218,6 +422,7 @@ class Cacheable(object):
         Creates a new ModFile given the specified serialized dict
         """
         obj = cache_class(input_dict['m'], initial_status=Cacheable.S_CACHED)
+        obj.blob_hash = input_dict.get('h')
         obj._unserialize(input_dict)
         return obj
 
@@ -227,6 +432,16 @@ class Cacheable(object):
         """
         raise Exception('Not implemented')
 
+    def inherit(self, previous):
+        """
+        Called by FileCache when we've been reloaded from a file which had
+        changed, and are about to replace `previous` (the object which was
+        loaded from the old version of the file).  Classes which need to
+        know what was there before can override this; by default we don't
+        do anything.
+        """
+        pass
+
 class TemplateMTime(Cacheable):
     """
     Info about a template's mtime, so we can regen if need be.  This is
@@ -245,6 +460,74 @@ class TemplateMTime(Cacheable):
     def _unserialize(self, input_dict):
         pass
 
+class PageHash(Cacheable):
+    """
+    Info about a page we've written out to the wiki: a hash of its
+    contents, plus the size and mtime the file had once we'd written it.
+    So long as the file on disk still has that size and mtime, we know
+    what's in it without having to read it back in.  Pages can also store
+    a `fingerprint` of the data they were rendered from, so that we can
+    tell when they don't need to be rendered at all.
+    """
+
+    cache_key = 'pages'
+
+    def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN,
+            digest=None, size=None, fingerprint=None):
+        super().__init__(mtime, initial_status)
+        self.digest = digest
+        self.size = size
+        self.fingerprint = fingerprint
+
+    @staticmethod
+    def hash_content(content):
+        """
+        Returns the hash we use for the given page `content`
+        """
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_fingerprint(data):
+        """
+        Returns a fingerprint for the given JSON-serializable `data`
+        """
+        return PageHash.hash_content(json.dumps(data))
+
+    def is_current(self, stat):
+        """
+        Returns whether or not the page file described by `stat` is still
+        the one we wrote out.
+        """
+        return self.size == stat.st_size and self.mtime == stat.st_mtime
+
+    def matches(self, digest, stat):
+        """
+        Returns whether or not the page file described by `stat` is known to
+        contain content with the hash `digest`.
+        """
+        return self.digest == digest and self.is_current(stat)
+
+    def set_fingerprint(self, fingerprint):
+        """
+        Sets our fingerprint, updating our status if need be
+        """
+        if fingerprint != self.fingerprint:
+            if self.status != Cacheable.S_NEW:
+                self.status = Cacheable.S_UPDATED
+            self.fingerprint = fingerprint
+
+    def _serialize(self):
+        return {
+                'x': self.digest,
+                's': self.size,
+                'f': self.fingerprint,
+                }
+
+    def _unserialize(self, input_dict):
+        self.digest = input_dict['x']
+        self.size = input_dict['s']
+        self.fingerprint = input_dict.get('f')
+
 class Author(Cacheable):
     """
     Info about a mod author.
@@ -252,25 +535,27 @@ class Author(Cacheable):
 
     cache_key = 'author'
 
+    __slots__ = ('name', 'mods', 'cur_mods')
+
     regular_modlink_re = re.compile('^\[\[(.*?)\|.*\]\].*$')
     html_modlink_re = re.compile('^<a href=.*?>(.*)</a>.*$')
 
     def __init__(self, mtime, initial_status=Cacheable.S_UNKNOWN, name=None):
         super().__init__(mtime, initial_status)
-        self.name = name
+        self.name = intern_str(name)
         self.mods = {}
         self.cur_mods = {}
 
     def _serialize(self):
         return {
                 'n': self.name,
-                'g': dict([(game, list(modset)) for (game, modset) in self.mods.items()]),
+                'g': dict([(game, sorted(modset)) for (game, modset) in self.mods.items()]),
                 }
 
     def _unserialize(self, input_dict):
-        self.name = input_dict['n']
-        for (game, modlist) in input_dict['g'].items():
-            self.mods[game] = set(modlist)
+        self.name = intern_str(input_dict['n'])
+        for (game, modlist) in sorted(input_dict['g'].items()):
+            self.mods[intern_str(game)] = set(modlist)
 
     def add_mod(self, mod):
         if mod.game not in self.cur_mods:
@@ -279,7 +564,9 @@ class Author(Cacheable):
 
     def check_modlist(self):
         if self.cur_mods != self.mods:
-            self.mods = self.cur_mods
+            # Keep our games in a consistent order, regardless of which
+            # order our mods happened to be added in.
+            self.mods = dict(sorted(self.cur_mods.items()))
             self.status = self.S_UPDATED
         return self.status
 
@@ -310,16 +597,18 @@ class Author(Cacheable):
 
     def _sort_modlist_key(self, modlist_link):
         """
-        Key to use when sorting between two different wiki link syntaxes
+        Key to use when sorting between two different wiki link syntaxes.
+        Links which only differ by case get sorted by the link itself, so
+        that we always end up with the same order.
         """
         ml_lower = modlist_link.lower()
         match = Author.regular_modlink_re.match(ml_lower)
         if match:
-            return match.group(1)
+            return (match.group(1), modlist_link)
         match = Author.html_modlink_re.match(ml_lower)
         if match:
-            return match.group(1)
-        return ml_lower
+            return (match.group(1), modlist_link)
+        return (ml_lower, modlist_link)
 
 class ModURL(object):
     """
@@ -333,6 +622,8 @@ class ModURL(object):
     to the right.
     """
 
+    __slots__ = ('text', 'url')
+
     def __init__(self, link_text):
         if '|' in link_text:
             (self.text, self.url) = link_text.split('|', 1)
@@ -369,6 +660,111 @@ class ModURL(object):
             return False
         return self.url == other.url and self.text == other.text
 
+class ModFileReader(object):
+    """
+    A minimal file-like object which reads a mod file lazily, line-by-line,
+    so that we only ever have to read in as much of the file as it takes to
+    find the mod's title and description.  This also takes care of figuring
+    out the file encoding: we start out decoding as utf-8 (so that mods with
+    unicode chars in their category names show up properly), but switch over
+    to latin1 for the rest of the file as soon as we hit a line which isn't
+    valid utf-8 (a number of base Borderlands objects are latin1).
+
+    Line endings are normalized to `\n`, as with files opened in text mode.
+    Only `seek(0)` is supported, which will replay the lines read so far.
+    """
+
+    chunk_size = 65536
+
+    def __init__(self, df):
+        """
+        Initialize given a file object opened in binary mode
+        """
+        self.df = df
+        self.encoding = 'utf-8'
+        self.lines = []
+        self.pos = 0
+        self.pending = b''
+        self.eof = False
+
+    def _decode(self, raw_line):
+        """
+        Decodes a single raw line, using latin1 from here on out if it's
+        not valid utf-8.
+        """
+        if self.encoding == 'utf-8':
+            try:
+                return raw_line.decode('utf-8')
+            except UnicodeDecodeError:
+                self.encoding = 'latin1'
+        return raw_line.decode('latin1')
+
+    def _add_line(self, raw_line):
+        """
+        Normalizes the line ending on the given raw line, decodes it, and
+        adds it to our list of lines.
+        """
+        if raw_line.endswith(b'\r\n'):
+            raw_line = raw_line[:-2] + b'\n'
+        elif raw_line.endswith(b'\r'):
+            raw_line = raw_line[:-1] + b'\n'
+        self.lines.append(self._decode(raw_line))
+
+    def _read_chunk(self):
+        """
+        Reads in another chunk of our file, splitting out any complete lines
+        found.  Returns `False` if there was nothing left to read.
+        """
+        if self.eof:
+            return False
+        chunk = self.df.read(self.chunk_size)
+        if chunk == b'':
+            self.eof = True
+            if self.pending != b'':
+                self._add_line(self.pending)
+                self.pending = b''
+                return True
+            return False
+        raw_lines = (self.pending + chunk).splitlines(keepends=True)
+        # The last line may be incomplete (or be a `\r` whose `\n` is in the
+        # next chunk), so hang on to it until we've read more.
+        if raw_lines[-1].endswith(b'\n'):
+            self.pending = b''
+        else:
+            self.pending = raw_lines.pop()
+        for raw_line in raw_lines:
+            self._add_line(raw_line)
+        return True
+
+    def readline(self):
+        """
+        Returns the next line in the file, or an empty string at EOF
+        """
+        while self.pos >= len(self.lines):
+            if not self._read_chunk():
+                return ''
+        line = self.lines[self.pos]
+        self.pos += 1
+        return line
+
+    def seek(self, offset):
+        """
+        Go back to the beginning of the file.  Only an offset of 0 is supported.
+        """
+        if offset != 0:
+            raise ValueError('ModFileReader can only seek to the beginning of the file')
+        self.pos = 0
+
+    def __iter__(self):
+        """
+        Iterate over the lines in the file
+        """
+        while True:
+            line = self.readline()
+            if line == '':
+                return
+            yield line
+
 class ModFile(Cacheable):
     """
     Class to pull info out of a mod file.
@@ -376,48 +772,76 @@ class ModFile(Cacheable):
 
     cache_key = 'mods'
 
+    # Flags for `changed_fields`, which keeps track of which bits of data
+    # have changed since we were last cached, so that we only have to
+    # regenerate the wiki pages which actually show them.
+    (F_TITLE,
+            F_TITLE_DISPLAY,
+            F_WIKI_FILENAME,
+            F_DESC,
+            F_USE_MOD_DESC,
+            F_README,
+            F_CHANGELOG,
+            F_URLS,
+            F_CATEGORIES,
+            F_RELATED,
+            F_FILE) = [1 << n for n in range(11)]
+    F_ALL = (1 << 11) - 1
+
+    # Fields which show up on our own page (which is all of them)
+    F_MOD_PAGE = F_ALL
+
+    # Fields which show up in category listings (and links from other pages)
+    F_LISTING = F_TITLE_DISPLAY | F_WIKI_FILENAME | F_CATEGORIES
+
+    # We can end up with an awful lot of these in memory at once, so keep
+    # them compact: no per-instance dict, and our descriptions are stored
+    # packed into single strings (see `pack_lines`).
+    __slots__ = ('mod_time', 'mod_title', 'mod_title_display',
+            'wiki_filename_base', '_mod_desc', 'use_mod_desc', 'readme_rel',
+            '_readme_desc', 'nexus_link', 'screenshots', 'youtube_urls',
+            'urls', 'categories', '_changelog', 'related_links', 'game',
+            'seen', 'full_filename', 'rel_path', 'rel_filename', 'mod_author',
+            'changed_fields', 'prev_categories')
+
     def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN, game=None):
         super().__init__(mtime, initial_status)
         self.mod_time = datetime.datetime.fromtimestamp(mtime)
         self.mod_title = None
         self.mod_title_display = None
         self.wiki_filename_base = None
-        self.mod_desc = []
+        self._mod_desc = None
         self.use_mod_desc = True
         self.readme_rel = None
-        self.readme_desc = []
+        self._readme_desc = None
         self.nexus_link = None
         self.screenshots = []
         self.youtube_urls = []
         self.urls = []
         self.categories = set()
-        self.changelog = []
+        self._changelog = None
         self.related_links = []
-        self.re = Re()
-        self.game = game
+        self.game = intern_str(game)
+        self.prev_categories = self.categories
+        if initial_status == Cacheable.S_CACHED:
+            self.changed_fields = 0
+        else:
+            self.changed_fields = ModFile.F_ALL
 
         if dirinfo:
             # This is when we're actually loading from a file
             self.seen = True
             self.full_filename = dirinfo[filename]
-            (self.rel_path, temp_rel_filename) = dirinfo.get_rel_path(filename)
+            (rel_path, temp_rel_filename) = dirinfo.get_rel_path(filename)
+            self.rel_path = intern_str(rel_path)
             self.rel_filename = temp_rel_filename.split(os.path.sep)[-1]
             self.mod_author = dirinfo.dir_author
 
-            # We're going to do a preload here as utf-8 (the default),
-            # to see if we can read it as utf-8.  There are a number of
-            # base Borderlands objects which are latin1, so we can't
-            # use utf-8 for those, but other mod files use unicode chars
-            # in their category names, and I'd like to be able to read
-            # those properly.
-            try:
-                with open(self.full_filename, encoding='utf-8') as df:
-                    df.read()
-                encoding = 'utf-8'
-            except UnicodeDecodeError:
-                encoding = 'latin1'
-
-            with open(self.full_filename, encoding=encoding) as df:
+            # ModFileReader only reads as much of the file as we actually
+            # look at, and takes care of the utf-8/latin1 encoding question
+            # for us.
+            with open(self.full_filename, 'rb') as raw_df:
+                df = ModFileReader(raw_df)
                 first_line = df.readline()
                 if first_line.strip() == '':
                     first_line = df.readline()
@@ -436,9 +860,44 @@ class ModFile(Cacheable):
             self.mod_author = None
 
         # Clean up any empty lines at the end of our comments
-        if len(self.mod_desc) > 0:
-            while self.mod_desc[-1] == '':
-                self.mod_desc.pop()
+        mod_desc = self.mod_desc
+        if len(mod_desc) > 0:
+            while mod_desc[-1] == '':
+                mod_desc.pop()
+            self.mod_desc = mod_desc
+
+    @property
+    def mod_desc(self):
+        """
+        Our in-mod description, as a list of lines
+        """
+        return unpack_lines(self._mod_desc)
+
+    @mod_desc.setter
+    def mod_desc(self, lines):
+        self._mod_desc = pack_lines(lines)
+
+    @property
+    def readme_desc(self):
+        """
+        Our description from the dir's README, as a list of lines
+        """
+        return unpack_lines(self._readme_desc)
+
+    @readme_desc.setter
+    def readme_desc(self, lines):
+        self._readme_desc = pack_lines(lines)
+
+    @property
+    def changelog(self):
+        """
+        Our changelog from the dir's README, as a list of lines
+        """
+        return unpack_lines(self._changelog)
+
+    @changelog.setter
+    def changelog(self, lines):
+        self._changelog = pack_lines(lines)
 
     def _serialize(self):
         """
@@ -449,24 +908,23 @@ class ModFile(Cacheable):
         else:
             nl = None
         return {
-                'ff': self.full_filename,
                 'rp': self.rel_path,
                 'rf': self.rel_filename,
                 'w': self.wiki_filename_base,
                 'a': self.mod_author,
                 't': self.mod_title,
                 'i': self.mod_title_display,
-                'd': self.mod_desc,
+                'd': self._mod_desc,
                 'q': self.use_mod_desc,
-                'r': self.readme_desc,
+                'r': self._readme_desc,
                 'l': self.readme_rel,
-                'o': self.changelog,
-                'e': sorted(self.related_links),
+                'o': self._changelog,
+                'e': self.related_links,
                 'n': nl,
                 's': [str(s) for s in self.screenshots],
                 'y': [str(y) for y in self.youtube_urls],
                 'u': [str(u) for u in self.urls],
-                'c': list(self.categories),
+                'c': sorted(self.categories),
                 'g': self.game,
                 }
 
@@ -474,19 +932,18 @@ class ModFile(Cacheable):
         """
         Populates ourself given the specified serialized dict
         """
-        self.full_filename = input_dict['ff']
-        self.rel_path = input_dict['rp']
+        self.rel_path = intern_str(input_dict['rp'])
         self.rel_filename = input_dict['rf']
         self.wiki_filename_base = input_dict['w']
-        self.mod_author = input_dict['a']
+        self.mod_author = intern_str(input_dict['a'])
         self.mod_title = input_dict['t']
         self.mod_title_display = input_dict['i']
-        self.mod_desc = input_dict['d']
+        self.mod_desc = unpack_lines(input_dict['d'])
         self.use_mod_desc = input_dict['q']
-        self.readme_desc = input_dict['r']
-        self.readme_rel = input_dict['l']
-        self.changelog = input_dict['o']
-        self.related_links = set(input_dict['e'])
+        self.readme_desc = unpack_lines(input_dict['r'])
+        self.readme_rel = intern_str(input_dict['l'])
+        self.changelog = unpack_lines(input_dict['o'])
+        self.related_links = sorted(input_dict['e'])
         if input_dict['n']:
             self.nexus_link = ModURL(input_dict['n'])
         else:
@@ -494,8 +951,45 @@ class ModFile(Cacheable):
         self.screenshots = [ModURL(u) for u in input_dict['s']]
         self.youtube_urls = [ModURL(u) for u in input_dict['y']]
         self.urls = [ModURL(u) for u in input_dict['u']]
-        self.categories = set(input_dict['c'])
-        self.game = input_dict['g']
+        self.categories = set([intern_str(c) for c in input_dict['c']])
+        self.prev_categories = self.categories
+        self.game = intern_str(input_dict['g'])
+
+    def inherit(self, previous):
+        """
+        We've been re-parsed from a changed file, and are replacing `previous`.
+        The parsed data gets compared against the old version, and all the
+        data which gets filled in later by the main App (categories, README
+        info, etc) is copied over, so that the `set_*`/`update_*` calls
+        can figure out whether or not any of it has actually changed.
+        """
+        self.changed_fields = ModFile.F_FILE
+        if self.mod_title != previous.mod_title:
+            self.changed_fields |= ModFile.F_TITLE
+        if self._mod_desc != previous._mod_desc:
+            self.changed_fields |= ModFile.F_DESC
+        self.mod_title_display = previous.mod_title_display
+        self.wiki_filename_base = previous.wiki_filename_base
+        self.use_mod_desc = previous.use_mod_desc
+        self.readme_rel = previous.readme_rel
+        self._readme_desc = previous._readme_desc
+        self._changelog = previous._changelog
+        self.nexus_link = previous.nexus_link
+        self.screenshots = previous.screenshots
+        self.youtube_urls = previous.youtube_urls
+        self.urls = previous.urls
+        self.categories = previous.categories
+        self.prev_categories = previous.categories
+        self.related_links = previous.related_links
+
+    def mark_changed(self, field):
+        """
+        Records that `field` (one of our `F_*` flags) has changed, updating
+        our status if need be.
+        """
+        self.changed_fields |= field
+        if self.status != Cacheable.S_NEW:
+            self.status = Cacheable.S_UPDATED
 
     def get_full_rel_filename(self):
         """
@@ -508,10 +1002,9 @@ class ModFile(Cacheable):
         Sets our categories, updating our status if need be
         """
         self.seen = True
-        new_cats = set(categories)
+        new_cats = set([intern_str(c) for c in categories])
         if new_cats != self.categories:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
+            self.mark_changed(ModFile.F_CATEGORIES)
             self.categories = new_cats
 
     def set_title_display(self, mod_title_display):
@@ -520,8 +1013,7 @@ class ModFile(Cacheable):
         """
         self.seen = True
         if mod_title_display != self.mod_title_display:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
+            self.mark_changed(ModFile.F_TITLE_DISPLAY)
             self.mod_title_display = mod_title_display
 
     def set_wiki_filename_base(self, wiki_filename_base):
@@ -530,22 +1022,29 @@ class ModFile(Cacheable):
         """
         self.seen = True
         if wiki_filename_base != self.wiki_filename_base:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
+            self.mark_changed(ModFile.F_WIKI_FILENAME)
             self.wiki_filename_base = wiki_filename_base
 
     def set_related_links(self, related_mods):
         """
-        Sets our new related links given a set of other mods
+        Sets our new related links given a set of other mods.  The links are
+        kept sorted, so they're always rendered in the same order.
         """
-        new_links = set(
-            ['{}, by {}'.format(m.wiki_link(), m.mod_author) for m in related_mods]
-            )
+        new_links = ModFile.get_related_links(related_mods)
         if new_links != self.related_links:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
+            self.mark_changed(ModFile.F_RELATED)
             self.related_links = new_links
 
+    @staticmethod
+    def get_related_links(related_mods):
+        """
+        Returns the sorted list of related links we'd have, given a set of
+        other mods.
+        """
+        return sorted(set(
+            ['{}, by {}'.format(m.wiki_link(), m.mod_author) for m in related_mods]
+            ))
+
     def set_urls(self, urls):
         """
         Finalize our URLs, which will put them into the appropriate
@@ -567,13 +1066,11 @@ class ModFile(Cacheable):
                 screenshots.append(ModURL(url))
             else:
                 new_urls.append(ModURL(url))
-        if (self.status != Cacheable.S_NEW
-                and (nexus_link != self.nexus_link
-                    or screenshots != self.screenshots
-                    or youtube_urls != self.youtube_urls
-                    or new_urls != self.urls
-                    )):
-            self.status = Cacheable.S_UPDATED
+        if (nexus_link != self.nexus_link
+                or screenshots != self.screenshots
+                or youtube_urls != self.youtube_urls
+                or new_urls != self.urls):
+            self.mark_changed(ModFile.F_URLS)
         self.screenshots = screenshots
         self.nexus_link = nexus_link
         self.youtube_urls = youtube_urls
@@ -586,9 +1083,8 @@ class ModFile(Cacheable):
         update our status to S_UPDATED if need be.
         """
         self.seen = True
-        if (self.status != Cacheable.S_NEW
-                and self.use_mod_desc != use_mod_desc):
-            self.status = Cacheable.S_UPDATED
+        if self.use_mod_desc != use_mod_desc:
+            self.mark_changed(ModFile.F_USE_MOD_DESC)
         self.use_mod_desc = use_mod_desc
 
     def update_readme_desc(self, readme, new_desc):
@@ -600,20 +1096,19 @@ class ModFile(Cacheable):
         else:
             new_readme_rel = None
         self.seen = True
-        if (self.status != Cacheable.S_NEW and
-                (new_desc != self.readme_desc
-                    or new_readme_rel != self.readme_rel)):
-            self.status = Cacheable.S_UPDATED
+        if (new_desc != self.readme_desc
+                or new_readme_rel != self.readme_rel):
+            self.mark_changed(ModFile.F_README)
         self.readme_desc = new_desc
-        self.readme_rel = new_readme_rel
+        self.readme_rel = intern_str(new_readme_rel)
 
     def update_changelog(self, new_changelog):
         """
         Updates our changelog data with the given array
         """
         self.seen = True
-        if self.status != Cacheable.S_NEW and new_changelog != self.changelog:
-            self.status = Cacheable.S_UPDATED
+        if new_changelog != self.changelog:
+            self.mark_changed(ModFile.F_CHANGELOG)
         self.changelog = new_changelog
 
     def load_blcmm(self, df):
@@ -621,26 +1116,27 @@ class ModFile(Cacheable):
         Loads in a BLCMM-formatted file.  The idea is to grab the first category
         name, as the title of the mod, and then the first comment block we find.
         """
+        matcher = Re()
         finding_main_cat = True
         reading_comments = False
         cat_re = re.compile('<category name="(.*?)"(>| MUT=)')
         comment_re = re.compile('<comment>(.*)</comment>')
-        for line in df.readlines():
+        for line in df:
             if finding_main_cat:
-                if self.re.search(cat_re, line):
-                    self.mod_title = self.re.last_match.group(1).strip().replace('\\"', '"')
+                if matcher.search(cat_re, line):
+                    self.mod_title = matcher.last_match.group(1).strip().replace('\\"', '"')
                     finding_main_cat = False
             elif reading_comments:
-                if self.re.search(comment_re, line):
-                    self.add_comment_line(self.re.last_match.group(1))
+                if matcher.search(comment_re, line):
+                    self.add_comment_line(matcher.last_match.group(1))
                 else:
                     # If we got here, we had some comments but found Something Else.
                     # Stop processing at this point
                     return
             else:
-                if self.re.search(comment_re, line):
+                if matcher.search(comment_re, line):
                     reading_comments = True
-                    self.add_comment_line(self.re.last_match.group(1))
+                    self.add_comment_line(matcher.last_match.group(1))
 
     def load_ft(self, df):
         """
@@ -651,24 +1147,25 @@ class ModFile(Cacheable):
         """
         df.seek(0)
         temp_mod_name = os.path.split(self.full_filename)[-1].rsplit('.', 1)[0]
+        matcher = Re()
         finding_main_cat = True
         reading_comments = False
         cat_re = re.compile('#<(.*?)>')
-        for line in df.readlines():
+        for line in df:
             if finding_main_cat:
-                if self.re.search(cat_re, line):
-                    self.mod_title = self.re.last_match.group(1).strip()
+                if matcher.search(cat_re, line):
+                    self.mod_title = matcher.last_match.group(1).strip()
                     if self.mod_title.lower() == 'patch' or self.mod_title.lower() == 'mod':
                         self.mod_title = temp_mod_name
                     finding_main_cat = False
             else:
                 stripped = line.strip()
-                if '#<hotfix>' not in line and self.re.search(cat_re, line):
+                if '#<hotfix>' not in line and matcher.search(cat_re, line):
                     # Unlike the BLCMM processing, at the moment, we're not allowing
                     # comments after nested categories, though we *are* if there's
                     # a "description" folder, since that's a real common way that
                     # FT files get laid out.
-                    if 'description' not in self.re.last_match.group(1).lower():
+                    if 'description' not in matcher.last_match.group(1).lower():
                         return
                 elif stripped.startswith('set '):
                     return
@@ -687,7 +1184,7 @@ class ModFile(Cacheable):
         """
         temp_mod_name = os.path.split(self.full_filename)[-1].rsplit('.', 1)[0]
         df.seek(0)
-        for line in df.readlines():
+        for line in df:
             if line.strip().startswith('set ') or line.strip().startswith('#<'):
                 break
             else:
@@ -713,34 +1210,64 @@ class ModFile(Cacheable):
 
         # Take off any whitespace and comment characters
         line = comment_line.strip("/#\n\r\t ")
+
+        # We work directly on our packed description here, rather than
+        # unpacking and repacking it for every line.
+        desc = self._mod_desc
         
         # Prevent adding an empty line at the beginning
-        if line == '' and len(self.mod_desc) == 0:
+        if line == '' and desc is None:
             return
 
         # Prevent adding more than one empty line in a row
-        if len(self.mod_desc) > 0 and self.mod_desc[-1] == '' and line == '':
+        if desc is not None and desc.rpartition("\n")[2] == '' and line == '':
             return
 
         # Attempt to prevent adding in header ASCII art
-        if len(self.mod_desc) == 0 and line.strip("[]_/\\.:|#~ \t") == '':
+        if desc is None and line.strip("[]_/\\.:|#~ \t") == '':
             return
 
         # Attempt to match on a title, if we can (and return without adding,
         # if that's the case)
-        if not self.mod_title and match_title and len(self.mod_desc) == 0:
+        if not self.mod_title and match_title and desc is None:
+            import Levenshtein
             if Levenshtein.ratio(match_title.lower(), line.lower()) > .8:
                 self.mod_title = line
                 return
 
         # Finally, add it in.
-        self.mod_desc.append(line)
+        if desc is None:
+            self._mod_desc = line
+        else:
+            self._mod_desc = "{}\n{}".format(desc, line)
 
     def __lt__(self, other):
         """
-        Sort by mod title
+        Sort by mod title, falling back to our wiki filename and then our
+        location in the repo for mods which share a title, so that the order
+        doesn't depend on the order in which mods were processed.
         """
-        return self.mod_title.lower() < other.mod_title.lower()
+        return self.sort_key() < other.sort_key()
+
+    def sort_key(self):
+        """
+        Returns the key we sort on
+        """
+        return (self.mod_title.lower(),
+                self.wiki_filename_base or '',
+                self.rel_path or '',
+                self.rel_filename or '')
+
+    def title_letter(self):
+        """
+        Returns the letter we're filed under when a category gets split up
+        alphabetically: the first letter of our title, or `0` if our title
+        doesn't start with a letter.
+        """
+        first = self.sort_key()[0][:1]
+        if 'a' <= first <= 'z':
+            return first.upper()
+        return '0'
 
     def wiki_filename(self):
         global wiki_filename
@@ -812,6 +1339,79 @@ class ModFile(Cacheable):
                 ]
             ])
 
+class ModListing(object):
+    """
+    Stand-in for a cached `ModFile` which hasn't been unserialized, built
+    from its serialized data (see `FileCache.peek()`).  It only knows about
+    the data which shows up in category listings and links from other
+    pages, which is all that incremental runs need for the mods in dirs
+    which haven't changed.  If any of that data does change, the full
+    `ModFile` gets pulled out of the cache and updated too, so that the
+    change gets saved and its page re-rendered.
+    """
+
+    __slots__ = ('mod_cache', 'key', 'mod_title', 'mod_title_display',
+            'wiki_filename_base', 'mod_author', 'game', 'categories',
+            'rel_path', 'rel_filename', 'related_links')
+
+    # We only exist for mods which haven't changed
+    changed_fields = 0
+
+    def __init__(self, mod_cache, key, input_dict):
+        self.mod_cache = mod_cache
+        self.key = key
+        self.rel_path = intern_str(input_dict['rp'])
+        self.rel_filename = input_dict['rf']
+        self.wiki_filename_base = input_dict['w']
+        self.mod_author = intern_str(input_dict['a'])
+        self.mod_title = input_dict['t']
+        self.mod_title_display = input_dict['i']
+        self.related_links = sorted(input_dict['e'])
+        self.categories = set([intern_str(c) for c in input_dict['c']])
+        self.game = intern_str(input_dict['g'])
+
+    def get_mod(self):
+        """
+        Returns the full `ModFile` we're standing in for
+        """
+        mod = self.mod_cache[self.key]
+        mod.seen = True
+        return mod
+
+    def set_title_display(self, mod_title_display):
+        """
+        Sets our display title (for links), updating our `ModFile` if need be
+        """
+        if mod_title_display != self.mod_title_display:
+            self.get_mod().set_title_display(mod_title_display)
+            self.mod_title_display = mod_title_display
+
+    def set_wiki_filename_base(self, wiki_filename_base):
+        """
+        Sets our wiki filename base, updating our `ModFile` if need be
+        """
+        if wiki_filename_base != self.wiki_filename_base:
+            self.get_mod().set_wiki_filename_base(wiki_filename_base)
+            self.wiki_filename_base = wiki_filename_base
+
+    def set_related_links(self, related_mods):
+        """
+        Sets our new related links given a set of other mods, updating our
+        `ModFile` if need be
+        """
+        new_links = ModFile.get_related_links(related_mods)
+        if new_links != self.related_links:
+            self.get_mod().set_related_links(related_mods)
+            self.related_links = new_links
+
+    __lt__ = ModFile.__lt__
+    sort_key = ModFile.sort_key
+    title_letter = ModFile.title_letter
+    get_full_rel_filename = ModFile.get_full_rel_filename
+    wiki_filename = ModFile.wiki_filename
+    wiki_link_html = ModFile.wiki_link_html
+    wiki_link = ModFile.wiki_link
+
 class Readme(Cacheable):
     """
     Class to hold information about README files.  We're mostly just trying
@@ -826,6 +1426,8 @@ class Readme(Cacheable):
         super().__init__(mtime, initial_status)
         self.mapping = {'(default)': []}
         self.first_section = None
+        self.matches = {}
+        self.matches_changed = False
         if filename:
             full_filename = dirinfo[filename]
             self.read_file(full_filename)
@@ -842,45 +1444,99 @@ class Readme(Cacheable):
         for a single mod in the dir.  If False, it is assumed to be in a dir
         containing multiple mods
         """
-        mod_name_lower = mod_name.lower()
-        if single_mod:
-            if 'overview' in self.mapping:
-                return self.mapping['overview']
-            for section in self.mapping.keys():
-                if Levenshtein.ratio(mod_name_lower, section) > .8:
-                    return self.mapping[section]
-            if self.first_section:
-                return self.mapping[self.first_section]
+        return self.find_matching_batch([mod_name], single_mod)[0]
+
+    def find_matching_batch(self, mod_names, single_mod=True):
+        """
+        Finds matching sections in the readme for all of the given
+        `mod_names` at once, returning a list of what `find_matching` would
+        have returned for each of them, in the same order.
+        """
+        if single_mod and 'overview' in self.mapping:
+            return [self.mapping['overview']]*len(mod_names)
+        results = []
+        for section in self.match_sections(mod_names):
+            if section is not None:
+                results.append(self.mapping[section])
+            elif not single_mod:
+                results.append([])
+            elif self.first_section:
+                results.append(self.mapping[self.first_section])
             else:
-                return self.mapping['(default)']
-        else:
-            for section in self.mapping.keys():
+                results.append(self.mapping['(default)'])
+        return results
+
+    def match_sections(self, mod_names):
+        """
+        Returns a list containing the name of the first section in the readme
+        which is similar enough to each of the given `mod_names`, or `None`
+        if no section matches.  A Levenshtein ratio can't be any higher than
+        `2*min(a, b)/(a+b)` for strings of length `a` and `b`, so we only
+        bother comparing against sections whose length is within a matching
+        ratio of the mod name's (ie: between 2/3 and 3/2 of it).
+
+        Matches are remembered in `matches` (and stored in our cache), so
+        the search only happens once for each name until the readme itself
+        changes.
+        """
+        by_length = None
+        matches = []
+        for mod_name in mod_names:
+            mod_name_lower = mod_name.lower()
+            if mod_name_lower in self.matches:
+                matches.append(self.matches[mod_name_lower])
+                continue
+            if by_length is None:
+                by_length = {}
+                for (idx, section) in enumerate(self.mapping.keys()):
+                    by_length.setdefault(len(section), []).append((idx, section))
+            name_len = len(mod_name_lower)
+            candidates = []
+            for section_len in range((2*name_len+2)//3, (3*name_len)//2+1):
+                if section_len in by_length:
+                    candidates.extend(by_length[section_len])
+            import Levenshtein
+            match = None
+            for (idx, section) in sorted(candidates):
                 if Levenshtein.ratio(mod_name_lower, section) > .8:
-                    return self.mapping[section]
-            return []
+                    match = section
+                    break
+            self.matches[mod_name_lower] = match
+            self.matches_changed = True
+            matches.append(match)
+        return matches
 
+    def is_dirty(self):
+        """
+        Returns whether or not we need to be written back out to our cache.
+        Finding new section matches doesn't change our status (the readme
+        itself hasn't changed), but they should still get saved.
+        """
+        return super().is_dirty() or self.matches_changed
 
-    def serialize(self):
+
+    def _serialize(self):
         """
         Returns a serializable dict describing ourselves (since we're
         basically just a glorified dict anyway, this is pretty trivial)
         """
         return {
-                'f': self.filename,
                 'r': self.rel_filename,
-                'm': self.mtime,
                 'd': self.mapping,
                 's': self.first_section,
+                'c': self.matches,
                 }
 
     def _unserialize(self, input_dict):
         """
         Populates ourself given the specified serialized dict
         """
-        self.filename = input_dict['f']
+        self.filename = None
         self.rel_filename = input_dict['r']
         self.mapping = input_dict['d']
         self.first_section = input_dict['s']
+        self.matches = input_dict.get('c', {})
+        self.matches_changed = False
 
     def read_file(self, filename):
         """
@@ -946,67 +1602,554 @@ class Readme(Cacheable):
                     self.mapping[cur_section].append(line)
             prev_line = line
 
-        # Get rid of any trailing empty lines in each section
-        for (section, data) in self.mapping.items():
-            while len(data) > 0 and data[-1] == '':
-                data.pop()
+        # Get rid of any trailing empty lines in each section
+        for (section, data) in self.mapping.items():
+            while len(data) > 0 and data[-1] == '':
+                data.pop()
+
+def load_cacheable(args):
+    """
+    Constructs a single `Cacheable` object from a tuple of
+    `(cache_class, mtime, dirinfo, filename, initial_status, extra)`.  This
+    lives out here, rather than inside `FileCache`, so that it can be
+    handed off to a worker process by `FileCache.load_many()`.
+    """
+    (cache_class, mtime, dirinfo, filename, initial_status, extra) = args
+    return cache_class(mtime, dirinfo, filename, initial_status, **extra)
+
+# The Jinja environment and shared template context used by `render_page`.
+# These are set up once in each worker process by `init_render_worker`.
+render_env = None
+render_shared_context = None
+
+def new_template_env(template_dir, bytecode_dir=None):
+    """
+    Returns a new Jinja environment for the templates in `template_dir`.
+    Templates are only loaded as they're asked for.  If `bytecode_dir` is
+    specified, compiled templates will be cached in there, so that they
+    only need to be compiled again when they change.
+    """
+    import jinja2
+    bytecode_cache = None
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_dir)
+    # Templates aren't going to change out from under us in the middle of
+    # a run, so don't bother checking their mtimes on every use.
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(template_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False)
+
+def init_render_worker(template_dir, shared_context, bytecode_dir=None):
+    """
+    Sets up a worker process to render pages with `render_page`.  Templates
+    are loaded from `template_dir` (using the bytecode cache in `bytecode_dir`,
+    if given), and `shared_context` is a dict of template variables which
+    every page gets, so that they only have to be sent over to each worker
+    once.
+    """
+    global render_env
+    global render_shared_context
+    render_env = new_template_env(template_dir, bytecode_dir)
+    render_shared_context = shared_context
+
+def render_page(args):
+    """
+    Renders a single page from a tuple of `(template_name, context)`, in a
+    worker process set up by `init_render_worker`.  This lives out here, so
+    that it can be handed off to a worker process by `App.render_pages()`.
+    """
+    (template_name, context) = args
+    full_context = dict(render_shared_context)
+    full_context.update(context)
+    return render_env.get_template(template_name).render(full_context)
+
+class CacheCodec(object):
+    """
+    Base class for the codecs which `FileCache` can use to store its data on
+    disk.  Apart from LZMA-compressed JSON (which is what all our caches used
+    to be hardcoded to use, and which remains our default), every codec writes
+    out a short header line identifying itself, so that caches can be read
+    in regardless of which codec they were written with.  Implementing
+    classes need to define `name` and implement `encode` and `decode`.
+    """
+
+    name = None
+    default_level = None
+    header_prefix = b'CSCACHE '
+
+    def __init__(self, level=None):
+        """
+        Initialize with the given compression `level`, if the codec
+        supports it.  `None` will use the codec's default.
+        """
+        if level is None:
+            level = self.default_level
+        self.level = level
+
+    def header(self):
+        """
+        Returns the header line which identifies this codec
+        """
+        return self.header_prefix + self.name.encode('ascii') + b'\n'
+
+    def write(self, filename, data):
+        """
+        Writes the given `data` out to `filename`
+        """
+        with open(filename, 'wb') as df:
+            df.write(self.header())
+            df.write(self.encode(data))
+
+    def encode(self, data): # pragma: nocover
+        """
+        Returns a bytestring encoding the given `data`
+        """
+        raise Exception('Not implemented')
+
+    def decode(self, raw): # pragma: nocover
+        """
+        Returns the data encoded in the bytestring `raw`
+        """
+        raise Exception('Not implemented')
+
+    @staticmethod
+    def read(filename):
+        """
+        Reads in and returns the data stored in `filename`, figuring out
+        which codec to use along the way.
+        """
+        with open(filename, 'rb') as df:
+            raw = df.read()
+        if raw.startswith(LZMACodec.magic):
+            return LZMACodec().decode(raw)
+        if raw.startswith(CacheCodec.header_prefix):
+            (header, raw) = raw.split(b'\n', 1)
+            name = header[len(CacheCodec.header_prefix):].decode('ascii')
+            if name in CACHE_CODECS:
+                return CACHE_CODECS[name]().decode(raw)
+        raise Exception('{} is not a cache file which we know how to read'.format(filename))
+
+class LZMACodec(CacheCodec):
+    """
+    LZMA-compressed JSON.  This is written without a header, so that it
+    remains compatible with our original cache format.  `level` is the
+    LZMA preset to use.
+    """
+
+    name = 'lzma'
+    magic = b'\xfd7zXZ\x00'
+
+    def header(self):
+        return b''
+
+    def encode(self, data):
+        import lzma
+        return lzma.compress(json.dumps(data).encode('utf-8'), preset=self.level)
+
+    def decode(self, raw):
+        import lzma
+        return json.loads(lzma.decompress(raw).decode('utf-8'))
+
+class ZlibCodec(CacheCodec):
+    """
+    zlib-compressed JSON
+    """
+
+    name = 'zlib'
+    default_level = 6
+
+    def encode(self, data):
+        import zlib
+        return zlib.compress(json.dumps(data).encode('utf-8'), self.level)
+
+    def decode(self, raw):
+        import zlib
+        return json.loads(zlib.decompress(raw).decode('utf-8'))
+
+class GzipCodec(CacheCodec):
+    """
+    gzip-compressed JSON
+    """
+
+    name = 'gzip'
+    default_level = 6
+
+    def encode(self, data):
+        import gzip
+        return gzip.compress(json.dumps(data).encode('utf-8'), compresslevel=self.level)
+
+    def decode(self, raw):
+        import gzip
+        return json.loads(gzip.decompress(raw).decode('utf-8'))
+
+class JSONCodec(CacheCodec):
+    """
+    Uncompressed JSON
+    """
+
+    name = 'none'
+
+    def encode(self, data):
+        return json.dumps(data).encode('utf-8')
+
+    def decode(self, raw):
+        return json.loads(raw.decode('utf-8'))
+
+class MarshalCodec(CacheCodec):
+    """
+    Python's internal `marshal` format.  Very fast, but not guaranteed to
+    be readable by different Python versions, so a Python upgrade may
+    require running once with `-x/--ignore-cache`.
+    """
+
+    name = 'marshal'
+
+    def encode(self, data):
+        import marshal
+        return marshal.dumps(data)
+
+    def decode(self, raw):
+        import marshal
+        return marshal.loads(raw)
+
+class PickleCodec(CacheCodec):
+    """
+    Python pickles.  Only use this if you trust everything which can write
+    to the cache dir, since loading a pickle can execute arbitrary code.
+    """
+
+    name = 'pickle'
+
+    def encode(self, data):
+        import pickle
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, raw):
+        import pickle
+        return pickle.loads(raw)
+
+CACHE_CODECS = dict([(codec.name, codec) for codec in [
+    LZMACodec,
+    ZlibCodec,
+    GzipCodec,
+    JSONCodec,
+    MarshalCodec,
+    PickleCodec,
+    ]])
+
+class LazyMapping(collections.abc.MutableMapping):
+    """
+    Dict-like object used by `FileCache` to hold its entries.  Entries read
+    in from a cache are kept in their serialized form until they're actually
+    asked for, at which point they're unserialized into full `Cacheable`
+    objects.  Iterating over values or items will unserialize everything
+    along the way, but `peek()` can be used to look at an entry's serialized
+    data without doing so.  `changed` will be set to `True` whenever an
+    entry is set or deleted.
+    """
+
+    def __init__(self, cache_class, raw=None):
+        """
+        Initialize with the given `cache_class`, and an optional dict `raw`
+        of serialized entries, keyed by filename.
+        """
+        self.cache_class = cache_class
+        self.entries = {}
+        self.raw_keys = set()
+        self.changed = False
+        if raw:
+            self.entries.update(raw)
+            self.raw_keys.update(raw.keys())
+
+    def _fetch(self, key):
+        """
+        Returns the entry at `key`, which may still be in serialized form.
+        Raises `KeyError` if it doesn't exist.
+        """
+        return self.entries[key]
+
+    def peek(self, key):
+        """
+        Returns the serialized data for the entry at `key`, without
+        unserializing it if we haven't already done so.
+        """
+        value = self._fetch(key)
+        if key in self.raw_keys:
+            return value
+        return value.serialize()
+
+    def materialized_items(self):
+        """
+        Returns a list of `(key, obj)` tuples for every entry which has
+        been unserialized (or set directly).
+        """
+        return [(key, value) for (key, value) in self.entries.items() if key not in self.raw_keys]
+
+    def serialized_items(self):
+        """
+        Returns a list of `(key, data)` tuples with the serialized data for
+        every entry.  Entries which were never unserialized are passed
+        through as-is.
+        """
+        return [(key, self.peek(key)) for key in self]
+
+    def __getitem__(self, key):
+        value = self._fetch(key)
+        if key in self.raw_keys:
+            value = self.cache_class.unserialize(self.cache_class, value)
+            self.entries[key] = value
+            self.raw_keys.discard(key)
+        return value
+
+    def __contains__(self, key):
+        try:
+            self._fetch(key)
+            return True
+        except KeyError:
+            return False
+
+    def __setitem__(self, key, value):
+        self.entries[key] = value
+        self.raw_keys.discard(key)
+        self.changed = True
+
+    def __delitem__(self, key):
+        del self.entries[key]
+        self.raw_keys.discard(key)
+        self.changed = True
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
 
 class FileCache(object):
     """
     Base caching class which we'll use for both mod files and READMEs.
     This can be used as a pure-data caching class by avoiding the use
     of the `load()` method.
+
+    Entries loaded from files are keyed by their path relative to the
+    repo dir, so that caches remain valid if the repo checkout moves.
+    (Version 1 caches were keyed by absolute path.)
     """
 
-    cache_version = 1
+    cache_version = 2
 
-    def __init__(self, cache_class, filename, do_load=True):
+    def __init__(self, cache_class, filename, do_load=True, codec=None, repo_dir=None):
         """
         Initialize a FileCache using the given `cache_class` and `filename`.
         `cache_class` should be a `Cacheable` object, or at least one which
         pretends to be.  If `do_load` is `False`, we will not actually
         attempt to read anything from the cache, instead pretending that
-        we have a totally clean slate.
+        we have a totally clean slate.  `codec` is the `CacheCodec` to use
+        when saving (defaulting to LZMA); caches written by any codec can
+        be read in.  `repo_dir`, if passed in, is used to migrate older
+        caches which were keyed by absolute path.
         """
         self.cache_class = cache_class
         self.filename = filename
-        self.mapping = {}
+        if codec is None:
+            codec = LZMACodec()
+        self.codec = codec
+        self.mapping = LazyMapping(self.cache_class)
+        # If there's no cache on disk yet, make sure we write one out
+        self.mapping.changed = True
         if do_load and os.path.exists(filename):
-            with lzma.open(filename, 'rt', encoding='utf-8') as df:
-                serialized_dict = json.load(df)
-                if serialized_dict['version'] > self.cache_version:
-                    raise Exception('{} is a version {} cache.  We only support up to version {}'.format(
-                        filename, serialized_dict['version'], self.cache_version,
-                        ))
-                for (inner_filename, inner_dict) in serialized_dict[self.cache_class.cache_key].items():
-                    self.mapping[inner_filename] = self.cache_class.unserialize(self.cache_class, inner_dict)
+            serialized_dict = CacheCodec.read(filename)
+            if serialized_dict['version'] > self.cache_version:
+                raise Exception('{} is a version {} cache.  We only support up to version {}'.format(
+                    filename, serialized_dict['version'], self.cache_version,
+                    ))
+            entries = serialized_dict[self.cache_class.cache_key]
+            if serialized_dict['version'] < 2 and repo_dir is not None:
+                entries = dict([(self.migrate_key(key, repo_dir), value) for (key, value) in entries.items()])
+            # Entries are only unserialized once they're asked for
+            self.mapping = LazyMapping(self.cache_class, entries)
+            if serialized_dict['version'] < self.cache_version:
+                self.mapping.changed = True
+
+    @staticmethod
+    def migrate_key(key, repo_dir):
+        """
+        Converts a version 1 cache `key`, which may be an absolute path
+        inside `repo_dir`, to a path relative to `repo_dir`.  Keys which
+        aren't inside `repo_dir` are left alone.
+        """
+        prefix = os.path.join(repo_dir, '')
+        if key.startswith(prefix):
+            return key[len(prefix):]
+        return key
+
+    @staticmethod
+    def get_key(dirinfo, filename):
+        """
+        Returns the key we use to store `filename` (inside `dirinfo`): its
+        path relative to the repo dir.
+        """
+        return dirinfo.get_rel_path(filename)[1]
+
+    def is_dirty(self):
+        """
+        Returns whether or not anything in the cache has changed since we
+        were loaded (or last saved), meaning that we need to be saved.
+        Entries which were never unserialized can't have changed.
+        """
+        if self.mapping.changed:
+            return True
+        for (key, obj) in self.mapping.materialized_items():
+            if obj.is_dirty():
+                return True
+        return False
 
     def save(self):
         """
-        Saves ourself
+        Saves ourself, if anything has changed.  The cache is written to a
+        temporary file first and then renamed into place, so an interrupted
+        save can't leave a truncated cache behind.
         """
+        if not self.is_dirty():
+            return
         save_dict = {'version': self.cache_version, self.cache_class.cache_key: {}}
-        for mod_filename, mod in self.mapping.items():
-            save_dict[self.cache_class.cache_key][mod_filename] = mod.serialize()
-        with lzma.open(self.filename, 'wt', encoding='utf-8') as df:
-            json.dump(save_dict, df)
+        for mod_filename, mod_dict in sorted(self.mapping.serialized_items()):
+            save_dict[self.cache_class.cache_key][mod_filename] = mod_dict
+        temp_filename = '{}.tmp'.format(self.filename)
+        try:
+            self.codec.write(temp_filename, save_dict)
+            os.replace(temp_filename, self.filename)
+        except:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+            raise
+        self.mapping.changed = False
+
+    def check(self, dirinfo, filename, mtime=None):
+        """
+        Checks to see if we have an up-to-date cached entry for the given
+        `filename` (using `dirinfo` as its base).  Returns a tuple of
+        `(cached, initial_status, mtime, blob_hash)`.  `cached` will be the
+        cached object if it's still current, or `None` if the file needs to
+        be loaded, in which case `initial_status` will be the status to give
+        the newly-loaded object.  See `load()` for details on how staleness
+        is determined.
+        """
+        key = self.get_key(dirinfo, filename)
+        blob_hash = dirinfo.get_hash(filename)
+        if key in self.mapping:
+            cached = self.mapping[key]
+            if blob_hash and cached.blob_hash:
+                if blob_hash == cached.blob_hash:
+                    return (cached, None, mtime, blob_hash)
+            else:
+                if mtime is None:
+                    mtime = dirinfo.get_mtime(filename)
+                if mtime == cached.mtime:
+                    if blob_hash and blob_hash != cached.blob_hash:
+                        cached.blob_hash = blob_hash
+                        self.mark_dirty(key)
+                    return (cached, None, mtime, blob_hash)
+            initial_status = Cacheable.S_UPDATED
+        else:
+            initial_status = Cacheable.S_NEW
+        if mtime is None:
+            mtime = dirinfo.get_mtime(filename)
+        return (None, initial_status, mtime, blob_hash)
+
+    def mark_dirty(self, key):
+        """
+        Flags the entry at `key` as needing to be written out on our next
+        `save()`, even though its status hasn't changed.
+        """
+        self.mapping.changed = True
 
-    def load(self, dirinfo, filename, **extra):
+    def peek(self, key):
+        """
+        Returns the serialized data for the entry at `key`, without having
+        to unserialize the full object if it hasn't been already.
+        """
+        return self.mapping.peek(key)
+
+    def is_loaded(self, key):
+        """
+        Returns whether or not the entry at `key` has been unserialized (or
+        was stored directly).
+        """
+        return key in self.mapping and key not in self.mapping.raw_keys
+
+    def loaded_items(self):
+        """
+        Returns a list of `(key, obj)` tuples for every entry which has
+        been unserialized (or was stored directly).
+        """
+        return self.mapping.materialized_items()
+
+    def store(self, key, obj):
+        """
+        Stores a freshly-loaded `obj` at `key`.  If it's replacing an older
+        version of the same file, the new object gets a chance to compare
+        itself against the old one (see `Cacheable.inherit`).
+        """
+        if obj.status == Cacheable.S_UPDATED and key in self.mapping:
+            obj.inherit(self.mapping[key])
+        self.mapping[key] = obj
+
+    def load(self, dirinfo, filename, mtime=None, **extra):
         """
         Loads an entry from the given `filename` (using `dirinfo` as its base),
         if its mtime has been changed or was not previously known.  Otherwise
-        return our previously-cached version.  Extra dict arguments, if specified,
+        return our previously-cached version.  If `mtime` is not passed in,
+        it will be looked up via `dirinfo`.  If `dirinfo` knows the file's
+        git blob hash and so does our cached version, the hashes will be
+        compared instead of mtimes.  Extra dict arguments, if specified,
         will be passed in to the constructor.
         """
-        full_filename = dirinfo[filename]
-        mtime = os.stat(full_filename).st_mtime
-        if full_filename not in self.mapping or mtime != self.mapping[full_filename].mtime:
-            if full_filename not in self.mapping:
-                initial_status = Cacheable.S_NEW
-            else:
-                initial_status = Cacheable.S_UPDATED
-            self.mapping[full_filename] = self.cache_class(mtime, dirinfo, filename, initial_status, **extra)
-        return self.mapping[full_filename]
+        (cached, initial_status, mtime, blob_hash) = self.check(dirinfo, filename, mtime)
+        if cached is not None:
+            return cached
+        obj = self.cache_class(mtime, dirinfo, filename, initial_status, **extra)
+        obj.blob_hash = blob_hash
+        self.store(self.get_key(dirinfo, filename), obj)
+        return obj
+
+    def load_many(self, to_load, workers=1, min_parallel=16):
+        """
+        Loads a whole batch of entries at once.  `to_load` should be a list
+        of `(dirinfo, filename, extra)` tuples, where `extra` is a dict of
+        extra arguments to pass to the constructor, as with `load()`.  Any
+        entries which need to be (re)loaded will be parsed in a pool of
+        `workers` processes, so long as there are at least `min_parallel`
+        of them -- otherwise they're just loaded here, since spinning up
+        the pool would cost more than it saves.  Results are stored in the
+        order in which they were passed in, regardless of which worker
+        finishes first.  Returns a list of the loaded (or cached) objects.
+        """
+        results = []
+        jobs = []
+        for (dirinfo, filename, extra) in to_load:
+            (cached, initial_status, mtime, blob_hash) = self.check(dirinfo, filename)
+            if cached is None:
+                jobs.append((len(results), dirinfo, filename, initial_status, mtime, blob_hash, extra))
+            results.append(cached)
+
+        if workers > 1 and len(jobs) >= min_parallel:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(load_cacheable,
+                    [(self.cache_class, mtime, dirinfo, filename, initial_status, extra)
+                        for (idx, dirinfo, filename, initial_status, mtime, blob_hash, extra) in jobs],
+                    chunksize=max(1, len(jobs) // (workers*4)),
+                    ))
+        else:
+            loaded = [load_cacheable((self.cache_class, mtime, dirinfo, filename, initial_status, extra))
+                    for (idx, dirinfo, filename, initial_status, mtime, blob_hash, extra) in jobs]
+
+        for ((idx, dirinfo, filename, initial_status, mtime, blob_hash, extra), obj) in zip(jobs, loaded):
+            obj.blob_hash = blob_hash
+            self.store(self.get_key(dirinfo, filename), obj)
+            results[idx] = obj
+
+        return results
 
     def items(self):
         """
@@ -1056,6 +2199,158 @@ class FileCache(object):
         """
         return len(self.mapping)
 
+class SQLiteMapping(LazyMapping):
+    """
+    Dict-like object used by `SQLiteFileCache` to hold its entries.  Entries
+    are only read in from the database when they're actually asked for (and,
+    as with `LazyMapping`, only unserialized when they need to be), though
+    iterating over the mapping will necessarily read in everything.  We keep
+    track of which keys have been explicitly set or deleted, so that
+    `SQLiteFileCache.save()` knows what it needs to write out.
+    """
+
+    def __init__(self, conn, cache_class, do_load=True):
+        super().__init__(cache_class)
+        self.conn = conn
+        self.dirty = set()
+        self.deleted = set()
+        self.fully_loaded = not do_load
+
+    def _fetch(self, key):
+        """
+        Returns the entry at `key`, reading it in from the database if we
+        haven't done so already.  Raises `KeyError` if it doesn't exist.
+        """
+        if key in self.entries:
+            return self.entries[key]
+        if self.fully_loaded or key in self.deleted:
+            raise KeyError(key)
+        row = self.conn.execute('select data from entries where cache_key=? and filename=?',
+                (self.cache_class.cache_key, key)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        self.entries[key] = json.loads(row[0])
+        self.raw_keys.add(key)
+        return self.entries[key]
+
+    def _db_keys(self):
+        """
+        Returns a set of all the keys currently stored in the database
+        """
+        return set([row[0] for row in self.conn.execute(
+            'select filename from entries where cache_key=?',
+            (self.cache_class.cache_key,))])
+
+    def load_all(self):
+        """
+        Reads in every entry from the database which we haven't already
+        read (or deleted).
+        """
+        if self.fully_loaded:
+            return
+        for (key, data) in self.conn.execute('select filename, data from entries where cache_key=?',
+                (self.cache_class.cache_key,)):
+            if key not in self.entries and key not in self.deleted:
+                self.entries[key] = json.loads(data)
+                self.raw_keys.add(key)
+        self.fully_loaded = True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+        self.deleted.discard(key)
+
+    def __delitem__(self, key):
+        self._fetch(key)
+        super().__delitem__(key)
+        self.dirty.discard(key)
+        self.deleted.add(key)
+
+    def __iter__(self):
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self):
+        if self.fully_loaded:
+            return len(self.entries)
+        return len((self._db_keys() - self.deleted) | self.entries.keys())
+
+class SQLiteFileCache(FileCache):
+    """
+    A FileCache which stores its entries in a SQLite database, with one
+    row per entry, rather than as a single compressed JSON document.
+    Entries are only read in from the database as they're needed, and
+    `save()` only writes out entries which are new or have been updated,
+    so both loading and saving scale with the amount of change rather
+    than with the size of the cache.  Rows are keyed on the cache class's
+    `cache_key` as well as the filename, so all our caches can share the
+    same database file.
+    """
+
+    def __init__(self, cache_class, filename, do_load=True, repo_dir=None):
+        """
+        Initialize a SQLiteFileCache using the given `cache_class`, stored
+        in the database at `filename`.  If `do_load` is `False`, we will
+        ignore anything currently in the database for this cache, and the
+        database will be cleared out for this cache when we're saved.
+        `repo_dir`, if passed in, is used to migrate older caches which
+        were keyed by absolute path.
+        """
+        self.cache_class = cache_class
+        self.filename = filename
+        self.do_load = do_load
+        import sqlite3
+        self.conn = sqlite3.connect(filename, timeout=60, check_same_thread=False)
+        with self.conn:
+            self.conn.execute('create table if not exists meta (cache_key text primary key, version integer)')
+            self.conn.execute('create table if not exists entries (cache_key text, filename text, data text, primary key (cache_key, filename))')
+        if do_load:
+            row = self.conn.execute('select version from meta where cache_key=?',
+                    (self.cache_class.cache_key,)).fetchone()
+            if row is not None and row[0] > self.cache_version:
+                raise Exception('{} is a version {} cache.  We only support up to version {}'.format(
+                    filename, row[0], self.cache_version,
+                    ))
+            if row is not None and row[0] < 2 and repo_dir is not None:
+                prefix = os.path.join(repo_dir, '')
+                with self.conn:
+                    self.conn.execute('update or replace entries set filename=substr(filename, ?) where cache_key=? and substr(filename, 1, ?)=?',
+                            (len(prefix)+1, self.cache_class.cache_key, len(prefix), prefix))
+                    self.conn.execute('update meta set version=? where cache_key=?',
+                            (self.cache_version, self.cache_class.cache_key))
+        self.mapping = SQLiteMapping(self.conn, self.cache_class, do_load)
+
+    def save(self):
+        """
+        Saves ourself.  Only entries which are dirty, or have been
+        explicitly set, will be written.  Entries which were never
+        unserialized can't have changed, so they're skipped entirely.
+        """
+        cache_key = self.cache_class.cache_key
+        to_write = []
+        for (key, obj) in self.mapping.materialized_items():
+            if not self.do_load or key in self.mapping.dirty or obj.is_dirty():
+                to_write.append((cache_key, key, json.dumps(obj.serialize())))
+        with self.conn:
+            if not self.do_load:
+                self.conn.execute('delete from entries where cache_key=?', (cache_key,))
+            self.conn.execute('insert or replace into meta (cache_key, version) values (?, ?)',
+                    (cache_key, self.cache_version))
+            self.conn.executemany('delete from entries where cache_key=? and filename=?',
+                    [(cache_key, key) for key in self.mapping.deleted])
+            self.conn.executemany('insert or replace into entries (cache_key, filename, data) values (?, ?, ?)',
+                    to_write)
+        self.mapping.dirty.clear()
+        self.mapping.deleted.clear()
+        self.do_load = True
+
+    def mark_dirty(self, key):
+        """
+        Flags the entry at `key` as needing to be written out on our next
+        `save()`, even though its status hasn't changed.
+        """
+        self.mapping.dirty.add(key)
+
 class CabinetModInfo(object):
     """
     A little class to hold info about a single mod definition inside
@@ -1064,9 +2359,11 @@ class CabinetModInfo(object):
     the 'urls' array
     """
 
+    __slots__ = ('filename', 'categories', 'urls', 'use_in_mod_desc')
+
     def __init__(self, filename, categories):
         self.filename = filename
-        self.categories = categories
+        self.categories = [intern_str(c) for c in categories]
         self.urls = []
         self.use_in_mod_desc = True
     
@@ -1089,13 +2386,29 @@ class CabinetModInfo(object):
         Unserialize ourselves from an input dictionary
         """
         self.filename = input_dict['f']
-        self.categories = input_dict['c']
+        self.categories = [intern_str(c) for c in input_dict['c']]
         self.urls = input_dict['u']
         if 'd' in input_dict:
             self.use_in_mod_desc = input_dict['d']
         else:
             self.use_in_mod_desc = True
 
+class CabinetInfoError(collections.namedtuple('CabinetInfoError', ['level', 'message'])):
+    """
+    A single problem found while processing a `cabinet.info` file.  `level`
+    will be either `ERROR` or `WARNING`.  These get stored alongside the
+    `CabinetInfo` in our cache, so that they can be reported on every run
+    without having to re-parse the file.
+    """
+
+    __slots__ = ()
+
+    def report(self):
+        """
+        Returns the string we report to the user for this error
+        """
+        return '{}: {}'.format(self.level, self.message)
+
 class CabinetInfo(Cacheable):
     """
     Simple little class to read in and parse our `cabinet.info` files
@@ -1125,7 +2438,8 @@ class CabinetInfo(Cacheable):
         self.valid_categories = None
         self.mods = {}
         self.single_mod = False
-        self.errors = False
+        self.parse_errors = []
+        self.dir_errors = []
         if rel_filename:
             full_filename = dirinfo[filename]
             self.load_from_filename(full_filename, rel_filename, error_list, valid_categories)
@@ -1134,7 +2448,44 @@ class CabinetInfo(Cacheable):
         """
         Return whether or not we have errors
         """
-        return self.errors
+        return len(self.parse_errors) > 0 or len(self.dir_errors) > 0
+
+    def add_error(self, level, message):
+        """
+        Records an error found while parsing our file, and reports it to
+        our error list, if we have one.
+        """
+        error = CabinetInfoError(level, message)
+        self.parse_errors.append(error)
+        if self.error_list is not None:
+            self.error_list.append(error.report())
+
+    def set_dir_errors(self, dir_errors):
+        """
+        Sets the list of errors found in our directory which aren't
+        directly related to the contents of our file (such as mod files
+        which don't exist), updating our status if need be.
+        """
+        if dir_errors != self.dir_errors:
+            if self.status != Cacheable.S_NEW:
+                self.status = Cacheable.S_UPDATED
+            self.dir_errors = dir_errors
+
+    def error_reports(self):
+        """
+        Returns a list of all our errors, as they should be reported
+        to the user.
+        """
+        return [e.report() for e in self.parse_errors + self.dir_errors]
+
+    @staticmethod
+    def serialized_error_reports(input_dict):
+        """
+        Returns a list of all the errors stored in the serialized dict
+        `input_dict`, as they should be reported to the user, without
+        having to unserialize the whole object.
+        """
+        return [CabinetInfoError(*e).report() for e in input_dict.get('e', []) + input_dict.get('x', [])]
 
     def _serialize(self):
         """
@@ -1144,6 +2495,8 @@ class CabinetInfo(Cacheable):
                 'r': self.rel_filename,
                 's': self.single_mod,
                 'o': dict([(k, v.serialize()) for k, v in self.mods.items()]),
+                'e': [list(e) for e in self.parse_errors],
+                'x': [list(e) for e in self.dir_errors],
                 }
 
     def _unserialize(self, input_dict):
@@ -1161,6 +2514,8 @@ class CabinetInfo(Cacheable):
                 k = None
             self.mods[k] = CabinetModInfo(None, [])
             self.mods[k].unserialize(mod_dict)
+        self.parse_errors = [CabinetInfoError(*e) for e in input_dict.get('e', [])]
+        self.dir_errors = [CabinetInfoError(*e) for e in input_dict.get('x', [])]
 
     def load_from_filename(self, filename, rel_filename, error_list, valid_categories):
         """
@@ -1181,6 +2536,7 @@ class CabinetInfo(Cacheable):
         self.rel_filename = rel_filename
         self.error_list = error_list
         self.valid_categories = valid_categories
+        self.parse_errors = []
 
         # Now read cabinet.info to find mod files
         for line in df.readlines():
@@ -1190,8 +2546,7 @@ class CabinetInfo(Cacheable):
                 if prev_modfile in self.mods:
                     self.mods[prev_modfile].add_url(line.strip())
                 else:
-                    self.errors = True
-                    self.error_list.append('ERROR: Did not find previous modfile but got URL, in `{}`'.format(
+                    self.add_error('ERROR', 'Did not find previous modfile but got URL, in `{}`'.format(
                         self.rel_filename))
             elif line.startswith('@'):
                 directive = line.strip()[1:]
@@ -1199,22 +2554,19 @@ class CabinetInfo(Cacheable):
                     if directive == 'no-mod-comments':
                         self.mods[prev_modfile].use_in_mod_desc = False
                     else:
-                        self.errors = True
-                        self.error_list.append('ERROR: Unknown directive `{}`, in `{}`'.format(
+                        self.add_error('ERROR', 'Unknown directive `{}`, in `{}`'.format(
                             directive,
                             self.rel_filename,
                             ))
                 else:
-                    self.errors = True
-                    self.error_list.append('ERROR: Did not find the previous modfile but got directive `{}`, in `{}`'.format(
+                    self.add_error('ERROR', 'Did not find the previous modfile but got directive `{}`, in `{}`'.format(
                         directive,
                         self.rel_filename,
                         ))
             else:
                 if ': ' in line:
                     if self.single_mod:
-                        self.errors = True
-                        self.error_list.append('ERROR: Unknown line "{}" found in single-mod info file `{}`'.format(
+                        self.add_error('ERROR', 'Unknown line "{}" found in single-mod info file `{}`'.format(
                             line.strip(), self.rel_filename))
                     else:
                         if line[0] == '\\':
@@ -1224,8 +2576,7 @@ class CabinetInfo(Cacheable):
                             prev_modfile = mod_filename
                 else:
                     if len(self.mods) > 0:
-                        self.errors = True
-                        self.error_list.append('ERROR: Unknown line "{}" inside `{}`'.format(
+                        self.add_error('ERROR', 'Unknown line "{}" inside `{}`'.format(
                             line.strip(), self.rel_filename))
                     else:
                         self.single_mod = True
@@ -1241,8 +2592,7 @@ class CabinetInfo(Cacheable):
 
         # First check to make sure we don't already have this mod
         if mod_name in self.mods:
-            self.errors = True
-            self.error_list.append('ERROR: {} specified twice inside `{}`'.format(
+            self.add_error('ERROR', '{} specified twice inside `{}`'.format(
                 mod_name, self.rel_filename))
             return False
 
@@ -1253,8 +2603,7 @@ class CabinetInfo(Cacheable):
             if cat in self.valid_categories:
                 real_cats.append(cat)
             else:
-                self.errors = True
-                self.error_list.append('WARNING: Invalid category "{}" in `{}`'.format(
+                self.add_error('WARNING', 'Invalid category "{}" in `{}`'.format(
                     cat, self.rel_filename,
                     ))
 
@@ -1267,8 +2616,7 @@ class CabinetInfo(Cacheable):
                 report = mod_name
             else:
                 report = 'the mod'
-            self.errors = True
-            self.error_list.append('ERROR: No categories found for {} in `{}`'.format(report, self.rel_filename))
+            self.add_error('ERROR', 'No categories found for {} in `{}`'.format(report, self.rel_filename))
             return False
 
     def modlist(self):
@@ -1385,9 +2733,74 @@ class Category(object):
         global wiki_link
         return wiki_link(self.title, '{} {}'.format(game_abbrev, self.full_title))
 
+    def wiki_link_back(self, game):
+        global wiki_link
+        return wiki_link('← Go Back', '{} {}'.format(game.abbreviation, self.full_title))
+
+    def split_pages(self, mods, page_size):
+        """
+        Splits `mods` up into alphabetical sub-pages, if there are more than
+        `page_size` of them (a `page_size` of zero disables splitting).
+        Returns a list of `CategoryPage` objects, or an empty list if the
+        category fits on a single page.  Mods starting with the same letter
+        are always kept together, so a page can end up larger than
+        `page_size` if one letter has a lot of mods.  Note that the mods
+        on each page are *not* sorted.
+        """
+        if not page_size or len(mods) <= page_size:
+            return []
+        by_letter = {}
+        for mod in mods:
+            letter = mod.title_letter()
+            if letter not in by_letter:
+                by_letter[letter] = []
+            by_letter[letter].append(mod)
+        pages = []
+        for letter in sorted(by_letter.keys()):
+            letter_mods = by_letter[letter]
+            if not pages or len(pages[-1].mods) + len(letter_mods) > page_size:
+                pages.append(CategoryPage(self, letter))
+            pages[-1].add_mods(letter, letter_mods)
+        if len(pages) == 1:
+            return []
+        return pages
+
     def __lt__(self, other):
         return self.full_title < other.full_title
 
+class CategoryPage(object):
+    """
+    One alphabetical chunk of a category which has too many mods to show
+    on a single wiki page.
+    """
+
+    def __init__(self, cat, first_letter):
+        self.cat = cat
+        self.first_letter = first_letter
+        self.last_letter = first_letter
+        self.mods = []
+
+    def add_mods(self, letter, mods):
+        self.last_letter = letter
+        self.mods.extend(mods)
+
+    @property
+    def label(self):
+        if self.first_letter == self.last_letter:
+            return self.first_letter
+        return '{}-{}'.format(self.first_letter, self.last_letter)
+
+    def page_title(self, game):
+        return '{} {} ({})'.format(game.abbreviation, self.cat.full_title, self.label)
+
+    def wiki_filename(self, game):
+        global wiki_filename
+        return wiki_filename(self.page_title(game))
+
+    def wiki_link(self, game):
+        global wiki_link_html
+        return wiki_link_html(self.label, self.page_title(game))
+
 class Game(object):
     """
     Class to hold a bit of info about a game.  Basically just a
@@ -1412,6 +2825,9 @@ class App(object):
     Main app
     """
 
+    # Where our Jinja templates live
+    template_dir = 'templates'
+
     # Games that we support
     games = collections.OrderedDict([
             ('BL2', Game('BL2', 'Borderlands 2 mods', 'Borderlands 2')),
@@ -1520,12 +2936,27 @@ class App(object):
         self.dl_base_url = self.config['mods']['download_url']
         self.repo_dir = self.config['mods']['repo_dir']
         self.cabinet_dir = self.config['wiki']['cabinet_dir']
+        self.category_page_size = self.config.getint('wiki', 'category_page_size', fallback=200)
         self.cache_dir = self.config['cache']['cache_dir']
+        self.use_git_hashes = self.config.getboolean('cache', 'use_git_hashes', fallback=False)
+        self.cache_backend = self.config.get('cache', 'backend', fallback='file')
+        if self.cache_backend not in ('file', 'sqlite'):
+            raise Exception('Unknown cache backend: {}'.format(self.cache_backend))
+        self.workers = self.config.getint('processing', 'workers', fallback=os.cpu_count() or 1)
         self.cache_filename = os.path.join(self.cache_dir, 'modcache.json.xz')
         self.readme_cache_filename = os.path.join(self.cache_dir, 'readmecache.json.xz')
         self.info_cache_filename = os.path.join(self.cache_dir, 'infocache.json.xz')
         self.author_cache_filename = os.path.join(self.cache_dir, 'authorcache.json.xz')
         self.templatemtime_cache_filename = os.path.join(self.cache_dir, 'templatemtime.json.xz')
+        self.template_cache_dir = os.path.join(self.cache_dir, 'templates')
+        self.page_cache_filename = os.path.join(self.cache_dir, 'pagecache.json.xz')
+        codec_name = self.config.get('cache', 'codec', fallback='lzma')
+        if codec_name not in CACHE_CODECS:
+            raise Exception('Unknown cache codec: {}'.format(codec_name))
+        self.cache_codec = CACHE_CODECS[codec_name](
+                level=self.config.getint('cache', 'codec_level', fallback=None))
+        self.cache_db_filename = os.path.join(self.cache_dir, 'cabinetsorter.sqlite3')
+        self.last_commit_filename = os.path.join(self.cache_dir, 'lastcommit.txt')
         self.log_dir = self.config['logging']['log_dir']
         self.log_file = os.path.join(self.log_dir, 'cabinetsorter.log')
         self.default_log_level = self.config['logging']['default_level']
@@ -1546,15 +2977,135 @@ class App(object):
         self.console.setLevel(getattr(logging, self.default_log_level))
         self.logger.addHandler(self.console)
 
-        # Grab Jinja templates
-        jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader('templates'))
-        self.game_template = jinja_env.get_template('game.md')
-        self.cat_template = jinja_env.get_template('category.md')
-        self.mod_template = jinja_env.get_template('mod.md')
-        self.status_template = jinja_env.get_template('status.md')
-        self.sidebar_template = jinja_env.get_template('sidebar.md')
-        self.author_template = jinja_env.get_template('author.md')
-        self.category_template = jinja_env.get_template('categories.md')
+    def load_templates(self):
+        """
+        Set up our Jinja environment.  This is deferred until we know that we
+        actually have work to do, since most runs will end up exiting early.
+        The templates themselves aren't loaded until `get_template` is called
+        for them, and are compiled via the bytecode cache in our cache dir.
+        """
+        self.jinja_env = new_template_env(self.template_dir, self.template_cache_dir)
+
+    def get_template(self, template_name):
+        """
+        Returns the template `template_name`, loading it if it hasn't been
+        already.
+        """
+        return self.jinja_env.get_template(template_name)
+
+    def render_pages(self, jobs, shared_context, min_parallel=16):
+        """
+        Renders a list of `(template_name, context)` page jobs, each of which
+        also gets all the template variables in `shared_context`.  Returns an
+        iterator over the rendered pages, in the same order as `jobs`.  So
+        long as there are at least `min_parallel` jobs, they'll be spread
+        out across our worker processes.
+        """
+        if self.workers > 1 and len(jobs) >= min_parallel:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers,
+                    initializer=init_render_worker,
+                    initargs=(self.template_dir, shared_context, self.template_cache_dir)) as executor:
+                yield from executor.map(render_page, jobs,
+                        chunksize=max(1, len(jobs) // (self.workers*4)))
+        else:
+            for (template_name, context) in jobs:
+                full_context = dict(shared_context)
+                full_context.update(context)
+                yield self.get_template(template_name).render(full_context)
+
+    def new_cache(self, cache_class, filename, load_cache=True):
+        """
+        Creates a new cache for `cache_class`, using whichever backend we've
+        been configured to use.  `filename` and our cache codec are only used
+        by the default file backend -- the SQLite backend keeps all caches in
+        a single database.
+        """
+        if self.cache_backend == 'sqlite':
+            return SQLiteFileCache(cache_class, self.cache_db_filename, do_load=load_cache,
+                    repo_dir=self.repo_dir)
+        else:
+            return FileCache(cache_class, filename, do_load=load_cache, codec=self.cache_codec,
+                    repo_dir=self.repo_dir)
+
+    def load_caches(self, load_cache=True):
+        """
+        Initialize our caches.  Like our templates, this is deferred until
+        we know that there's work to do.  If `load_cache` is `False`, we
+        will ignore any cache data currently on disk.
+        """
+        if not load_cache:
+            self.logger.info('Skipping cache loading')
+
+        # The caches are entirely independent of each other, and
+        # decompression releases the GIL, so load them all at once.
+        to_load = [
+                ('mod_cache', ModFile, self.cache_filename),
+                ('readme_cache', Readme, self.readme_cache_filename),
+                ('info_cache', CabinetInfo, self.info_cache_filename),
+                ('author_cache', Author, self.author_cache_filename),
+                ('templatemtime_cache', TemplateMTime, self.templatemtime_cache_filename),
+                ('page_cache', PageHash, self.page_cache_filename),
+                ]
+        failed = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+            futures = [(attr, filename, executor.submit(self.new_cache, cache_class, filename, load_cache))
+                    for (attr, cache_class, filename) in to_load]
+            for (attr, filename, future) in futures:
+                try:
+                    setattr(self, attr, future.result())
+                except Exception as e:
+                    self.logger.error('Could not load {} from {}: {}'.format(attr, filename, e))
+                    failed.append(filename)
+        if failed:
+            raise Exception('Could not load cache(s): {}'.format(', '.join(failed)))
+
+        # Initialize templatemtime_cache.  We don't have to do this for
+        # most of our templates because they get generated every time,
+        # but we want it for mods, authors and categories since those
+        # otherwise only get generated if other caches have noticed changes.  We're fudging
+        # some DirInfo stuff a bit, since that class is built with a BLCM
+        # repo in mind.
+        temp_info = DirInfo('.', os.path.join('.', 'templates'), ['mod.md', 'author.md', 'category.md'])
+        self.mod_template_mtime = self.templatemtime_cache.load(temp_info, 'mod.md')
+        self.author_template_mtime = self.templatemtime_cache.load(temp_info, 'author.md')
+        self.cat_template_mtime = self.templatemtime_cache.load(temp_info, 'category.md')
+
+        # Changing the category page size means that all category pages
+        # need another look, just as if the template had changed, so we
+        # keep track of that in here too (using the size as a "pretend" mtime)
+        page_size_key = 'category_page_size'
+        if (page_size_key not in self.templatemtime_cache
+                or self.templatemtime_cache[page_size_key].mtime != self.category_page_size):
+            self.templatemtime_cache[page_size_key] = TemplateMTime(self.category_page_size,
+                    initial_status=TemplateMTime.S_NEW)
+        self.cat_page_size_mtime = self.templatemtime_cache[page_size_key]
+
+    def save_caches(self):
+        """
+        Saves all our caches.  As with loading, they're saved in parallel.
+        Any errors are reported for each cache individually, and then an
+        exception is raised once every cache has had its chance to save.
+        """
+        to_save = [
+                self.mod_cache,
+                self.readme_cache,
+                self.info_cache,
+                self.author_cache,
+                self.templatemtime_cache,
+                self.page_cache,
+                ]
+        failed = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_save)) as executor:
+            futures = [(cache, executor.submit(cache.save)) for cache in to_save]
+            for (cache, future) in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error('Could not save {} cache to {}: {}'.format(
+                        cache.cache_class.cache_key, cache.filename, e))
+                    failed.append(cache.cache_class.cache_key)
+        if failed:
+            raise Exception('Could not save cache(s): {}'.format(', '.join(failed)))
 
     def run(self, load_cache=True, quiet=False, verbose=False, **args):
         """
@@ -1576,29 +3127,11 @@ class App(object):
         self.logger.info('------------------------')
         self.logger.info('Starting Cabinet Sorter!')
 
-        # Initialize our caches
-        if not load_cache:
-            self.logger.info('Skipping cache loading')
-        self.mod_cache = FileCache(ModFile, self.cache_filename, do_load=load_cache)
-        self.readme_cache = FileCache(Readme, self.readme_cache_filename, do_load=load_cache)
-        self.info_cache = FileCache(CabinetInfo, self.info_cache_filename, do_load=load_cache)
-        self.author_cache = FileCache(Author, self.author_cache_filename, do_load=load_cache)
-        self.templatemtime_cache = FileCache(TemplateMTime, self.templatemtime_cache_filename, do_load=load_cache)
         self.error_list = []
 
-        # Initialize templatemtime_cache.  We don't have to do this for
-        # most of our templates because they get generated every time,
-        # but we want it for mods and authors since those otherwise only
-        # get generated if other caches have noticed changes.  We're fudging
-        # some DirInfo stuff a bit, since that class is built with a BLCM
-        # repo in mind.
-        temp_info = DirInfo('', 'templates', ['mod.md', 'author.md'])
-        self.mod_template_mtime = self.templatemtime_cache.load(temp_info, 'mod.md')
-        self.author_template_mtime = self.templatemtime_cache.load(temp_info, 'author.md')
-
         # Continue
         try:
-            self._run(**args)
+            self._run(load_cache=load_cache, **args)
         except Exception as e:
             self.logger.critical('Unhandled exception: {}'.format(str(e)))
             for tb_line in traceback.format_exception(*sys.exc_info()):
@@ -1614,13 +3147,19 @@ class App(object):
         return retval
 
     def _run(self,
+            load_cache=True,
             do_git=True,
             do_git_commit=True,
             do_initial_tasks=False,
             force_run=False,
+            incremental=True,
             ):
         """
-        Actual function to do most of the work.
+        Actual function to do most of the work.  If `incremental` is `True`,
+        we'll only look at the dirs in the mods repo which have changed since
+        our last run, where possible, rather than walking the whole thing.
+        Incremental runs also leave the cached mods from unchanged dirs in
+        their serialized form, unless their pages need to be re-rendered.
         """
 
         # If we've been told to do initial tasks, do those first
@@ -1629,6 +3168,33 @@ class App(object):
             self.do_initial_tasks()
             self.logger.info('Done with initial setup tasks')
 
+        # Pull down the latest repo
+        if do_git:
+            self.logger.debug('Pulling mods repo from git')
+            before_hash = git_output(self.repo_dir, 'rev-parse', 'HEAD')
+            git_output(self.repo_dir, 'pull')
+            after_hash = git_output(self.repo_dir, 'rev-parse', 'HEAD')
+            last_hash = self.read_last_commit()
+            if before_hash != after_hash:
+                self.logger.debug('Update found, continuing')
+            elif last_hash is None:
+                self.logger.info('No record of a previous successful run, continuing')
+            elif last_hash != after_hash:
+                self.logger.info('Previous run did not finish processing mods repo, continuing')
+            elif force_run:
+                self.logger.info('No update found for mods repo, continuing anyway')
+            else:
+                self.logger.info('No update found for mods repo')
+                return
+            import git
+            modsrepo = git.Repo(self.repo_dir)
+        else:
+            self.logger.info('Skipping mods repo pull')
+
+        # Now that we know we have work to do, load our caches and templates
+        self.load_caches(load_cache)
+        self.load_templates()
+
         # Keep track of which categories we've seen
         seen_cats = {}
         for game in self.games.values():
@@ -1656,129 +3222,103 @@ class App(object):
             for cat in self.categories.values():
                 reserved_pages.add(cat.wiki_filename(game))
 
-        # Pull down the latest repo
-        if do_git:
-            self.logger.debug('Pulling mods repo from git')
-            modsrepo = git.Repo(self.repo_dir)
-            before_hash = modsrepo.head.object.hexsha
-            modsrepo.git.pull()
-            after_hash = modsrepo.head.object.hexsha
-            if before_hash == after_hash:
-                if force_run:
-                    self.logger.info('No update found for mods repo, continuing anyway')
-                else:
-                    self.logger.info('No update found for mods repo')
-                    return
-            else:
-                self.logger.debug('Update found, continuing')
+        # Grab git blob hashes for everything in the mods repo, if we've been
+        # told to use those to check for changed files
+        blob_hashes = None
+        if do_git and self.use_git_hashes:
+            blob_hashes = self.get_blob_hashes(modsrepo)
+
+        # Figure out if we can get away with only looking at the dirs which
+        # have changed since our last run, rather than walking the whole repo.
+        changed_dirs = None
+        if do_git and incremental and len(self.mod_cache) > 0:
+            changed_dirs = self.get_changed_dirs(modsrepo, last_hash, after_hash)
+
+        # Loop through our game dirs, finding the mod files we'll need to load
+        mod_dirs = []
+        if changed_dirs is None:
+            self.logger.debug('Beginning walkthrough of repo directory')
+            for game in self.games.values():
+                game_dir = os.path.join(self.repo_dir, game.dir_name)
+                for (dirpath, entries) in walk_dir(game_dir):
+
+                    # Make a mapping of files by lower-case, so that we can
+                    # match case-insensitively
+                    dirinfo = DirInfo(self.repo_dir, dirpath, entries, blob_hashes)
+                    mod_dirs.append(self.find_dir_mods(game, dirinfo))
         else:
-            self.logger.info('Skipping mods repo pull')
-
-        # Loop through our game dirs
-        self.logger.debug('Beginning walkthrough of repo directory')
+            self.logger.debug('Processing {} changed dir(s) in repo directory'.format(len(changed_dirs)))
+            game_dirs = dict([(game.dir_name, game) for game in self.games.values()])
+            game_order = dict([(dir_name, idx) for (idx, dir_name) in enumerate(game_dirs.keys())])
+            error_dirs = self.get_error_dirs()
+            # Go through the dirs in the same order that a full walk would
+            # (by game, and then depth-first by name), so that any errors
+            # get reported in the same order, too.
+            for rel_dirpath in sorted(changed_dirs | set(error_dirs.keys()),
+                    key=lambda rel_dirpath: (game_order.get(rel_dirpath.split(os.sep)[0], -1),
+                        rel_dirpath.split(os.sep))):
+                game_dir_name = rel_dirpath.split(os.sep)[0]
+                if game_dir_name not in game_dirs:
+                    continue
+                if rel_dirpath not in changed_dirs:
+                    # Nothing's changed here, so just report the errors we
+                    # found last time around.
+                    self.error_list.extend(CabinetInfo.serialized_error_reports(
+                        self.info_cache.peek(error_dirs[rel_dirpath])))
+                    continue
+                dirpath = os.path.join(self.repo_dir, rel_dirpath)
+                try:
+                    (entries, subdirs) = scan_dir(dirpath)
+                except (FileNotFoundError, NotADirectoryError):
+                    # Deleted dir; any mods which used to live here will
+                    # get cleaned up below, since they won't be marked seen.
+                    continue
+                dirinfo = DirInfo(self.repo_dir, dirpath, entries, blob_hashes)
+                mod_dirs.append(self.find_dir_mods(game_dirs[game_dir_name], dirinfo))
+
+        mod_dirs = [mod_dir for mod_dir in mod_dirs if mod_dir is not None]
+
+        # Clear out any info files which no longer exist, so that we don't
+        # keep reporting their errors.
+        seen_info_keys = set([self.info_cache.get_key(mod_dir[1], 'cabinet.info') for mod_dir in mod_dirs])
+        for key in list(self.info_cache.keys()):
+            if key not in seen_info_keys and (changed_dirs is None or os.path.dirname(key) in changed_dirs):
+                del self.info_cache[key]
+
+        # Load in any new or updated mod files.  This is where the bulk of our
+        # parsing happens, so it may be spread out across multiple processes.
+        self.logger.debug('Loading mod files')
+        to_load = []
+        for (game, dirinfo, readme, cabinet_info, mod_files) in mod_dirs:
+            for (cabinet_info_mod, filename) in mod_files:
+                to_load.append((dirinfo, filename, {'game': game.abbreviation}))
+        self.mod_cache.load_many(to_load, workers=self.workers)
+
+        # Now process the mods in each dir
         name_resolution = {}
-        for game in self.games.values():
-            game_dir = os.path.join(self.repo_dir, game.dir_name)
-            for (dirpath, dirnames, filenames) in os.walk(game_dir):
-
-                # Make a mapping of files by lower-case, so that we can
-                # match case-insensitively
-                dirinfo = DirInfo(self.repo_dir, dirpath, filenames)
-
-                # Read our info file, if we have it.
-                if 'cabinet.info' in dirinfo:
-
-                    # Load in readme info, if we can.
-                    readme = None
-                    if dirinfo.readme:
-                        readme = self.readme_cache.load(dirinfo, dirinfo.readme)
-
-                    # Read the file info
-                    cabinet_filename = dirinfo['cabinet.info']
-                    rel_cabinet_filename = cabinet_filename[len(self.repo_dir)+1:]
-                    cabinet_info = self.info_cache.load(dirinfo, 'cabinet.info',
-                            rel_filename=rel_cabinet_filename,
-                            error_list=self.error_list,
-                            valid_categories=self.categories,
-                            )
-
-                    # Loop through the mods described by cabinet.info and load them
-                    processed_files = []
-                    if cabinet_info.single_mod:
-                        # Make sure that a valid category was found
-                        if None in cabinet_info.mods:
-                            cabinet_info_mod = cabinet_info.mods[None]
-                            # Scan for which file to use -- just a single mod file in
-                            # this dir.  First look for .blcm files.
-                            for blcm_file in dirinfo.get_all_with_ext('blcm'):
-                                processed_files.append((cabinet_info_mod, self.mod_cache.load(dirinfo, blcm_file, game=game.abbreviation)))
-                                # We're just going to always take the very first .blcm file we find
-                                break
-                            if len(processed_files) == 0:
-                                for txt_file in dirinfo.get_all_with_ext('txt'):
-                                    if 'readme' not in txt_file.lower():
-                                        processed_files.append((cabinet_info_mod, self.mod_cache.load(dirinfo, txt_file, game=game.abbreviation)))
-                                        # Again, just grab the first one
-                                        break
-                            if len(processed_files) == 0:
-                                for random_file in dirinfo.get_all():
-                                    if 'readme' not in random_file.lower() and 'changelog' not in random_file.lower() and 'cabinet.info' not in random_file.lower():
-                                        processed_files.append((cabinet_info_mod, self.mod_cache.load(dirinfo, random_file, game=game.abbreviation)))
-                                        # Again, just grab the first one
-                                        break
-                    else:
-                        for cabinet_info_mod in cabinet_info.modlist():
-                            try:
-                                processed_files.append((cabinet_info_mod, self.mod_cache.load(dirinfo, cabinet_info_mod.filename, game=game.abbreviation)))
-                            except KeyError:
-                                self.error_list.append('ERROR: Invalid modfile `{}` specified in `{}`'.format(
-                                    cabinet_info_mod.filename,
-                                    rel_cabinet_filename,
-                                    ))
-
-                    # Do Stuff with each file we got
-                    for (cabinet_info_mod, processed_file) in processed_files:
-
-                        # See if we've got a "better" description in a readme
-                        if readme:
-                            readme_info = readme.find_matching(processed_file.mod_title, cabinet_info.single_mod)
-                            if cabinet_info.single_mod:
-                                changelog = readme.find_matching('changelog', False)
-                            else:
-                                changelog = []
-                        else:
-                            readme_info = []
-                            changelog = []
-                        processed_file.update_readme_desc(readme, readme_info)
-                        processed_file.update_changelog(changelog)
-
-                        # Set our categories (if we'd read from cache, they may have changed)
-                        processed_file.set_categories(cabinet_info_mod.categories)
-                        for cat in cabinet_info_mod.categories:
-                            if cat not in seen_cats[game.abbreviation]:
-                                seen_cats[game.abbreviation][cat] = []
-                            seen_cats[game.abbreviation][cat].append(processed_file)
-
-                        # Set our URLs (likewise, if from cache then they may have changed)
-                        processed_file.set_urls(cabinet_info_mod.urls)
-
-                        # Set our boolean to use the in-mod description or not
-                        processed_file.update_use_mod_desc(cabinet_info_mod.use_in_mod_desc)
-
-                        # Previously we were adding mods to our author cache here, but we need
-                        # to wait until we resolve any potential mod name conflicts first, so
-                        # that's now happening later...
-
-                        # Add to our name_resolution object for later processing
-                        title_lower = processed_file.mod_title.lower()
-                        if title_lower not in name_resolution:
-                            name_resolution[title_lower] = {}
-                        if game not in name_resolution[title_lower]:
-                            name_resolution[title_lower][game] = {}
-                        author_lower = processed_file.mod_author.lower()
-                        if author_lower not in name_resolution[title_lower][game]:
-                            name_resolution[title_lower][game][author_lower] = {}
-                        name_resolution[title_lower][game][author_lower][processed_file.rel_filename] = processed_file.full_filename
+        for mod_dir in mod_dirs:
+            self.process_dir(*mod_dir, seen_cats, name_resolution)
+
+        listings = {}
+        if changed_dirs is not None:
+            # Everything else in our cache is unchanged, so pull it in as-is.
+            # Mods which haven't been unserialized yet are registered via a
+            # `ModListing` instead, so that we only end up unserializing the
+            # ones whose data changes or whose pages need rendering.
+            for key in list(self.mod_cache.keys()):
+                if self.mod_cache.is_loaded(key):
+                    mod = self.mod_cache[key]
+                    if mod.seen or mod.rel_path in changed_dirs:
+                        continue
+                    mod.seen = True
+                else:
+                    input_dict = self.mod_cache.peek(key)
+                    if input_dict['rp'] in changed_dirs:
+                        continue
+                    mod = ModListing(self.mod_cache, key, input_dict)
+                    listings[key] = mod
+                self.register_mod(self.games[mod.game], mod, mod.categories,
+                        seen_cats, name_resolution)
 
         # Report that we're done
         self.logger.debug('Finished looping through mods directory')
@@ -1812,11 +3352,27 @@ class App(object):
             else:
                 print('No errors encountered during run.')
 
-        # Find any deleted mods.
+        # Find any deleted mods.  The categories they were in will need
+        # their pages updated.
+        changed_cats = {}
+        for game in self.games.values():
+            changed_cats[game.abbreviation] = set()
         to_delete = []
-        for filename, mod in self.mod_cache.items():
-            if not mod.seen:
-                to_delete.append(filename)
+        for filename in self.mod_cache.keys():
+            if filename in listings:
+                continue
+            if self.mod_cache.is_loaded(filename):
+                mod = self.mod_cache[filename]
+                if mod.seen:
+                    continue
+                (game, categories) = (mod.game, mod.categories)
+            else:
+                # Nothing looked at this one, so it's gone.  No need to
+                # unserialize it just to find out where it used to be.
+                input_dict = self.mod_cache.peek(filename)
+                (game, categories) = (input_dict['g'], input_dict['c'])
+            to_delete.append(filename)
+            changed_cats.setdefault(game, set()).update(categories)
         for filename in to_delete:
             self.logger.info('Marking for deletion: {}'.format(filename))
             del self.mod_cache[filename]
@@ -1847,9 +3403,11 @@ class App(object):
                 need_author = (len(mod_authors) > 1)
                 for (author_name, mod_files) in mod_authors.items():
                     need_filename = (len(mod_files) > 1)
-                    for (mod_filename, mod_full_filename) in mod_files.items():
-                        if mod_full_filename in self.mod_cache:
-                            mod_obj = self.mod_cache[mod_full_filename]
+                    for (mod_filename, mod_cache_key) in mod_files.items():
+                        mod_obj = listings.get(mod_cache_key)
+                        if mod_obj is None and mod_cache_key in self.mod_cache:
+                            mod_obj = self.mod_cache[mod_cache_key]
+                        if mod_obj is not None:
 
                             # Filename suffix
                             if need_filename:
@@ -1900,6 +3458,15 @@ class App(object):
             for mod_obj in shared_set:
                 mod_obj.set_related_links(shared_set - {mod_obj})
 
+        # Now that all our mods are finalized, figure out which categories
+        # have had mods come, go, or change how they're listed.  Mods which
+        # were never unserialized can't have changed.
+        for (_, mod) in self.mod_cache.loaded_items():
+            if mod.changed_fields & ModFile.F_LISTING:
+                cats = changed_cats.setdefault(mod.game, set())
+                cats.update(mod.categories)
+                cats.update(mod.prev_categories)
+
         # Pull down the most recent wiki revision (nobody "should" be editing this
         # manually, but I'm sure it'll happen eventually)
         if do_git:
@@ -1909,12 +3476,14 @@ class App(object):
         else:
             self.logger.info('Skipping wiki repo pull')
 
-        # Get a list of files currently in the wiki
+        # Get a list of files currently in the wiki, along with their stat
+        # info (used by `write_wiki_file` to check against our page cache)
         self.logger.debug('Getting current list of wiki files')
-        wiki_files = set()
-        for filename in os.listdir(self.cabinet_dir):
-            if os.path.isfile(os.path.join(self.cabinet_dir, filename)):
-                wiki_files.add(filename)
+        wiki_files = {}
+        with os.scandir(self.cabinet_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    wiki_files[entry.name] = entry.stat()
 
         # Write out updated static pages, if need be
         self.logger.debug('Writing out static pages')
@@ -1927,35 +3496,80 @@ class App(object):
 
         # Write out game and category pages
         self.logger.debug('Writing out game and category pages')
+        cats_changed = (self.cat_template_mtime.status != TemplateMTime.S_CACHED
+                or self.cat_page_size_mtime.status != TemplateMTime.S_CACHED)
         multi_game_cats = {}
+        multi_game_cat_pages = {}
         for game in self.games.values():
             game_cats = []
+            game_cat_pages = {}
             multi_game_cats[game.abbreviation] = game_cats
+            multi_game_cat_pages[game.abbreviation] = game_cat_pages
             for (cat_key, cat) in self.categories.items():
                 if cat_key in seen_cats[game.abbreviation]:
                     game_cats.append(cat)
 
-                    # Write out the category page
+                    # Large categories get split up into alphabetical
+                    # sub-pages, with the main category page linking to them.
                     cat_filename = cat.wiki_filename(game)
-                    created_pages.add(cat_filename)
-                    self.write_wiki_file(wiki_files,
-                            cat_filename,
-                            self.cat_template.render({
-                                'game': game,
-                                'cat': cat,
-                                'mods': sorted(seen_cats[game.abbreviation][cat_key]),
-                                'authors': self.author_cache,
-                                }),
-                            )
+                    cat_pages = cat.split_pages(seen_cats[game.abbreviation][cat_key],
+                            self.category_page_size)
+                    game_cat_pages[cat] = cat_pages
+                    filenames = [cat_filename]
+                    for cat_page in cat_pages:
+                        page_filename = cat_page.wiki_filename(game)
+                        reserved_pages.add(page_filename)
+                        filenames.append(page_filename)
+                    created_pages.update(filenames)
+
+                    # Write out the category page(s), unless nothing which
+                    # shows up on them has changed since we last did.  If
+                    # none of the category's mods have changed, we don't
+                    # even need to check the fingerprints.
+                    if (not cats_changed
+                            and cat_key not in changed_cats[game.abbreviation]
+                            and all([self.is_page_current(wiki_files, f) for f in filenames])):
+                        continue
+                    if cat_pages:
+                        to_render = [(cat_filename, None, [])]
+                        for cat_page in cat_pages:
+                            to_render.append((cat_page.wiki_filename(game), cat_page, sorted(cat_page.mods)))
+                    else:
+                        to_render = [(cat_filename, None, sorted(seen_cats[game.abbreviation][cat_key]))]
+                    for (page_filename, cat_page, cat_mods) in to_render:
+                        fingerprint_data = [
+                            game.title,
+                            cat.full_title,
+                            [(mod.mod_title_display, mod.wiki_filename_base, mod.mod_author) for mod in cat_mods],
+                            ]
+                        if cat_page is not None:
+                            fingerprint_data.append(cat_page.label)
+                        elif cat_pages:
+                            fingerprint_data.append([p.label for p in cat_pages])
+                        fingerprint = PageHash.hash_fingerprint(fingerprint_data)
+                        if cats_changed or not self.is_page_current(wiki_files, page_filename, fingerprint):
+                            self.write_wiki_file(wiki_files,
+                                    page_filename,
+                                    self.get_template('category.md').render({
+                                        'game': game,
+                                        'cat': cat,
+                                        'page': cat_page,
+                                        'pages': [] if cat_page else cat_pages,
+                                        'mods': cat_mods,
+                                        'authors': self.author_cache,
+                                        }),
+                                    fingerprint=fingerprint,
+                                    )
 
             # Write out the game page, linking to all categories which have mods
             game_filename = game.wiki_filename()
             created_pages.add(game_filename)
             self.write_wiki_file(wiki_files,
                     game_filename,
-                    self.game_template.render({
+                    self.get_template('game.md').render({
                         'game': game,
                         'categories': game_cats,
+                        'cat_pages': game_cat_pages,
                         })
                     )
 
@@ -1963,10 +3577,11 @@ class App(object):
         self.logger.debug('Writing sidebar')
         self.write_wiki_file(wiki_files,
                 sidebar_filename,
-                self.sidebar_template.render({
+                self.get_template('sidebar.md').render({
                     'games': self.games.values(),
                     'cats': self.categories,
                     'seen_cats': multi_game_cats,
+                    'cat_pages': multi_game_cat_pages,
                     })
                 )
 
@@ -1974,14 +3589,19 @@ class App(object):
         self.logger.debug('Writing categories page')
         self.write_wiki_file(wiki_files,
                 category_filename,
-                self.category_template.render({
+                self.get_template('categories.md').render({
                     'categories': self.categories,
                     })
                 )
 
-        # Write out Author pages
-        self.logger.debug('Writing author pages')
-        for author in self.author_cache.values():
+        # Figure out which Author and mod pages need writing.  Those get
+        # rendered all together (possibly in parallel) once we know what
+        # they are, and are written out in the order we find them here.
+        page_jobs = []
+
+        # Author pages
+        self.logger.debug('Checking author pages')
+        for (_, author) in sorted(self.author_cache.items()):
             author_filename = author.wiki_filename()
             if author_filename in reserved_pages:
                 e = 'ERROR: Author `{}` uses a reserved name'.format(author_filename)
@@ -2000,17 +3620,17 @@ class App(object):
                 if (author.check_modlist() != Author.S_CACHED
                         or self.author_template_mtime.status != TemplateMTime.S_CACHED
                         or author_filename not in wiki_files):
-                    full_author = os.path.join(self.cabinet_dir, author_filename)
-                    with open(full_author, 'w') as df:
-                        df.write(self.author_template.render({
-                            'author': author,
-                            'games': self.games,
-                            'base_url': self.base_url,
-                            }))
-
-        # Write out our individual mods
-        self.logger.debug('Writing individual mod pages')
-        for mod in self.mod_cache.values():
+                    page_jobs.append((author_filename, 'author.md', {
+                        'author': author,
+                        }))
+
+        # Our individual mods
+        self.logger.debug('Checking individual mod pages')
+        for key in sorted(self.mod_cache.keys()):
+            if self.mod_cache.is_loaded(key):
+                mod = self.mod_cache[key]
+            else:
+                mod = listings[key]
             mod_filename = mod.wiki_filename()
             if mod_filename in reserved_pages:
                 e = 'ERROR: `{}` uses a reserved name'.format(mod.get_full_rel_filename())
@@ -2023,28 +3643,46 @@ class App(object):
             else:
                 created_pages.add(mod_filename)
                 if (self.mod_template_mtime.status != TemplateMTime.S_CACHED
-                        or mod.status != ModFile.S_CACHED
+                        or mod.changed_fields & ModFile.F_MOD_PAGE
                         or mod_filename not in wiki_files):
-                    content = self.mod_template.render({
+                    # Only send along the one author the page needs, rather
+                    # than our whole author cache.
+                    mod = self.mod_cache[key]
+                    authors = {}
+                    if mod.mod_author in self.author_cache:
+                        authors[mod.mod_author] = self.author_cache[mod.mod_author]
+                    page_jobs.append((mod_filename, 'mod.md', {
                         'mod': mod,
-                        'base_url': self.base_url,
-                        'dl_base_url': self.dl_base_url,
-                        'cats': self.categories,
-                        'authors': self.author_cache,
-                        })
-                    full_filename = os.path.join(self.cabinet_dir, mod_filename)
-                    with open(full_filename, 'w') as df:
-                        df.write(content)
+                        'authors': authors,
+                        }))
+
+        # Now render and write out the pages
+        self.logger.debug('Writing {} author/mod page(s)'.format(len(page_jobs)))
+        shared_context = {
+                'games': self.games,
+                'cats': self.categories,
+                'base_url': self.base_url,
+                'dl_base_url': self.dl_base_url,
+                }
+        pages = self.render_pages([(template_name, context) for (_, template_name, context) in page_jobs],
+                shared_context)
+        for ((page_filename, _, _), content) in zip(page_jobs, pages):
+            self.write_wiki_file(wiki_files, page_filename, content)
 
         # Finally, our 'Status' page.  This always gets written.
         self.logger.debug('Writing status page')
         with open(os.path.join(self.cabinet_dir, status_filename), 'w') as df:
-            content = self.status_template.render({
+            content = self.get_template('status.md').render({
                 'gen_time': datetime.datetime.now(datetime.timezone(datetime.timedelta())),
                 'errors': self.error_list,
                 })
             df.write(content)
 
+        # Forget about any pages we didn't generate this time around
+        for filename in list(self.page_cache.keys()):
+            if filename not in created_pages:
+                del self.page_cache[filename]
+
         # Commit-related git actions
         if do_git and do_git_commit:
 
@@ -2078,48 +3716,313 @@ class App(object):
         else:
             self.logger.info('Skipping wiki repo commit')
 
-        # Write out our mod cache
+        # Write out our caches
         self.logger.debug('Writing caches')
-        self.mod_cache.save()
-        self.readme_cache.save()
-        self.info_cache.save()
-        self.author_cache.save()
-        self.templatemtime_cache.save()
+        self.save_caches()
+
+        # Record the commit we've just processed, for our next incremental run
+        if do_git:
+            with open(self.last_commit_filename, 'w') as df:
+                print(after_hash, file=df)
+
+    def find_dir_mods(self, game, dirinfo):
+        """
+        Looks at a single directory inside the mods repo, described by
+        `dirinfo`, to find the mod files described by a `cabinet.info`
+        file found there.  Returns `None` if there's no `cabinet.info`,
+        otherwise a tuple containing `game`, `dirinfo`, the dir's `Readme`
+        (if any), its `CabinetInfo`, and a list of tuples of
+        `(cabinet_info_mod, filename)` for each mod file we found.  The mod
+        files themselves are not loaded here.
+        """
+
+        # Read our info file, if we have it.
+        if 'cabinet.info' not in dirinfo:
+            return None
+
+        # Load in readme info, if we can.
+        readme = None
+        if dirinfo.readme:
+            readme = self.readme_cache.load(dirinfo, dirinfo.readme)
+
+        # Read the file info
+        cabinet_filename = dirinfo['cabinet.info']
+        rel_cabinet_filename = cabinet_filename[len(self.repo_dir)+1:]
+        cabinet_info = self.info_cache.load(dirinfo, 'cabinet.info',
+                rel_filename=rel_cabinet_filename,
+                error_list=self.error_list,
+                valid_categories=self.categories,
+                )
+        if cabinet_info.status == Cacheable.S_CACHED:
+            # Parse errors only get reported while actually parsing, so
+            # replay the ones we stored in our cache.
+            self.error_list.extend([e.report() for e in cabinet_info.parse_errors])
+
+        # Loop through the mods described by cabinet.info and find them
+        mod_files = []
+        dir_errors = []
+        if cabinet_info.single_mod:
+            # Make sure that a valid category was found
+            if None in cabinet_info.mods:
+                cabinet_info_mod = cabinet_info.mods[None]
+                # Scan for which file to use -- just a single mod file in
+                # this dir.  First look for .blcm files.
+                for blcm_file in dirinfo.get_all_with_ext('blcm'):
+                    mod_files.append((cabinet_info_mod, blcm_file))
+                    # We're just going to always take the very first .blcm file we find
+                    break
+                if len(mod_files) == 0:
+                    for txt_file in dirinfo.get_all_with_ext('txt'):
+                        if 'readme' not in txt_file.lower():
+                            mod_files.append((cabinet_info_mod, txt_file))
+                            # Again, just grab the first one
+                            break
+                if len(mod_files) == 0:
+                    for random_file in dirinfo.get_all():
+                        if 'readme' not in random_file.lower() and 'changelog' not in random_file.lower() and 'cabinet.info' not in random_file.lower():
+                            mod_files.append((cabinet_info_mod, random_file))
+                            # Again, just grab the first one
+                            break
+        else:
+            for cabinet_info_mod in cabinet_info.modlist():
+                if cabinet_info_mod.filename in dirinfo:
+                    mod_files.append((cabinet_info_mod, cabinet_info_mod.filename))
+                else:
+                    error = CabinetInfoError('ERROR', 'Invalid modfile `{}` specified in `{}`'.format(
+                        cabinet_info_mod.filename,
+                        rel_cabinet_filename,
+                        ))
+                    dir_errors.append(error)
+                    self.error_list.append(error.report())
+        cabinet_info.set_dir_errors(dir_errors)
+
+        return (game, dirinfo, readme, cabinet_info, mod_files)
 
-    def write_wiki_file(self, wiki_files, filename, content):
+    def process_dir(self, game, dirinfo, readme, cabinet_info, mod_files, seen_cats, name_resolution):
         """
-        Write out a file to the wiki, so long as the content has changed
+        Processes the mods found in a single directory inside the mods repo,
+        given the information returned by `find_dir_mods`.  The mod files
+        themselves should already have been loaded into our mod cache by
+        this point (though they'll be loaded here if not).
         """
-        # TODO: is this method, um, dumb?  It's only used on staticish pages, so
-        # we should maybe just write indiscriminately.  Or maybe use a FileCache?
+        processed_files = []
+        for (cabinet_info_mod, filename) in mod_files:
+            processed_files.append((cabinet_info_mod, self.mod_cache.load(dirinfo, filename, game=game.abbreviation)))
+
+        # Find all our readme sections at once, rather than scanning the
+        # readme separately for each mod.
+        if readme:
+            readme_infos = readme.find_matching_batch(
+                    [processed_file.mod_title for (_, processed_file) in processed_files],
+                    cabinet_info.single_mod)
+
+        # Do Stuff with each file we got
+        for (idx, (cabinet_info_mod, processed_file)) in enumerate(processed_files):
+
+            # See if we've got a "better" description in a readme
+            if readme:
+                readme_info = readme_infos[idx]
+                if cabinet_info.single_mod:
+                    changelog = readme.find_matching('changelog', False)
+                else:
+                    changelog = []
+            else:
+                readme_info = []
+                changelog = []
+            processed_file.update_readme_desc(readme, readme_info)
+            processed_file.update_changelog(changelog)
+
+            # Set our categories (if we'd read from cache, they may have changed)
+            processed_file.set_categories(cabinet_info_mod.categories)
+
+            # Set our URLs (likewise, if from cache then they may have changed)
+            processed_file.set_urls(cabinet_info_mod.urls)
+
+            # Set our boolean to use the in-mod description or not
+            processed_file.update_use_mod_desc(cabinet_info_mod.use_in_mod_desc)
+
+            # Previously we were adding mods to our author cache here, but we need
+            # to wait until we resolve any potential mod name conflicts first, so
+            # that's now happening later...
+            self.register_mod(game, processed_file, cabinet_info_mod.categories,
+                    seen_cats, name_resolution)
+
+    def register_mod(self, game, processed_file, categories, seen_cats, name_resolution):
+        """
+        Adds the given mod to our `seen_cats` category list and our
+        `name_resolution` object, for later processing.
+        """
+        for cat in categories:
+            if cat not in seen_cats[game.abbreviation]:
+                seen_cats[game.abbreviation][cat] = []
+            seen_cats[game.abbreviation][cat].append(processed_file)
+
+        title_lower = processed_file.mod_title.lower()
+        if title_lower not in name_resolution:
+            name_resolution[title_lower] = {}
+        if game not in name_resolution[title_lower]:
+            name_resolution[title_lower][game] = {}
+        author_lower = processed_file.mod_author.lower()
+        if author_lower not in name_resolution[title_lower][game]:
+            name_resolution[title_lower][game][author_lower] = {}
+        name_resolution[title_lower][game][author_lower][processed_file.rel_filename] = processed_file.get_full_rel_filename()
+
+    def get_blob_hashes(self, modsrepo):
+        """
+        Returns a dict mapping every repo-relative filename in the mods
+        repo's index to its git blob hash, using a single `git ls-files`
+        call.
+        """
+        blob_hashes = {}
+        for line in modsrepo.git.ls_files('-s', '-z').split("\0"):
+            if line != '':
+                (info, filename) = line.split("\t", 1)
+                blob_hashes[filename.replace('/', os.sep)] = info.split(' ')[1]
+        return blob_hashes
+
+    def read_last_commit(self):
+        """
+        Returns the mods repo commit which we last successfully processed,
+        or `None` if we don't know.
+        """
+        if not os.path.exists(self.last_commit_filename):
+            return None
+        with open(self.last_commit_filename) as df:
+            last_hash = df.read().strip()
+        if last_hash == '':
+            return None
+        return last_hash
+
+    def get_changed_dirs(self, modsrepo, last_hash, cur_hash):
+        """
+        Returns a set of repo-relative directory paths which may need to be
+        processed, given that the mods repo is currently at `cur_hash`, and
+        that we last successfully processed `last_hash`.  This includes every
+        dir which has had a file added, changed, or deleted since then, plus
+        any dir whose `cabinet.info` had errors (so those get reported again).
+        Will return `None` if we don't have enough information to do this, in
+        which case the whole repo should be walked.
+        """
+        import git
+        if last_hash is None:
+            return None
+        try:
+            changed_files = modsrepo.git.diff('--name-only', '--no-renames', '-z',
+                    last_hash, cur_hash)
+        except git.exc.GitCommandError as e:
+            self.logger.warning('Could not get changed files since {}, walking entire repo'.format(last_hash))
+            return None
+        changed_dirs = set()
+        for changed_file in changed_files.split("\0"):
+            if changed_file != '':
+                changed_dirs.add(os.path.dirname(changed_file.replace('/', os.sep)))
+        for key in self.info_cache.keys():
+            # Older caches stored info files with errors using a zero
+            # mtime, rather than storing the errors themselves.  Those need
+            # one more pass to get their errors recorded.
+            info_dict = self.info_cache.peek(key)
+            if info_dict['m'] == 0 and 'e' not in info_dict:
+                changed_dirs.add(os.path.dirname(key))
+        return changed_dirs
+
+    def get_error_dirs(self):
+        """
+        Returns a dict of repo-relative directory paths whose `cabinet.info`
+        had errors the last time it was processed, mapped to the key of that
+        `cabinet.info` in our info cache.  The errors can be reported straight
+        out of the cache for any of these dirs which haven't otherwise
+        changed.
+        """
+        error_dirs = {}
+        for key in self.info_cache.keys():
+            # Peeking at the serialized data saves us from unserializing
+            # every single cabinet.info we know about.
+            info_dict = self.info_cache.peek(key)
+            if info_dict.get('e') or info_dict.get('x'):
+                error_dirs[os.path.dirname(key)] = key
+        return error_dirs
+
+    def write_wiki_file(self, wiki_files, filename, content, fingerprint=None):
+        """
+        Write out a file to the wiki, so long as the content has changed.
+        `wiki_files` should map the filenames currently in the wiki to their
+        stat info.  Rather than reading the current file back in, we compare
+        against the hash of what we last wrote out, from our page cache.  If
+        the file has been touched since then (by a wiki pull, for instance),
+        its size or mtime won't match, and it'll just get written again.
+        `fingerprint`, if passed in, is stored alongside the page, for use
+        by `is_page_current`.
+        """
+        digest = PageHash.hash_content(content)
+        if (filename in wiki_files
+                and filename in self.page_cache
+                and self.page_cache[filename].matches(digest, wiki_files[filename])):
+            self.page_cache[filename].set_fingerprint(fingerprint)
+            return
         full_filename = os.path.join(self.cabinet_dir, filename)
-        do_write = True
-        if filename in wiki_files:
-            with open(full_filename) as df:
-                cur_content = df.read()
-                if cur_content == content:
-                    do_write = False
-        if do_write:
-            with open(full_filename, 'w') as df:
-                df.write(content)
+        with open(full_filename, 'w') as df:
+            df.write(content)
+        stat = os.stat(full_filename)
+        self.page_cache[filename] = PageHash(stat.st_mtime,
+                initial_status=Cacheable.S_NEW,
+                digest=digest,
+                size=stat.st_size,
+                fingerprint=fingerprint)
+
+    def is_page_current(self, wiki_files, filename, fingerprint=None):
+        """
+        Returns whether or not the wiki page `filename` was last rendered
+        from data with the given `fingerprint`, and is still exactly as we
+        wrote it out.  If so, there's no need to render it again.  If
+        `fingerprint` is `None`, any page which was stored with a
+        fingerprint at all will do.
+        """
+        if filename not in wiki_files or filename not in self.page_cache:
+            return False
+        page = self.page_cache[filename]
+        if page.fingerprint is None or (fingerprint is not None and page.fingerprint != fingerprint):
+            return False
+        return page.is_current(wiki_files[filename])
 
     def do_initial_tasks(self):
         """
         Initial first-time-run tasks which need to happen.  Namely: update
         all the file mtimes in the git repo checkout to match their git-tree
-        mtimes.  This is something which we could also just do as we loop
-        through the repo, instead, but I don't really care enough to figure
-        out how to use the more-efficient low-level gitpython functions to
-        do the lookups, as opposed to the higher-level API that we're using.
+        mtimes.  Rather than asking git about each file individually, we
+        walk the repo history just once (newest first), and take the first
+        timestamp we see for each file.
         """
 
+        import git
+        start_time = time.time()
         repo = git.Repo(self.repo_dir)
-        for (dirpath, dirnames, filenames) in os.walk(self.repo_dir):
-            if '.git' not in dirpath:
-                for filename in filenames:
-                    full_filename = os.path.join(dirpath, filename)
-                    try:
-                        git_mtime = int(repo.git.log('-n', '1', '--format=%ct', full_filename))
-                        os.utime(full_filename, (git_mtime, git_mtime))
-                    except ValueError as e:
-                        print('ERROR: Invalid mtime returned for {}'.format(full_filename))
+
+        # Get the list of files that git knows about
+        filenames = set()
+        for filename in repo.git(c='core.quotepath=off').ls_files('-z').split("\0"):
+            if filename != '':
+                filenames.add(filename)
+        self.logger.info('Looking up git mtimes for {} files'.format(len(filenames)))
+
+        # Now walk through the history
+        proc = repo.git(c='core.quotepath=off').log('-z', '--name-only', '--no-renames',
+                '--format=%x00%ct', as_process=True)
+        try:
+            git_mtimes = git_log_mtimes(split_nul(proc.stdout), filenames)
+        finally:
+            proc.terminate()
+        self.logger.info('Read git history in {:.1f}s'.format(time.time() - start_time))
+
+        # And finally set all the mtimes
+        for (idx, (filename, git_mtime)) in enumerate(sorted(git_mtimes.items())):
+            try:
+                os.utime(os.path.join(self.repo_dir, filename.replace('/', os.sep)), (git_mtime, git_mtime))
+            except FileNotFoundError:
+                # Tracked by git, but not in our checkout
+                self.logger.error('Could not set mtime on missing file {}'.format(filename))
+            if (idx+1) % 5000 == 0:
+                self.logger.info('Set mtimes on {}/{} files'.format(idx+1, len(git_mtimes)))
+        for filename in sorted(filenames - set(git_mtimes.keys())):
+            self.logger.error('Could not find git mtime for {}'.format(filename))
+        self.logger.info('Set mtimes on {} files in {:.1f}s'.format(
+            len(git_mtimes), time.time() - start_time))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import glob
+import time
+import appdirs
+import argparse
+import tempfile
+import configparser
+from cabinetsorter.app import CacheCodec, CACHE_CODECS
+
+# Codecs (and levels) to try out.  `None` uses the codec's default level.
+variants = [
+        ('lzma', None),
+        ('lzma', 0),
+        ('zlib', 1),
+        ('zlib', 6),
+        ('gzip', 6),
+        ('none', None),
+        ('marshal', None),
+        ('pickle', None),
+        ]
+
+def best_time(func, iterations):
+    """
+    Runs `func` `iterations` times, returning the fastest time taken
+    and the return value of the final run
+    """
+    best = None
+    for i in range(iterations):
+        start = time.perf_counter()
+        retval = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return (best, retval)
+
+if __name__ == '__main__':
+
+    # Figure out a default INI file location if we weren't passed anything
+    default_config_file = os.path.join(
+            appdirs.user_config_dir('cabinetsorter', 'Apocalyptech'),
+            'cabinetsorter.ini',
+            )
+
+    parser = argparse.ArgumentParser(
+            description='Benchmark the available cache codecs against existing caches',
+            epilog="""
+                Reports the time taken to save and load the given cache
+                files with each available codec (the best of several runs),
+                along with the size of the resulting files.  If no cache
+                files are specified, the caches in the configured cache_dir
+                will be used.
+                """,
+            )
+
+    parser.add_argument('-o', '--config',
+            default=default_config_file,
+            help='Specify a path to a configuration INI file',
+            )
+
+    parser.add_argument('-n', '--iterations',
+            type=int,
+            default=3,
+            help='Number of times to run each save and load',
+            )
+
+    parser.add_argument('filenames',
+            nargs='*',
+            metavar='cache_file',
+            help='Cache files to benchmark against',
+            )
+
+    args = parser.parse_args()
+
+    # Figure out which files we're using
+    filenames = args.filenames
+    if not filenames:
+        if not os.path.exists(args.config):
+            raise Exception('Could not find config file {}'.format(args.config))
+        config = configparser.ConfigParser()
+        config.read(args.config)
+        filenames = sorted(glob.glob(os.path.join(config['cache']['cache_dir'], '*.json.xz')))
+        if not filenames:
+            raise Exception('No cache files found in {}'.format(config['cache']['cache_dir']))
+
+    # Read in all our data
+    caches = []
+    orig_size = 0
+    for filename in filenames:
+        caches.append(CacheCodec.read(filename))
+        orig_size += os.path.getsize(filename)
+    print('Benchmarking against {} cache file(s), {:,} bytes total on disk'.format(
+        len(filenames), orig_size))
+    print('')
+
+    # And now run through our codecs
+    print('{:<12} {:>10} {:>10} {:>14}'.format('Codec', 'Save (ms)', 'Load (ms)', 'Size (bytes)'))
+    print('{:<12} {:>10} {:>10} {:>14}'.format('-'*12, '-'*10, '-'*10, '-'*14))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for (codec_name, level) in variants:
+            codec = CACHE_CODECS[codec_name](level=level)
+            total_save = 0
+            total_load = 0
+            total_size = 0
+            for (idx, data) in enumerate(caches):
+                tmp_filename = os.path.join(tmpdir, 'cache{}'.format(idx))
+                (save_time, _) = best_time(lambda: codec.write(tmp_filename, data), args.iterations)
+                (load_time, loaded) = best_time(lambda: CacheCodec.read(tmp_filename), args.iterations)
+                if loaded['version'] != data['version']:
+                    raise Exception('{} did not round-trip properly'.format(codec_name))
+                total_save += save_time
+                total_load += load_time
+                total_size += os.path.getsize(tmp_filename)
+            if codec.level is None:
+                label = codec_name
+            else:
+                label = '{} ({})'.format(codec_name, codec.level)
+            print('{:<12} {:>10.1f} {:>10.1f} {:>14,}'.format(
+                label, total_save*1000, total_load*1000, total_size))
+            sys.stdout.flush()
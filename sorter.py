@@ -25,7 +25,6 @@ import os
 import sys
 import appdirs
 import argparse
-from cabinetsorter.app import App
 
 if __name__ == '__main__':
 
@@ -53,7 +52,10 @@ if __name__ == '__main__':
                 The -i/--initial argument will also do an initial
                 "first-time-run" task of looping through the github repo
                 setting all file mtimes to be equal to their most-
-                recently-updated timestamp in the git tree.
+                recently-updated timestamp in the git tree.  (If
+                `use_git_hashes` is enabled in the config file, this is not
+                needed to keep the caches valid, though it's still used to
+                report "last updated" times.)
 
                 By default the app will quit early when no update is found in
                 the mods repo, but -f/--force can be used to force it to
@@ -70,6 +72,11 @@ if __name__ == '__main__':
                 To ignore any existing caches and make a run from scratch,
                 specify -x/--ignore-cache.
 
+                By default, only the directories in the mods repo which have
+                changed since the last successful run will be looked at
+                (when caches and git are available).  To walk the entire
+                repo regardless, specify -w/--full-walk.
+
                 """.format(default_config_file)
             )
 
@@ -107,6 +114,12 @@ if __name__ == '__main__':
             help='Ignore any existing cache files and load everything from scratch.',
             )
 
+    parser.add_argument('-w', '--full-walk',
+            dest='incremental',
+            action='store_false',
+            help='Walk the entire mods repo, rather than only the dirs which have changed',
+            )
+
     loggroup = parser.add_mutually_exclusive_group()
 
     loggroup.add_argument('-q', '--quiet',
@@ -125,6 +138,8 @@ if __name__ == '__main__':
     if not os.path.exists(args.config):
         raise Exception('Could not find config file {}'.format(args.config))
 
+    # Don't pull in the app itself until we know we're actually running
+    from cabinetsorter.app import App
     app = App(args.config)
     sys.exit(app.run(
             do_git=args.do_git,
@@ -134,4 +149,5 @@ if __name__ == '__main__':
             quiet=args.quiet,
             verbose=args.verbose,
             load_cache=args.load_cache,
+            incremental=args.incremental,
             ))
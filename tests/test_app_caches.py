@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from cabinetsorter.app import App, FileCache, Readme
+
+class BrokenFileCache(FileCache):
+    """
+    A FileCache which can't be saved
+    """
+
+    def save(self):
+        raise Exception('Disk is on fire')
+
+class AppCachesTests(unittest.TestCase):
+    """
+    Testing loading and saving all of the App's caches at once
+    """
+
+    ini = """
+[mods]
+base_url = https://example.com/tree/
+download_url = https://example.com/raw/
+repo_dir = {tmpdir}/repo
+
+[wiki]
+cabinet_dir = {tmpdir}/wiki
+
+[cache]
+cache_dir = {tmpdir}/cache
+
+[logging]
+log_dir = {tmpdir}/logs
+default_level = CRITICAL
+"""
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.tmpdir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, 'cache'))
+        self.app = App(io.StringIO(self.ini.format(tmpdir=self.tmpdir)))
+        self.cache_filenames = [
+                self.app.cache_filename,
+                self.app.readme_cache_filename,
+                self.app.info_cache_filename,
+                self.app.author_cache_filename,
+                self.app.templatemtime_cache_filename,
+                self.app.page_cache_filename,
+                ]
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def test_save_all(self):
+        self.app.load_caches()
+        self.app.save_caches()
+        for filename in self.cache_filenames:
+            with self.subTest(filename=filename):
+                self.assertTrue(os.path.exists(filename))
+
+    def test_load_saved(self):
+        self.app.load_caches()
+        self.app.author_cache['Author'] = self.app.author_cache.cache_class(0, name='Author')
+        self.app.save_caches()
+        self.app.load_caches()
+        self.assertIn('Author', self.app.author_cache)
+
+    def test_save_one_failure(self):
+        self.app.load_caches()
+        self.app.readme_cache = BrokenFileCache(Readme, self.app.readme_cache_filename)
+        with self.assertLogs(self.app.logger, 'ERROR') as logs:
+            with self.assertRaises(Exception) as cm:
+                self.app.save_caches()
+        self.assertIn(Readme.cache_key, str(cm.exception))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('Disk is on fire', logs.output[0])
+        for filename in self.cache_filenames:
+            with self.subTest(filename=filename):
+                if filename == self.app.readme_cache_filename:
+                    self.assertFalse(os.path.exists(filename))
+                else:
+                    self.assertTrue(os.path.exists(filename))
+
+    def test_save_two_failures(self):
+        self.app.load_caches()
+        self.app.readme_cache = BrokenFileCache(Readme, self.app.readme_cache_filename)
+        self.app.mod_cache = BrokenFileCache(self.app.mod_cache.cache_class, self.app.cache_filename)
+        with self.assertLogs(self.app.logger, 'ERROR') as logs:
+            with self.assertRaises(Exception) as cm:
+                self.app.save_caches()
+        self.assertIn(Readme.cache_key, str(cm.exception))
+        self.assertIn(self.app.mod_cache.cache_class.cache_key, str(cm.exception))
+        self.assertEqual(len(logs.output), 2)
+        self.assertTrue(os.path.exists(self.app.info_cache_filename))
+
+    def test_load_one_failure(self):
+        with open(self.app.readme_cache_filename, 'wb') as df:
+            df.write(b'this is not a cache')
+        with self.assertLogs(self.app.logger, 'ERROR') as logs:
+            with self.assertRaises(Exception) as cm:
+                self.app.load_caches()
+        self.assertIn(self.app.readme_cache_filename, str(cm.exception))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn(self.app.readme_cache_filename, logs.output[0])
+
+        # The other caches should still have loaded
+        self.assertIsNotNone(self.app.mod_cache)
+        self.assertIsNotNone(self.app.author_cache)
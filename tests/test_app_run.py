@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+from cabinetsorter.app import App
+
+class AppRunTestBase(unittest.TestCase):
+    """
+    Base class for tests which do full runs of the App, against a mods
+    repo (and wiki repo) built from scratch in a temp dir.  The mods repo
+    is cloned from an "origin" repo which we commit changes into, so that
+    the App has something to pull.
+    """
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    ini = """
+[mods]
+base_url = https://example.com/tree/
+download_url = https://example.com/raw/
+repo_dir = {tmpdir}/mods
+
+[wiki]
+cabinet_dir = {tmpdir}/{name}/wiki
+
+[cache]
+cache_dir = {tmpdir}/{name}/cache
+
+[processing]
+workers = 1
+
+[logging]
+log_dir = {tmpdir}/{name}/logs
+default_level = CRITICAL
+"""
+
+    initial_files = {
+            'Borderlands 2 mods/Alice/Cool Mod/cabinet.info': 'gear-pistol, qol\n',
+            'Borderlands 2 mods/Alice/Cool Mod/cool.txt': '#<Cool Mod>\n\nThis is cool\n\nset a b c\n',
+            'Borderlands 2 mods/Alice/Other Mod/cabinet.info': 'gear-pistol\n',
+            'Borderlands 2 mods/Alice/Other Mod/other.txt': '#<Other Mod>\n\nSome other mod\n\nset a b c\n',
+            'Borderlands 2 mods/Bob/Broken/cabinet.info': 'notacat\n',
+            'Borderlands 2 mods/Bob/Broken/broken.txt': '#<Broken Mod>\n\nBroken\n\nset a b c\n',
+            'Borderlands 2 mods/Bob/Fine/cabinet.info': 'qol\n',
+            'Borderlands 2 mods/Bob/Fine/fine.txt': '#<Fine Mod>\n\nFine\n\nset a b c\n',
+            'Pre Sequel Mods/Carol/Laser/cabinet.info': 'gear-laser\n',
+            'Pre Sequel Mods/Carol/Laser/laser.txt': '#<Laser Mod>\n\nPew pew\n\nset a b c\n',
+            }
+
+    def setUp(self):
+        """
+        Builds our mods repo, and starts out in the package dir, since the
+        App looks for its templates and static pages relative to that.
+        """
+        self.tmpdir = tempfile.mkdtemp()
+        self.orig_dir = os.getcwd()
+        os.chdir(self.package_dir)
+        self.origin_dir = os.path.join(self.tmpdir, 'origin')
+        self.mods_dir = os.path.join(self.tmpdir, 'mods')
+        os.mkdir(self.origin_dir)
+        self.git(self.origin_dir, 'init', '-q')
+        for (filename, content) in self.initial_files.items():
+            self.write_origin_file(filename, content)
+        self.commit_origin('Initial commit')
+        self.git(self.tmpdir, 'clone', '-q', self.origin_dir, self.mods_dir)
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        os.chdir(self.orig_dir)
+        shutil.rmtree(self.tmpdir)
+
+    def git(self, repo_dir, *args):
+        """
+        Runs a git command inside `repo_dir`, and returns its output
+        """
+        return subprocess.run(['git',
+                '-c', 'user.name=Test',
+                '-c', 'user.email=test@example.com',
+                ] + list(args),
+                cwd=repo_dir,
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                ).stdout.strip()
+
+    def write_origin_file(self, filename, content):
+        """
+        Writes `content` to `filename` inside our origin repo (without
+        committing it)
+        """
+        full_filename = os.path.join(self.origin_dir, filename)
+        os.makedirs(os.path.dirname(full_filename), exist_ok=True)
+        with open(full_filename, 'w') as df:
+            df.write(content)
+
+    def commit_origin(self, message):
+        """
+        Commits everything currently in our origin repo
+        """
+        self.git(self.origin_dir, 'add', '-A')
+        self.git(self.origin_dir, 'commit', '-q', '-m', message)
+
+    def make_app(self, name):
+        """
+        Creates an App with its own wiki repo, cache and logs (all inside
+        a dir named `name`), reading from our shared mods repo.  The wiki
+        repo gets its own bare "remote" so that the App can pull and push.
+        """
+        base_dir = os.path.join(self.tmpdir, name)
+        wiki_src = os.path.join(base_dir, 'wiki_src')
+        os.makedirs(wiki_src)
+        os.mkdir(os.path.join(base_dir, 'cache'))
+        self.git(wiki_src, 'init', '-q')
+        with open(os.path.join(wiki_src, 'Home.md'), 'w') as df:
+            print('Home', file=df)
+        self.git(wiki_src, 'add', 'Home.md')
+        self.git(wiki_src, 'commit', '-q', '-m', 'Initial commit')
+        self.git(base_dir, 'clone', '-q', '--bare', wiki_src, 'wiki.git')
+        self.git(base_dir, 'clone', '-q', 'wiki.git', 'wiki')
+        wiki_dir = os.path.join(base_dir, 'wiki')
+        self.git(wiki_dir, 'config', 'user.name', 'Test')
+        self.git(wiki_dir, 'config', 'user.email', 'test@example.com')
+        return self.load_app(name)
+
+    def load_app(self, name):
+        """
+        Creates a fresh App using the repos and cache set up by `make_app`
+        """
+        return App(io.StringIO(self.ini.format(tmpdir=self.tmpdir, name=name)))
+
+    def run_app(self, app, **args):
+        """
+        Runs `app`, making sure that the run succeeded.  Returns the list of
+        repo-relative dirs which were looked at.
+        """
+        scanned = []
+        orig_find_dir_mods = app.find_dir_mods
+        def find_dir_mods(game, dirinfo):
+            scanned.append(dirinfo.rel_dirpath)
+            return orig_find_dir_mods(game, dirinfo)
+        app.find_dir_mods = find_dir_mods
+        self.assertEqual(app.run(quiet=True, **args), 0)
+        return scanned
+
+    def wiki_pages(self, app):
+        """
+        Returns a dict of all the pages in `app`'s wiki, mapped to their
+        contents (minus the generation time on the status page).
+        """
+        pages = {}
+        for filename in os.listdir(app.cabinet_dir):
+            if filename.endswith('.md'):
+                with open(os.path.join(app.cabinet_dir, filename)) as df:
+                    pages[filename] = [line for line in df if 'this site was' not in line]
+        return pages
+
+class IncrementalRunTests(AppRunTestBase):
+    """
+    Testing that our incremental runs, which only look at the dirs which
+    have changed since the last run, end up with exactly the same wiki
+    as walking the whole mods repo would.
+    """
+
+    def setUp(self):
+        """
+        Creates two apps reading the same mods repo: one doing incremental
+        runs, and one always walking the whole repo.  Both do an initial
+        full run.
+        """
+        super().setUp()
+        self.inc_app = self.make_app('inc')
+        self.full_app = self.make_app('full')
+        self.run_app(self.inc_app, force_run=True)
+        self.run_app(self.full_app, force_run=True, incremental=False)
+        self.assertEqual(self.wiki_pages(self.inc_app), self.wiki_pages(self.full_app))
+
+    def run_both(self):
+        """
+        Runs both of our apps, checks that the resulting wikis are the same,
+        and returns the dirs which the incremental run looked at, plus the
+        resulting wiki pages.  The incremental app is reloaded first, so
+        that its caches get read back in from disk, as they would be for
+        a real run.
+        """
+        self.inc_app = self.load_app('inc')
+        scanned = self.run_app(self.inc_app)
+        full_scanned = self.run_app(self.full_app, force_run=True, incremental=False)
+        self.assertGreater(len(full_scanned), len(scanned))
+        pages = self.wiki_pages(self.inc_app)
+        self.assertEqual(pages, self.wiki_pages(self.full_app))
+        return (scanned, pages)
+
+    def test_initial_run_full(self):
+        self.assertIn('Cool-Mod.md', self.wiki_pages(self.inc_app))
+        self.assertIn('Laser-Mod.md', self.wiki_pages(self.inc_app))
+
+    def test_changed_dir(self):
+        self.write_origin_file('Borderlands 2 mods/Alice/Cool Mod/cool.txt',
+                '#<Cool Mod>\n\nThis is cooler now\n\nset a b c\n')
+        self.commit_origin('Updated Cool Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Alice', 'Cool Mod')])
+        self.assertIn('This is cooler now', ''.join(pages['Cool-Mod.md']))
+
+        # Unchanged mods should still be in their categories
+        self.assertIn('Other Mod', ''.join(pages['BL2-Weapons-Gear:-Pistols.md']))
+        self.assertIn('Fine Mod', ''.join(pages['BL2-Quality-of-Life:-General-QoL.md']))
+
+        # ... without having to unserialize them
+        self.assertEqual([key for (key, mod) in self.inc_app.mod_cache.loaded_items()],
+                [os.path.join('Borderlands 2 mods', 'Alice', 'Cool Mod', 'cool.txt')])
+
+    def test_added_dir(self):
+        self.write_origin_file('Borderlands 2 mods/Dave/New/cabinet.info', 'qol\n')
+        self.write_origin_file('Borderlands 2 mods/Dave/New/new.txt', '#<New Mod>\n\nNew\n\nset a b c\n')
+        self.commit_origin('Added New Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Dave', 'New')])
+        self.assertIn('New-Mod.md', pages)
+        self.assertIn('Dave.md', pages)
+
+    def test_added_name_conflict(self):
+        self.write_origin_file('Borderlands 2 mods/Dave/Fine/cabinet.info', 'qol\n')
+        self.write_origin_file('Borderlands 2 mods/Dave/Fine/fine.txt', '#<Fine Mod>\n\nAlso fine\n\nset a b c\n')
+        self.commit_origin('Added another Fine Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Dave', 'Fine')])
+        self.assertNotIn('Fine-Mod.md', pages)
+        self.assertIn('Fine-Mod-by-Bob.md', pages)
+        self.assertIn('Fine-Mod-by-Dave.md', pages)
+        self.assertIn('Fine%20Mod%20by%20Dave', ''.join(pages['Fine-Mod-by-Bob.md']))
+
+        # The unchanged mod had to be updated, but nothing else did
+        self.assertEqual(sorted([key for (key, mod) in self.inc_app.mod_cache.loaded_items()]), [
+            os.path.join('Borderlands 2 mods', 'Bob', 'Fine', 'fine.txt'),
+            os.path.join('Borderlands 2 mods', 'Dave', 'Fine', 'fine.txt'),
+            ])
+
+    def test_deleted_dir(self):
+        self.git(self.origin_dir, 'rm', '-q', '-r', 'Borderlands 2 mods/Alice/Other Mod')
+        self.commit_origin('Removed Other Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [])
+        self.assertNotIn('Other-Mod.md', pages)
+        self.assertNotIn('Other Mod', ''.join(pages['BL2-Weapons-Gear:-Pistols.md']))
+        self.assertIn('Cool Mod', ''.join(pages['BL2-Weapons-Gear:-Pistols.md']))
+        self.assertNotIn(os.path.join('Borderlands 2 mods', 'Alice', 'Other Mod', 'other.txt'),
+                self.inc_app.mod_cache)
+
+    def test_error_dir_unchanged(self):
+        self.assertIn('notacat', ''.join(self.wiki_pages(self.inc_app)['Wiki-Status.md']))
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Bob', 'Fine')])
+        self.assertIn('notacat', ''.join(pages['Wiki-Status.md']))
+
+    def test_error_dir_fixed(self):
+        self.write_origin_file('Borderlands 2 mods/Bob/Broken/cabinet.info', 'qol\n')
+        self.commit_origin('Fixed Broken Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Bob', 'Broken')])
+        self.assertNotIn('notacat', ''.join(pages['Wiki-Status.md']))
+        self.assertIn('Broken-Mod.md', pages)
+
+    def test_error_dir_order(self):
+        # A full walk visits `Alice` (and everything in it) before `Alice x`,
+        # though `Alice x/...` sorts before `Alice/...` as a plain string.
+        self.write_origin_file('Borderlands 2 mods/Alice/Bad/cabinet.info', 'badcat-one\n')
+        self.write_origin_file('Borderlands 2 mods/Alice/Bad/bad.txt', '#<Bad Mod>\n\nBad\n\nset a b c\n')
+        self.write_origin_file('Borderlands 2 mods/Alice x/Bad/cabinet.info', 'badcat-two\n')
+        self.write_origin_file('Borderlands 2 mods/Alice x/Bad/bad.txt', '#<Bad Mod>\n\nBad\n\nset a b c\n')
+        self.commit_origin('Added some bad mods')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [
+            os.path.join('Borderlands 2 mods', 'Alice', 'Bad'),
+            os.path.join('Borderlands 2 mods', 'Alice x', 'Bad'),
+            ])
+        status = ''.join(pages['Wiki-Status.md'])
+        self.assertLess(status.index('badcat-one'), status.index('badcat-two'))
+
+        # Errors from unchanged dirs should be replayed in the same order
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+        (scanned, pages) = self.run_both()
+        self.assertEqual(scanned, [os.path.join('Borderlands 2 mods', 'Bob', 'Fine')])
+        status = ''.join(pages['Wiki-Status.md'])
+        self.assertLess(status.index('badcat-one'), status.index('badcat-two'))
+
+    def test_unknown_last_hash(self):
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+        with open(self.inc_app.last_commit_filename, 'w') as df:
+            print('0123456789abcdef0123456789abcdef01234567', file=df)
+        scanned = self.run_app(self.inc_app)
+        full_scanned = self.run_app(self.full_app, force_run=True, incremental=False)
+        self.assertEqual(scanned, full_scanned)
+        self.assertEqual(self.wiki_pages(self.inc_app), self.wiki_pages(self.full_app))
+
+    def test_full_walk_option(self):
+        ini_file = os.path.join(self.tmpdir, 'inc', 'test.ini')
+        with open(ini_file, 'w') as df:
+            df.write(self.ini.format(tmpdir=self.tmpdir, name='inc'))
+        for (extra_args, walked) in [([], False), (['-w'], True)]:
+            with self.subTest(extra_args=extra_args):
+                result = subprocess.run([sys.executable, 'sorter.py', '-f', '-v', '-o', ini_file] + extra_args,
+                        cwd=self.package_dir,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        universal_newlines=True,
+                        )
+                self.assertEqual(result.returncode, 0, result.stdout)
+                self.assertEqual('Beginning walkthrough of repo directory' in result.stdout, walked)
+        self.assertEqual(self.wiki_pages(self.inc_app), self.wiki_pages(self.full_app))
+
+class EarlyExitTests(AppRunTestBase):
+    """
+    Testing that we don't do any real work when the mods repo hasn't
+    changed since our last successful run, and that we *do* if the last
+    run didn't finish.
+    """
+
+    def setUp(self):
+        """
+        Creates an app, and does an initial successful run with it
+        """
+        super().setUp()
+        self.make_app('app').run(quiet=True, force_run=True)
+        self.app = self.load_app('app')
+        self.setup_calls = self.watch_setup(self.app)
+
+    def watch_setup(self, app):
+        """
+        Keeps track of when `app` loads its caches or templates.  Returns
+        the list which those calls are recorded in.
+        """
+        calls = []
+        for method_name in ['load_caches', 'load_templates']:
+            orig_method = getattr(app, method_name)
+            def watched(*args, method_name=method_name, orig_method=orig_method, **kwargs):
+                calls.append(method_name)
+                return orig_method(*args, **kwargs)
+            setattr(app, method_name, watched)
+        return calls
+
+    def last_commit(self):
+        """
+        Returns the contents of our app's last commit file, or `None`
+        """
+        if not os.path.exists(self.app.last_commit_filename):
+            return None
+        with open(self.app.last_commit_filename) as df:
+            return df.read().strip()
+
+    def test_no_update(self):
+        last_commit = self.last_commit()
+        self.assertEqual(last_commit, self.git(self.mods_dir, 'rev-parse', 'HEAD'))
+        self.run_app(self.app)
+        self.assertEqual(self.setup_calls, [])
+        self.assertEqual(self.last_commit(), last_commit)
+
+    def test_update(self):
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+        self.run_app(self.app)
+        self.assertEqual(self.setup_calls, ['load_caches', 'load_templates'])
+        self.assertEqual(self.last_commit(), self.git(self.origin_dir, 'rev-parse', 'HEAD'))
+
+    def test_missing_last_commit(self):
+        os.unlink(self.app.last_commit_filename)
+        self.run_app(self.app)
+        self.assertEqual(self.setup_calls, ['load_caches', 'load_templates'])
+        self.assertEqual(self.last_commit(), self.git(self.mods_dir, 'rev-parse', 'HEAD'))
+
+    def test_stale_last_commit(self):
+        first_commit = self.git(self.origin_dir, 'rev-parse', 'HEAD')
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+        self.git(self.mods_dir, 'pull', '-q')
+        self.assertEqual(self.last_commit(), first_commit)
+        self.run_app(self.app)
+        self.assertEqual(self.setup_calls, ['load_caches', 'load_templates'])
+        self.assertEqual(self.last_commit(), self.git(self.origin_dir, 'rev-parse', 'HEAD'))
+
+    def test_failed_run(self):
+        first_commit = self.last_commit()
+        self.write_origin_file('Borderlands 2 mods/Bob/Fine/fine.txt',
+                '#<Fine Mod>\n\nStill fine\n\nset a b c\n')
+        self.commit_origin('Updated Fine Mod')
+
+        # Fail partway through processing
+        def process_dir(*args):
+            raise Exception('Processing failed')
+        self.app.process_dir = process_dir
+        self.assertEqual(self.app.run(quiet=True), 1)
+        self.assertEqual(self.last_commit(), first_commit)
+
+        # The next run should pick up where we left off, even though there's
+        # nothing new to pull.
+        self.app = self.load_app('app')
+        setup_calls = self.watch_setup(self.app)
+        self.run_app(self.app)
+        self.assertEqual(setup_calls, ['load_caches', 'load_templates'])
+        self.assertEqual(self.last_commit(), self.git(self.origin_dir, 'rev-parse', 'HEAD'))
+        self.assertIn('Still fine', ''.join(self.wiki_pages(self.app)['Fine-Mod.md']))
+
+class InitialTasksTests(AppRunTestBase):
+    """
+    Testing our first-time setup, which sets the mtimes of everything in
+    the mods repo checkout to their git commit times.
+    """
+
+    def setUp(self):
+        """
+        Creates our App, and commits some files with awkward names, which
+        git would quote if we let it.
+        """
+        super().setUp()
+        self.odd_filenames = [
+                'Borderlands 2 mods/Alice/Cool Mod/tab\tname.txt',
+                'Borderlands 2 mods/Alice/Cool Mod/quote"name.txt',
+                'Borderlands 2 mods/Alice/Cool Mod/back\\slash.txt',
+                'Borderlands 2 mods/Alice/Cool Mod/café.txt',
+                ]
+        for filename in self.odd_filenames:
+            self.write_origin_file(filename, 'Odd\n')
+        self.commit_origin('Added some oddly-named files')
+        self.git(self.mods_dir, 'pull', '-q')
+        self.app = self.make_app('app')
+
+    def check_mtimes(self, filenames):
+        """
+        Zeroes out the mtimes of `filenames` in our mods checkout, runs our
+        initial tasks, and checks that they've been set to git's timestamps
+        """
+        for filename in filenames:
+            os.utime(os.path.join(self.mods_dir, filename), (0, 0))
+        with self.assertNoLogs(self.app.logger, level='ERROR'):
+            self.app.do_initial_tasks()
+        for filename in filenames:
+            with self.subTest(filename=filename):
+                git_mtime = int(self.git(self.mods_dir, 'log', '-1', '--format=%ct', '--', filename))
+                self.assertEqual(os.stat(os.path.join(self.mods_dir, filename)).st_mtime, git_mtime)
+
+    def test_mtimes(self):
+        self.check_mtimes(list(self.initial_files.keys()))
+
+    def test_quoted_filenames(self):
+        self.check_mtimes(self.odd_filenames)
+
+    def test_missing_file(self):
+        missing = 'Borderlands 2 mods/Bob/Fine/fine.txt'
+        os.unlink(os.path.join(self.mods_dir, missing))
+        with self.assertLogs(self.app.logger, level='ERROR') as cm:
+            self.app.do_initial_tasks()
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn(missing, cm.output[0])
+        self.assertFalse(os.path.exists(os.path.join(self.mods_dir, missing)))
+        filename = 'Borderlands 2 mods/Bob/Fine/cabinet.info'
+        git_mtime = int(self.git(self.mods_dir, 'log', '-1', '--format=%ct', '--', filename))
+        self.assertEqual(os.stat(os.path.join(self.mods_dir, filename)).st_mtime, git_mtime)
@@ -23,7 +23,7 @@
 
 import io
 import unittest
-from cabinetsorter.app import CabinetInfo
+from cabinetsorter.app import CabinetInfo, CabinetInfoError, Cacheable
 
 class CabinetInfoLoadTests(unittest.TestCase):
     """
@@ -216,3 +216,56 @@ class CabinetInfoLoadTests(unittest.TestCase):
         self.assertEqual(self.info['modname2'].categories, ['cat2'])
         self.assertEqual(self.info['modname'].urls, [url])
         self.assertEqual(self.info['modname2'].urls, [])
+
+    def test_errors_recorded(self):
+        self.load([
+            'modname: cat1',
+            'modname: cat2',
+            'modname2: cat3',
+            ])
+        self.assertEqual(self.info.has_errors(), True)
+        self.assertEqual(self.info.parse_errors, [
+            CabinetInfoError('ERROR', 'modname specified twice inside `cabinet.info`'),
+            CabinetInfoError('WARNING', 'Invalid category "cat3" in `cabinet.info`'),
+            CabinetInfoError('ERROR', 'No categories found for modname2 in `cabinet.info`'),
+            ])
+        self.assertEqual(self.info.error_reports(), self.errors)
+
+    def test_no_errors_recorded(self):
+        self.load([
+            'modname: cat1',
+            ])
+        self.assertEqual(self.info.has_errors(), False)
+        self.assertEqual(self.info.parse_errors, [])
+
+    def test_errors_serialized(self):
+        self.load([
+            'modname: cat1',
+            'http://site.com/foo',
+            'unknown line',
+            ])
+        self.info.set_dir_errors([CabinetInfoError('ERROR', 'Invalid modfile `modname` specified in `cabinet.info`')])
+        serialized = self.info.serialize()
+        self.assertEqual(CabinetInfo.serialized_error_reports(serialized), [
+            'ERROR: Unknown line "unknown line" inside `cabinet.info`',
+            'ERROR: Invalid modfile `modname` specified in `cabinet.info`',
+            ])
+        new_info = CabinetInfo.unserialize(CabinetInfo, serialized)
+        self.assertEqual(new_info.parse_errors, self.info.parse_errors)
+        self.assertEqual(new_info.dir_errors, self.info.dir_errors)
+        self.assertEqual(new_info.error_reports(), CabinetInfo.serialized_error_reports(serialized))
+
+    def test_set_dir_errors_status(self):
+        self.load([
+            'modname: cat1',
+            ])
+        self.info.status = Cacheable.S_CACHED
+        self.info.set_dir_errors([])
+        self.assertEqual(self.info.status, Cacheable.S_CACHED)
+        error = CabinetInfoError('ERROR', 'Invalid modfile `modname` specified in `cabinet.info`')
+        self.info.set_dir_errors([error])
+        self.assertEqual(self.info.status, Cacheable.S_UPDATED)
+        self.assertEqual(self.info.has_errors(), True)
+        self.info.status = Cacheable.S_CACHED
+        self.info.set_dir_errors([error])
+        self.assertEqual(self.info.status, Cacheable.S_CACHED)
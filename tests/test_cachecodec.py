@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import lzma
+import json
+import shutil
+import unittest
+import tempfile
+from cabinetsorter.app import CacheCodec, CACHE_CODECS, LZMACodec, FileCache, ModFile
+
+class CacheCodecTests(unittest.TestCase):
+    """
+    Test our cache codecs
+    """
+
+    data = {
+            'version': 1,
+            'mods': {
+                '/foo': {'t': 'Foo', 'd': ['one', 'two'], 'm': 42, 'n': None},
+                '/bar': {'t': 'Bär', 'd': [], 'm': 84.5, 'q': True},
+                },
+            }
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'cache')
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        for (name, codec_class) in CACHE_CODECS.items():
+            with self.subTest(codec=name):
+                codec_class().write(self.filename, self.data)
+                self.assertEqual(CacheCodec.read(self.filename), self.data)
+
+    def test_round_trip_levels(self):
+        for (name, level) in [('lzma', 0), ('zlib', 1), ('gzip', 9)]:
+            with self.subTest(codec=name, level=level):
+                CACHE_CODECS[name](level=level).write(self.filename, self.data)
+                self.assertEqual(CacheCodec.read(self.filename), self.data)
+
+    def test_lzma_legacy_write(self):
+        LZMACodec().write(self.filename, self.data)
+        with lzma.open(self.filename, 'rt', encoding='utf-8') as df:
+            self.assertEqual(json.load(df), self.data)
+
+    def test_lzma_legacy_read(self):
+        with lzma.open(self.filename, 'wt', encoding='utf-8') as df:
+            json.dump(self.data, df)
+        self.assertEqual(CacheCodec.read(self.filename), self.data)
+
+    def test_header(self):
+        for (name, codec_class) in CACHE_CODECS.items():
+            if name == 'lzma':
+                continue
+            with self.subTest(codec=name):
+                codec_class().write(self.filename, self.data)
+                with open(self.filename, 'rb') as df:
+                    self.assertEqual(df.readline(), 'CSCACHE {}\n'.format(name).encode('ascii'))
+
+    def test_unknown_format(self):
+        with open(self.filename, 'wb') as df:
+            df.write(b'{"version": 1}')
+        with self.assertRaises(Exception):
+            CacheCodec.read(self.filename)
+
+    def test_unknown_codec(self):
+        with open(self.filename, 'wb') as df:
+            df.write(b'CSCACHE bogus\n{"version": 1}')
+        with self.assertRaises(Exception):
+            CacheCodec.read(self.filename)
+
+    def test_filecache_switch_codec(self):
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        cache = FileCache(ModFile, self.filename, codec=CACHE_CODECS['zlib']())
+        cache['/foo'] = mod
+        cache.save()
+
+        # Loading should work regardless of the codec we're set to save with
+        cache = FileCache(ModFile, self.filename, codec=CACHE_CODECS['marshal']())
+        self.assertEqual(cache['/foo'].mod_title, 'Testing Mod')
+        cache['/foo'].set_categories(['cat1'])
+        cache.save()
+        with open(self.filename, 'rb') as df:
+            self.assertEqual(df.readline(), b'CSCACHE marshal\n')
+
+        cache = FileCache(ModFile, self.filename)
+        self.assertEqual(cache['/foo'].mod_title, 'Testing Mod')
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import unittest
+from cabinetsorter.app import Category, CategoryPage, Game, ModFile
+
+class CategorySplitTests(unittest.TestCase):
+    """
+    Testing how we split large categories up into alphabetical sub-pages
+    """
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.cat = Category('Weapons/Gear: Pistols')
+        self.game = Game('BL2', 'Borderlands 2 mods', 'Borderlands 2')
+
+    def make_mods(self, titles):
+        """
+        Creates a list of mods with the given `titles`
+        """
+        mods = []
+        for title in titles:
+            mod = ModFile(0)
+            mod.mod_title = title
+            mods.append(mod)
+        return mods
+
+    def test_title_letter(self):
+        for (title, letter) in [
+                ('Alpha', 'A'),
+                ('alpha', 'A'),
+                ('Zed', 'Z'),
+                ('42 Things', '0'),
+                ('[Bracketed]', '0'),
+                ('Échec', '0'),
+                ]:
+            with self.subTest(title=title):
+                self.assertEqual(self.make_mods([title])[0].title_letter(), letter)
+
+    def test_no_split_small(self):
+        mods = self.make_mods(['Alpha', 'Bravo', 'Charlie'])
+        self.assertEqual(self.cat.split_pages(mods, 3), [])
+
+    def test_no_split_disabled(self):
+        mods = self.make_mods(['Alpha', 'Bravo', 'Charlie'])
+        self.assertEqual(self.cat.split_pages(mods, 0), [])
+
+    def test_no_split_one_letter(self):
+        mods = self.make_mods(['Alpha', 'Apple', 'Aardvark'])
+        self.assertEqual(self.cat.split_pages(mods, 1), [])
+
+    def test_split(self):
+        mods = self.make_mods(['Charlie', 'alpha', 'Bravo', 'Delta', '1st', 'Echo', 'Apple'])
+        pages = self.cat.split_pages(mods, 3)
+        self.assertEqual([p.label for p in pages], ['0-A', 'B-D', 'E'])
+        self.assertEqual([sorted(m.mod_title for m in p.mods) for p in pages], [
+            ['1st', 'Apple', 'alpha'],
+            ['Bravo', 'Charlie', 'Delta'],
+            ['Echo'],
+            ])
+
+    def test_split_large_letter(self):
+        mods = self.make_mods(['Alpha', 'Bravo', 'Bad', 'Box', 'Charlie'])
+        pages = self.cat.split_pages(mods, 2)
+        self.assertEqual([p.label for p in pages], ['A', 'B', 'C'])
+        self.assertEqual(len(pages[1].mods), 3)
+
+    def test_page_filename(self):
+        page = CategoryPage(self.cat, 'A')
+        page.add_mods('F', [])
+        self.assertEqual(page.wiki_filename(self.game), 'BL2-Weapons-Gear:-Pistols-(A-F).md')
+        self.assertEqual(page.wiki_link(self.game),
+                '<a href="BL2%20Weapons%20Gear%3A%20Pistols%20%28A-F%29">A-F</a>')
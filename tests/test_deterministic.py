@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import unittest
+import subprocess
+
+class DeterministicOutputTests(unittest.TestCase):
+    """
+    Testing that our rendered pages and serialized caches don't depend on
+    Python's hash randomization, so that nothing changes between runs
+    unless something has actually changed.
+    """
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Builds a little catalog of mods sharing names, categories and authors,
+    # then prints out their rendered pages and serialized cache data.
+    render_script = """
+import json
+import jinja2
+from cabinetsorter.app import App, ModFile, Author
+
+env = jinja2.Environment(loader=jinja2.FileSystemLoader(App.template_dir))
+mods = []
+for num in range(12):
+    mods.append(ModFile.unserialize(ModFile, {
+        'rp': 'Borderlands 2 mods/Author {}'.format(num % 3),
+        'rf': 'mod{}.txt'.format(num),
+        'w': 'Shared Mod {} {}'.format(num % 2, num),
+        'a': 'Author {}'.format(num % 3),
+        't': 'Shared Mod {}'.format(num % 2),
+        'i': 'Shared Mod {} {}'.format(num % 2, num),
+        'd': None, 'q': True, 'r': None, 'l': None, 'o': None,
+        'e': [], 'n': None, 's': [], 'y': [], 'u': [],
+        'c': ['qol', 'gear-general', 'scaling', 'cheat'],
+        'g': ['BL2', 'TPS'][num % 2],
+        'm': 0,
+        }))
+authors = {}
+for mod in mods:
+    mod.set_related_links(set([m for m in mods if m is not mod]))
+    if mod.mod_author not in authors:
+        authors[mod.mod_author] = Author(0, name=mod.mod_author)
+    authors[mod.mod_author].add_mod(mod)
+for mod in mods:
+    print(env.get_template('mod.md').render({
+        'mod': mod,
+        'authors': authors,
+        'cats': App.categories,
+        'base_url': 'https://example.com/',
+        'dl_base_url': 'https://example.com/',
+        }))
+    print(json.dumps(mod.serialize()))
+for author in authors.values():
+    author.check_modlist()
+    print(env.get_template('author.md').render({
+        'author': author,
+        'games': App.games,
+        'base_url': 'https://example.com/',
+        }))
+    print(json.dumps(author.serialize()))
+print([m.mod_title_display for m in sorted(mods)])
+"""
+
+    def render(self, hash_seed):
+        """
+        Renders our catalog in a new interpreter, using the given hash seed
+        """
+        env = dict(os.environ)
+        env['PYTHONHASHSEED'] = str(hash_seed)
+        return subprocess.run([sys.executable, '-c', self.render_script],
+                cwd=self.base_dir,
+                env=env,
+                check=True,
+                stdout=subprocess.PIPE,
+                ).stdout
+
+    def test_hash_seeds(self):
+        first = self.render(0)
+        self.assertIn(b'Shared Mod', first)
+        for hash_seed in [1, 2, 3, 42, 1234]:
+            with self.subTest(hash_seed=hash_seed):
+                self.assertEqual(self.render(hash_seed), first)
@@ -25,7 +25,7 @@ import os
 import shutil
 import unittest
 import tempfile
-from cabinetsorter.app import DirInfo
+from cabinetsorter.app import DirInfo, scan_dir, walk_dir
 
 class DirInfoTests(unittest.TestCase):
     """
@@ -108,6 +108,22 @@ class DirInfoTests(unittest.TestCase):
         self.assertEqual(info.get_all_with_ext('txt'), [filename])
         self.assertEqual(info.readme, filename)
 
+    def test_hash(self):
+        dirname = 'BL2 Mods/Username'
+        filename = 'Filename.txt'
+        full_path = os.path.join(self.base_dir, dirname)
+        info = DirInfo(self.base_dir, full_path, [filename],
+                blob_hashes={os.path.join(dirname, filename): 'abcdef'})
+        self.assertEqual(info.get_hash('filename.txt'), 'abcdef')
+
+    def test_hash_unknown(self):
+        dirname = 'BL2 Mods/Username'
+        full_path = os.path.join(self.base_dir, dirname)
+        info = DirInfo(self.base_dir, full_path, ['filename.txt'], blob_hashes={})
+        self.assertEqual(info.get_hash('filename.txt'), None)
+        info = DirInfo(self.base_dir, full_path, ['filename.txt'])
+        self.assertEqual(info.get_hash('filename.txt'), None)
+
     def test_readme_inner(self):
         dirname = 'BL2 Mods/Username'
         filename = 'zzzreadmezzz.txt'
@@ -116,3 +132,72 @@ class DirInfoTests(unittest.TestCase):
         self.assertEqual(info.get_all_with_ext('txt'), [filename])
         self.assertEqual(info.readme, filename)
 
+class DirInfoEntryTests(unittest.TestCase):
+    """
+    Testing our DirInfo class when it's fed `os.DirEntry` objects from
+    `scan_dir`/`walk_dir`, rather than plain filenames.
+    """
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def make_file(self, path, filename, mtime=None):
+        """
+        Creates an empty file named `filename` inside `path` (relative to our
+        tmpdir), optionally setting its mtime.
+        """
+        full_path = os.path.join(self.tmpdir, path)
+        os.makedirs(full_path, exist_ok=True)
+        full_file = os.path.join(full_path, filename)
+        with open(full_file, 'w') as df:
+            df.write('testing')
+        if mtime is not None:
+            os.utime(full_file, times=(mtime, mtime))
+        return full_file
+
+    def test_scan_dir(self):
+        self.make_file('', 'filename.txt')
+        os.makedirs(os.path.join(self.tmpdir, 'subdir'))
+        (entries, subdirs) = scan_dir(self.tmpdir)
+        self.assertEqual([e.name for e in entries], ['filename.txt'])
+        self.assertEqual(subdirs, [os.path.join(self.tmpdir, 'subdir')])
+
+    def test_walk_dir(self):
+        self.make_file('', 'top.txt')
+        self.make_file('BL2 Mods/Username', 'inner.txt')
+        seen = dict([(dirpath, [e.name for e in entries]) for (dirpath, entries) in walk_dir(self.tmpdir)])
+        self.assertEqual(seen, {
+            self.tmpdir: ['top.txt'],
+            os.path.join(self.tmpdir, 'BL2 Mods'): [],
+            os.path.join(self.tmpdir, 'BL2 Mods', 'Username'): ['inner.txt'],
+            })
+
+    def test_walk_dir_missing(self):
+        self.assertEqual(list(walk_dir(os.path.join(self.tmpdir, 'doesnotexist'))), [])
+
+    def test_entries(self):
+        dirname = 'BL2 Mods/Username'
+        full_file = self.make_file(dirname, 'Filename.txt', mtime=42)
+        (entries, subdirs) = scan_dir(os.path.join(self.tmpdir, dirname))
+        info = DirInfo(self.tmpdir, os.path.join(self.tmpdir, dirname), entries)
+        self.assertEqual(info.dir_author, 'Username')
+        self.assertIn('filename.txt', info)
+        self.assertEqual(info['filename.txt'], full_file)
+        self.assertEqual(info.get_all_with_ext('txt'), ['filename.txt'])
+        self.assertEqual(info.get_mtime('filename.txt'), 42)
+        self.assertEqual(info.get_stat('FILENAME.TXT').st_size, 7)
+
+    def test_mtime_without_entries(self):
+        dirname = 'BL2 Mods/Username'
+        self.make_file(dirname, 'filename.txt', mtime=42)
+        info = DirInfo(self.tmpdir, os.path.join(self.tmpdir, dirname), ['filename.txt'])
+        self.assertEqual(info.get_mtime('filename.txt'), 42)
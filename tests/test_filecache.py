@@ -123,6 +123,63 @@ class FileCacheTests(unittest.TestCase):
         self.assertIn('filename', cache)
         self.assertEqual(cache['filename'].mod_title, 'Testing Mod')
 
+    def test_mod_lazy(self):
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        mod2 = ModFile(0)
+        mod2.mod_title = 'Testing Mod 2'
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                'filename': mod.serialize(),
+                'filename2': mod2.serialize(),
+                }
+            })
+        cache = FileCache(ModFile, filename)
+        self.assertEqual(cache.mapping.raw_keys, set(['filename', 'filename2']))
+        self.assertIn('filename', cache)
+        self.assertEqual(cache.peek('filename')['t'], 'Testing Mod')
+        self.assertEqual(cache.mapping.raw_keys, set(['filename', 'filename2']))
+        self.assertEqual(cache['filename'].mod_title, 'Testing Mod')
+        self.assertEqual(cache.mapping.raw_keys, set(['filename2']))
+        self.assertEqual(cache.peek('filename')['t'], 'Testing Mod')
+        self.assertEqual(list(cache.keys()), ['filename', 'filename2'])
+        self.assertEqual(cache.mapping.raw_keys, set(['filename2']))
+
+    def test_migrate_v1_keys(self):
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        mod2 = ModFile(0)
+        mod2.mod_title = 'Testing Mod 2'
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                '/repo/dir/game/author/mod.txt': mod.serialize(),
+                'templates/mod.md': mod2.serialize(),
+                }
+            })
+        cache = FileCache(ModFile, filename, repo_dir='/repo/dir')
+        self.assertEqual(sorted(cache.keys()), ['game/author/mod.txt', 'templates/mod.md'])
+        self.assertEqual(cache['game/author/mod.txt'].mod_title, 'Testing Mod')
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        with lzma.open(filename, 'rt', encoding='utf-8') as df:
+            saved = json.load(df)
+            self.assertEqual(saved['version'], FileCache.cache_version)
+            self.assertIn('game/author/mod.txt', saved[ModFile.cache_key])
+
+    def test_migrate_v1_keys_no_repo_dir(self):
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                '/repo/dir/game/author/mod.txt': mod.serialize(),
+                }
+            })
+        cache = FileCache(ModFile, filename)
+        self.assertEqual(list(cache.keys()), ['/repo/dir/game/author/mod.txt'])
+
     def test_mod_two(self):
         mod = ModFile(0)
         mod.mod_title = 'Testing Mod'
@@ -242,6 +299,97 @@ class FileCacheTests(unittest.TestCase):
             self.assertEqual(len(saved[ModFile.cache_key]), 1)
             self.assertIn('filename', saved[ModFile.cache_key])
 
+    def test_save_mod_lazy(self):
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        mod2 = ModFile(0)
+        mod2.mod_title = 'Testing Mod 2'
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                'filename': mod.serialize(),
+                'filename2': mod2.serialize(),
+                }
+            })
+        cache = FileCache(ModFile, filename)
+        cache['filename'].set_categories(['cat1'])
+        cache.save()
+        self.assertEqual(cache.mapping.raw_keys, set(['filename2']))
+        cache = FileCache(ModFile, filename)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache['filename'].categories, set(['cat1']))
+        self.assertEqual(cache['filename2'].mod_title, 'Testing Mod 2')
+
+    def create_clean_cache(self):
+        """
+        Creates a cache with a couple of mods in it, and returns a
+        freshly-loaded FileCache for it.  The cache file's mtime is
+        set to the distant past, so we can tell if it gets rewritten.
+        """
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        mod2 = ModFile(0)
+        mod2.mod_title = 'Testing Mod 2'
+        filename = self.create_cache('cache', {
+            'version': FileCache.cache_version,
+            ModFile.cache_key: {
+                'filename': mod.serialize(),
+                'filename2': mod2.serialize(),
+                }
+            })
+        os.utime(filename, times=(42, 42))
+        return FileCache(ModFile, filename)
+
+    def test_save_clean(self):
+        cache = self.create_clean_cache()
+        for mod in cache.values():
+            self.assertEqual(mod.status, ModFile.S_CACHED)
+        self.assertFalse(cache.is_dirty())
+        cache.save()
+        self.assertEqual(os.stat(cache.filename).st_mtime, 42)
+
+    def test_save_dirty_updated(self):
+        cache = self.create_clean_cache()
+        cache['filename'].set_categories(['cat1'])
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        self.assertNotEqual(os.stat(cache.filename).st_mtime, 42)
+        self.assertFalse(os.path.exists('{}.tmp'.format(cache.filename)))
+        cache = FileCache(ModFile, cache.filename)
+        self.assertEqual(cache['filename'].categories, set(['cat1']))
+
+    def test_save_dirty_setitem(self):
+        cache = self.create_clean_cache()
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod 3'
+        cache['filename3'] = mod
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        cache = FileCache(ModFile, cache.filename)
+        self.assertEqual(len(cache), 3)
+
+    def test_save_dirty_delitem(self):
+        cache = self.create_clean_cache()
+        del cache['filename']
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        cache = FileCache(ModFile, cache.filename)
+        self.assertEqual(list(cache.keys()), ['filename2'])
+
+    def test_save_dirty_once(self):
+        cache = self.create_clean_cache()
+        del cache['filename']
+        cache.save()
+        self.assertFalse(cache.is_dirty())
+
+    def test_save_dirty_no_load(self):
+        cache = self.create_clean_cache()
+        cache = FileCache(ModFile, cache.filename, do_load=False)
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        cache = FileCache(ModFile, cache.filename)
+        self.assertEqual(len(cache), 0)
+
     def test_save_mod_two(self):
         mod = ModFile(0)
         mod.mod_title = 'Testing Mod'
@@ -398,172 +546,367 @@ class FileCacheTests(unittest.TestCase):
             cache.load(dirinfo, 'filename')
 
     def test_load_mod_new_file(self):
-        mod_filename = self.make_file('', 'filename', ['testing'], mtime=42)
+        self.make_file('', 'filename', ['testing'], mtime=42)
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(ModFile, cache_filename)
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         loaded_mod = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_NEW)
-        self.assertIn(mod_filename, cache)
+        self.assertIn('filename', cache)
         self.assertEqual(loaded_mod.mod_desc, ['testing'])
 
     def test_load_mod_same_mtimes(self):
-        mod_filename = self.make_file('', 'filename', ['testing'], mtime=42)
+        self.make_file('', 'filename', ['testing'], mtime=42)
         mod = ModFile(42)
         mod.mod_title = 'Testing Mod'
         mod.mod_desc = ['no overwrite']
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(ModFile, cache_filename)
-        cache.mapping[mod_filename] = mod
+        cache.mapping['filename'] = mod
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         loaded_mod = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
-        self.assertIn(mod_filename, cache)
+        self.assertIn('filename', cache)
         self.assertEqual(loaded_mod.mod_desc, ['no overwrite'])
 
     def test_load_mod_newer(self):
-        mod_filename = self.make_file('', 'filename', ['testing'], mtime=84)
+        self.make_file('', 'filename', ['testing'], mtime=84)
         mod = ModFile(42)
         mod.mod_title = 'Testing Mod'
         mod.mod_desc = ['overwrite']
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(ModFile, cache_filename)
-        cache.mapping[mod_filename] = mod
+        cache.mapping['filename'] = mod
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_UPDATED)
+        self.assertIn('filename', cache)
+        self.assertEqual(loaded_mod.mod_desc, ['testing'])
+
+    def test_load_mod_newer_inherits(self):
+        self.make_file('', 'filename', ['testing'], mtime=84)
+        mod = ModFile(42)
+        mod.mod_title = 'filename'
+        mod.mod_desc = ['overwrite']
+        mod.wiki_filename_base = 'filename'
+        mod.set_categories(['cat1'])
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # The reloaded mod should keep the data which the App fills in
+        # later, and only flag the parsed fields which actually changed.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertEqual(loaded_mod.status, ModFile.S_UPDATED)
+        self.assertEqual(loaded_mod.categories, {'cat1'})
+        self.assertEqual(loaded_mod.prev_categories, {'cat1'})
+        self.assertEqual(loaded_mod.wiki_filename_base, 'filename')
+        self.assertEqual(loaded_mod.changed_fields, ModFile.F_FILE | ModFile.F_DESC)
+
+        loaded_mod.set_categories(['cat2'])
+        self.assertEqual(loaded_mod.prev_categories, {'cat1'})
+        self.assertTrue(loaded_mod.changed_fields & ModFile.F_CATEGORIES)
+
+    def test_load_mod_precomputed_mtime(self):
+        self.make_file('', 'filename', ['testing'], mtime=84)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['no overwrite']
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird.  The mtime we pass
+        # in should win out over the one on disk.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
+        loaded_mod = cache.load(dirinfo, 'filename', mtime=42)
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        self.assertEqual(loaded_mod.mod_desc, ['no overwrite'])
+
+    def test_load_mod_same_hash(self):
+        self.make_file('', 'filename', ['testing'], mtime=84)
+        mod = ModFile(42)
+        mod.blob_hash = 'abcdef'
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['no overwrite']
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird.  Matching hashes
+        # should win out over the differing mtime.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'], blob_hashes={'filename': 'abcdef'})
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        self.assertEqual(loaded_mod.mtime, 42)
+        self.assertEqual(loaded_mod.mod_desc, ['no overwrite'])
+
+    def test_load_mod_different_hash(self):
+        self.make_file('', 'filename', ['testing'], mtime=42)
+        mod = ModFile(42)
+        mod.blob_hash = 'abcdef'
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['overwrite']
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird.  Differing hashes
+        # should win out over the matching mtime.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'], blob_hashes={'filename': '123456'})
         loaded_mod = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_UPDATED)
-        self.assertIn(mod_filename, cache)
+        self.assertEqual(loaded_mod.blob_hash, '123456')
+        self.assertEqual(loaded_mod.mod_desc, ['testing'])
+
+    def test_load_mod_hash_learned(self):
+        self.make_file('', 'filename', ['testing'], mtime=42)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['no overwrite']
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird.  With no cached
+        # hash, we fall back to mtimes, but should remember the hash.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'], blob_hashes={'filename': 'abcdef'})
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        self.assertEqual(loaded_mod.blob_hash, 'abcdef')
+        self.assertEqual(loaded_mod.serialize()['h'], 'abcdef')
+
+    def test_load_many_mod_serial(self):
+        self.make_file('', 'file1', ['one'], mtime=42)
+        self.make_file('', 'file2', ['two'], mtime=42)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['no overwrite']
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['file2'] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['file1', 'file2'])
+        loaded = cache.load_many([
+            (dirinfo, 'file1', {'game': 'BL2'}),
+            (dirinfo, 'file2', {'game': 'BL2'}),
+            ])
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0].status, ModFile.S_NEW)
+        self.assertEqual(loaded[0].mod_desc, ['one'])
+        self.assertEqual(loaded[0].game, 'BL2')
+        self.assertIs(cache['file1'], loaded[0])
+        self.assertEqual(loaded[1].status, ModFile.S_CACHED)
+        self.assertEqual(loaded[1].mod_desc, ['no overwrite'])
+
+    def test_load_many_mod_parallel(self):
+        filenames = []
+        for num in range(10):
+            filename = 'file{}'.format(num)
+            self.make_file('', filename, ['mod {}'.format(num)], mtime=42)
+            filenames.append(filename)
+        cache = FileCache(ModFile, os.path.join(self.tmpdir, 'cache'))
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, filenames,
+                blob_hashes=dict([(f, 'hash{}'.format(f)) for f in filenames]))
+        loaded = cache.load_many(
+                [(dirinfo, filename, {'game': 'TPS'}) for filename in filenames],
+                workers=2, min_parallel=2)
+        self.assertEqual(len(loaded), 10)
+        for (num, (filename, mod)) in enumerate(zip(filenames, loaded)):
+            self.assertEqual(mod.status, ModFile.S_NEW)
+            self.assertEqual(mod.mod_desc, ['mod {}'.format(num)])
+            self.assertEqual(mod.game, 'TPS')
+            self.assertEqual(mod.blob_hash, 'hash{}'.format(filename))
+            self.assertIs(cache[filename], mod)
+
+    def test_load_mod_hash_learned_dirty(self):
+        self.make_file('', 'filename', ['testing'], mtime=42)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping['filename'] = mod
+        cache.save()
+
+        # Learning a hash doesn't change the status, but we still want
+        # the hash to be saved.
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'], blob_hashes={'filename': 'abcdef'})
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        self.assertTrue(cache.is_dirty())
+        cache.save()
+        cache = FileCache(ModFile, cache_filename)
+        self.assertEqual(cache['filename'].blob_hash, 'abcdef')
+
+    def test_load_mod_relocated(self):
+        self.make_file('game/author', 'filename', ['testing'], mtime=42)
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        repo_dir = os.path.join(self.tmpdir, 'game')
+        dirinfo = DirInfo(self.tmpdir, os.path.join(self.tmpdir, 'game', 'author'), ['filename'])
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertEqual(loaded_mod.status, ModFile.S_NEW)
+        self.assertIn(os.path.join('game', 'author', 'filename'), cache)
+        cache.save()
+
+        # Move the whole "repo" elsewhere; the cache should still be valid
+        new_repo_dir = os.path.join(self.tmpdir, 'moved')
+        os.makedirs(new_repo_dir)
+        shutil.move(repo_dir, new_repo_dir)
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = DirInfo(new_repo_dir, os.path.join(new_repo_dir, 'game', 'author'), ['filename'])
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
         self.assertEqual(loaded_mod.mod_desc, ['testing'])
 
     def test_load_readme_new_file(self):
-        readme_filename = self.make_file('', 'filename', ['testing'], mtime=42)
+        self.make_file('', 'filename', ['testing'], mtime=42)
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(Readme, cache_filename)
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_NEW)
-        self.assertIn(readme_filename, cache)
+        self.assertIn('filename', cache)
         self.assertEqual(loaded_readme.mapping['(default)'], ['testing'])
 
     def test_load_readme_same_mtimes(self):
-        readme_filename = self.make_file('', 'filename', ['testing'], mtime=42)
+        self.make_file('', 'filename', ['testing'], mtime=42)
         readme = Readme(42)
         readme.mapping['(default)'].append('no overwrite')
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(Readme, cache_filename)
-        cache.mapping[readme_filename] = readme
+        cache.mapping['filename'] = readme
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_CACHED)
-        self.assertIn(readme_filename, cache)
+        self.assertIn('filename', cache)
         self.assertEqual(loaded_readme.mapping['(default)'], ['no overwrite'])
 
     def test_load_readme_newer(self):
-        readme_filename = self.make_file('', 'filename', ['testing'], mtime=84)
+        self.make_file('', 'filename', ['testing'], mtime=84)
         readme = Readme(42)
         readme.mapping['(default)'].append('overwrite')
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(Readme, cache_filename)
-        cache.mapping[readme_filename] = readme
+        cache.mapping['filename'] = readme
         cache.save()
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_UPDATED)
-        self.assertIn(readme_filename, cache)
+        self.assertIn('filename', cache)
         self.assertEqual(loaded_readme.mapping['(default)'], ['testing'])
 
     def test_load_cabinetinfo_new_file(self):
-        info_filename = self.make_file('', 'filename', ['cat1'], mtime=42)
+        self.make_file('', 'filename', ['cat1'], mtime=42)
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(CabinetInfo, cache_filename)
         cache.save()
 
         # Reload from disk, just in case anything's weird
         cache = FileCache(CabinetInfo, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         errors = []
         loaded_info = cache.load(dirinfo, 'filename',
                 rel_filename='filename', error_list=errors, valid_categories=self.valid_cats)
         self.assertIsNotNone(loaded_info)
         self.assertEqual(loaded_info.status, CabinetInfo.S_NEW)
-        self.assertIn(info_filename, cache)
+        self.assertIn('filename', cache)
         self.assertTrue(loaded_info.single_mod)
         self.assertIn(None, loaded_info.mods)
         self.assertEqual(loaded_info[None].categories, ['cat1'])
 
     def test_load_cabinetinfo_same_mtimes(self):
-        info_filename = self.make_file('', 'filename', ['cat1'], mtime=42)
+        self.make_file('', 'filename', ['cat1'], mtime=42)
         info = CabinetInfo(42)
         info.single_mod = True
         info.rel_filename = 'filename'
         info.mods[None] = CabinetModInfo('modname', ['cat1'])
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(CabinetInfo, cache_filename)
-        cache.mapping[info_filename] = info
+        cache.mapping['filename'] = info
         cache.save()
 
         # Reload from disk, just in case anything's weird
         cache = FileCache(CabinetInfo, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         errors = []
         loaded_info = cache.load(dirinfo, 'filename',
                 rel_filename='filename', error_list=errors, valid_categories=self.valid_cats)
         self.assertIsNotNone(loaded_info)
         self.assertEqual(loaded_info.status, CabinetInfo.S_CACHED)
-        self.assertIn(info_filename, cache)
+        self.assertIn('filename', cache)
         self.assertTrue(loaded_info.single_mod)
         self.assertIn(None, loaded_info.mods)
         self.assertEqual(loaded_info[None].categories, ['cat1'])
 
     def test_load_cabinetinfo_newer(self):
-        info_filename = self.make_file('', 'filename', ['cat1'], mtime=84)
+        self.make_file('', 'filename', ['cat1'], mtime=84)
         info = CabinetInfo(42)
         info.single_mod = True
         info.rel_filename = 'filename'
         info.mods[None] = CabinetModInfo('modname', ['cat1'])
         cache_filename = os.path.join(self.tmpdir, 'cache')
         cache = FileCache(CabinetInfo, cache_filename)
-        cache.mapping[info_filename] = info
+        cache.mapping['filename'] = info
         cache.save()
 
         # Reload from disk, just in case anything's weird
         cache = FileCache(CabinetInfo, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'])
         errors = []
         loaded_info = cache.load(dirinfo, 'filename',
                 rel_filename='filename', error_list=errors, valid_categories=self.valid_cats)
         self.assertIsNotNone(loaded_info)
         self.assertEqual(loaded_info.status, CabinetInfo.S_UPDATED)
-        self.assertIn(info_filename, cache)
+        self.assertIn('filename', cache)
         self.assertTrue(loaded_info.single_mod)
         self.assertIn(None, loaded_info.mods)
         self.assertEqual(loaded_info[None].categories, ['cat1'])
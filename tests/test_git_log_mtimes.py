@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import unittest
+from cabinetsorter.app import git_log_mtimes, split_nul
+
+class GitLogMTimesTests(unittest.TestCase):
+    """
+    Testing our parsing of `git log` output for setting initial mtimes
+    """
+
+    def make_fields(self, commits):
+        """
+        Given a list of `(timestamp, [filenames])` tuples, produce the
+        NUL-separated fields which `git log -z --name-only --format=%x00%ct`
+        would give us.
+        """
+        output = ''
+        for (timestamp, filenames) in commits:
+            output += "\0{}\0".format(timestamp)
+            if filenames:
+                output += "\n{}\0".format("\0".join(filenames))
+        return list(split_nul(io.BytesIO(output.encode('utf-8'))))
+
+    def test_empty(self):
+        self.assertEqual(git_log_mtimes([], ['file.txt']), {})
+
+    def test_single(self):
+        fields = self.make_fields([(42, ['file.txt'])])
+        self.assertEqual(git_log_mtimes(fields, ['file.txt']), {'file.txt': 42})
+
+    def test_newest_wins(self):
+        fields = self.make_fields([
+            (84, ['file.txt']),
+            (42, ['file.txt', 'other.txt']),
+            ])
+        self.assertEqual(git_log_mtimes(fields, ['file.txt', 'other.txt']), {
+            'file.txt': 84,
+            'other.txt': 42,
+            })
+
+    def test_unwanted_files(self):
+        fields = self.make_fields([
+            (84, ['deleted.txt']),
+            (42, ['file.txt']),
+            ])
+        self.assertEqual(git_log_mtimes(fields, ['file.txt']), {'file.txt': 42})
+
+    def test_missing_files(self):
+        fields = self.make_fields([(42, ['file.txt'])])
+        self.assertEqual(git_log_mtimes(fields, ['file.txt', 'other.txt']), {'file.txt': 42})
+
+    def test_numeric_filename(self):
+        fields = self.make_fields([
+            (84, ['1234']),
+            (42, ['file.txt']),
+            ])
+        self.assertEqual(git_log_mtimes(fields, ['1234', 'file.txt']), {
+            '1234': 84,
+            'file.txt': 42,
+            })
+
+    def test_stops_early(self):
+        fields = iter(self.make_fields([
+            (84, ['file.txt']),
+            (42, ['other.txt']),
+            ]))
+        self.assertEqual(git_log_mtimes(fields, ['file.txt']), {'file.txt': 84})
+        self.assertEqual(next(fields), '')
+        self.assertEqual(next(fields), '42')
+
+    def test_empty_commit(self):
+        fields = self.make_fields([
+            (126, []),
+            (84, ['file.txt']),
+            (42, ['other.txt']),
+            ])
+        self.assertEqual(git_log_mtimes(fields, ['file.txt', 'other.txt']), {
+            'file.txt': 84,
+            'other.txt': 42,
+            })
+
+    def test_quoted_filenames(self):
+        filenames = ['tab\tname.txt', 'quote"name.txt', 'back\\slash.txt',
+                'new\nline.txt', '\nleading.txt', 'caf\u00e9.txt']
+        fields = self.make_fields([
+            (84, filenames[:3]),
+            (42, filenames[3:]),
+            ])
+        self.assertEqual(git_log_mtimes(fields, filenames), {
+            'tab\tname.txt': 84,
+            'quote"name.txt': 84,
+            'back\\slash.txt': 84,
+            'new\nline.txt': 42,
+            '\nleading.txt': 42,
+            'caf\u00e9.txt': 42,
+            })
+
+class SplitNulTests(unittest.TestCase):
+    """
+    Testing splitting a binary stream up on NUL chars
+    """
+
+    def test_empty(self):
+        self.assertEqual(list(split_nul(io.BytesIO(b''))), [])
+
+    def test_trailing_nul(self):
+        self.assertEqual(list(split_nul(io.BytesIO(b'a\0\0b\0'))), ['a', '', 'b'])
+
+    def test_no_trailing_nul(self):
+        self.assertEqual(list(split_nul(io.BytesIO(b'a\0b'))), ['a', 'b'])
+
+    def test_across_chunks(self):
+        data = 'one\0two\0caf\u00e9\0three'.encode('utf-8')
+        for chunk_size in range(1, len(data)+1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(split_nul(io.BytesIO(data), chunk_size)),
+                        ['one', 'two', 'caf\u00e9', 'three'])
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+class ImportTimeTests(unittest.TestCase):
+    """
+    Making sure that our startup stays quick when there's nothing to do,
+    which is what happens on most of our runs.  We run Python with
+    `-X importtime` in a subprocess, so that we get a clean set of imports.
+    """
+
+    # Modules which are slow to import, and which we shouldn't need unless
+    # there's actually some work to do
+    heavy_modules = ['git', 'jinja2', 'Levenshtein', 'sqlite3', 'lzma', 'gzip', 'pickle']
+
+    # Rather than an absolute limit on how long importing the app can take,
+    # which would depend on how fast (and how busy) the system is, we
+    # compare against importing a couple of those heavy modules afterwards,
+    # in the same process.  Importing the app should take well under the
+    # time it takes to import those.  Timings are noisy, so we take the
+    # best of a few tries.
+    reference_modules = ['git', 'jinja2']
+    max_import_ratio = 0.75
+    import_tries = 3
+    reference_marker = 'import time: (reference)'
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def git(self, repo_dir, *args):
+        """
+        Runs a git command inside `repo_dir`, and returns its output
+        """
+        return subprocess.run(['git',
+                '-c', 'user.name=Test',
+                '-c', 'user.email=test@example.com',
+                ] + list(args),
+                cwd=repo_dir,
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                ).stdout.strip()
+
+    def run_importtime(self, code):
+        """
+        Runs the given Python `code` with `-X importtime`, followed by
+        importing our `reference_modules`.  Returns a tuple of two dicts
+        mapping each imported module to its cumulative import time, in
+        seconds: one for `code` itself, and one for the reference imports.
+        """
+        code = """{}
+import sys
+print({!r}, file=sys.stderr, flush=True)
+{}
+""".format(code, self.reference_marker, "\n".join(['import {}'.format(m) for m in self.reference_modules]))
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                cwd=self.package_dir,
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                )
+        times = {}
+        reference_times = {}
+        cur_times = times
+        for line in result.stderr.splitlines():
+            if line == self.reference_marker:
+                cur_times = reference_times
+            elif line.startswith('import time:') and '|' in line:
+                (_, cumulative, module) = line[len('import time:'):].split('|')
+                if cumulative.strip().isdigit():
+                    cur_times[module.strip()] = int(cumulative)/1000000
+        return (times, reference_times)
+
+    def check_imports(self, code):
+        """
+        Runs `code` via `run_importtime`, and checks that none of our heavy
+        modules were imported, and that importing the app was quick enough
+        compared to importing our reference modules.
+        """
+        ratios = []
+        for attempt in range(self.import_tries):
+            (times, reference_times) = self.run_importtime(code)
+            self.assertIn('cabinetsorter.app', times)
+            for module in self.heavy_modules:
+                with self.subTest(module=module):
+                    self.assertNotIn(module, times)
+            reference_time = sum([reference_times[m] for m in self.reference_modules])
+            ratios.append(times['cabinetsorter.app']/reference_time)
+            if ratios[-1] < self.max_import_ratio:
+                break
+        self.assertLess(min(ratios), self.max_import_ratio)
+
+    def test_import(self):
+        self.check_imports('import cabinetsorter.app')
+
+    def test_no_update_run(self):
+
+        # Set up a mods repo with an "upstream" which has nothing new
+        origin_dir = os.path.join(self.tmpdir, 'origin')
+        repo_dir = os.path.join(self.tmpdir, 'repo')
+        cache_dir = os.path.join(self.tmpdir, 'cache')
+        os.mkdir(origin_dir)
+        os.mkdir(cache_dir)
+        self.git(origin_dir, 'init', '-q')
+        with open(os.path.join(origin_dir, 'README.md'), 'w') as df:
+            print('Mods', file=df)
+        self.git(origin_dir, 'add', 'README.md')
+        self.git(origin_dir, 'commit', '-q', '-m', 'Initial commit')
+        self.git(self.tmpdir, 'clone', '-q', origin_dir, repo_dir)
+        with open(os.path.join(cache_dir, 'lastcommit.txt'), 'w') as df:
+            print(self.git(repo_dir, 'rev-parse', 'HEAD'), file=df)
+
+        ini_file = os.path.join(self.tmpdir, 'test.ini')
+        with open(ini_file, 'w') as df:
+            df.write("""
+[mods]
+base_url = https://example.com/tree/
+download_url = https://example.com/raw/
+repo_dir = {repo_dir}
+
+[wiki]
+cabinet_dir = {tmpdir}/wiki
+
+[cache]
+cache_dir = {cache_dir}
+
+[logging]
+log_dir = {tmpdir}/logs
+default_level = ERROR
+""".format(repo_dir=repo_dir, tmpdir=self.tmpdir, cache_dir=cache_dir))
+
+        self.check_imports("""
+from cabinetsorter.app import App
+assert App({}).run(quiet=True) == 0
+""".format(repr(ini_file)))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import gc
+import json
+import unittest
+import tracemalloc
+from cabinetsorter.app import ModFile, ModURL, Author, CabinetModInfo, pack_lines, unpack_lines
+
+class OldRe(object):
+    """
+    Stand-in for how Re used to be laid out in memory, with a regular
+    instance dict.
+    """
+
+    def __init__(self):
+        self.last_match = None
+
+class OldModURL(object):
+    """
+    Stand-in for how ModURL used to be laid out in memory, with a regular
+    instance dict.
+    """
+
+    def __init__(self, link_text):
+        if '|' in link_text:
+            (self.text, self.url) = link_text.split('|', 1)
+        else:
+            self.url = link_text
+            self.text = None
+
+class OldModFile(object):
+    """
+    Stand-in for how ModFile used to be laid out in memory: a regular
+    instance dict (plus its own Re helper), descriptions held as lists of
+    lines, and nothing interned.
+    """
+
+    def __init__(self, input_dict):
+        self.mtime = input_dict['m']
+        self.status = ModFile.S_CACHED
+        self.re = OldRe()
+        self.seen = False
+        self.full_filename = None
+        self.mod_time = None
+        self.rel_path = input_dict['rp']
+        self.rel_filename = input_dict['rf']
+        self.wiki_filename_base = input_dict['w']
+        self.mod_author = input_dict['a']
+        self.mod_title = input_dict['t']
+        self.mod_title_display = input_dict['i']
+        self.mod_desc = list(input_dict['d'])
+        self.use_mod_desc = input_dict['q']
+        self.readme_desc = list(input_dict['r'])
+        self.readme_rel = input_dict['l']
+        self.changelog = list(input_dict['o'])
+        self.related_links = list(input_dict['e'])
+        self.nexus_link = OldModURL(input_dict['n'])
+        self.screenshots = [OldModURL(u) for u in input_dict['s']]
+        self.youtube_urls = [OldModURL(u) for u in input_dict['y']]
+        self.urls = [OldModURL(u) for u in input_dict['u']]
+        self.categories = set(input_dict['c'])
+        self.game = input_dict['g']
+
+class MemoryTests(unittest.TestCase):
+    """
+    Testing that our cached objects are stored compactly
+    """
+
+    def mod_dict(self, num):
+        """
+        Returns a serialized mod dict for mod number `num`, in the older
+        format where descriptions are stored as lists of lines.
+        """
+        return {
+                'rp': 'Borderlands 2 mods/Author {}'.format(num % 10),
+                'rf': 'mod{}.blcm'.format(num),
+                'w': 'Mod {}'.format(num),
+                'a': 'Author {}'.format(num % 10),
+                't': 'Mod {}'.format(num),
+                'i': 'Mod {}'.format(num),
+                'd': ['Line {} of the description for this mod'.format(line) for line in range(12)],
+                'q': True,
+                'r': ['Line {} of the README for this mod'.format(line) for line in range(8)],
+                'l': 'Borderlands 2 mods/Author {}/README.md'.format(num % 10),
+                'o': ['v1.0.{}: Fixed some things'.format(line) for line in range(4)],
+                'e': [],
+                'n': 'https://www.nexusmods.com/borderlands2/mods/{}'.format(num),
+                's': ['Screenshot|https://example.com/{}.png'.format(num)],
+                'y': [],
+                'u': ['https://example.com/{}'.format(num)],
+                'c': ['qol', 'gear-pistols'],
+                'g': 'BL2',
+                'm': 1600000000 + num,
+                }
+
+    def test_pack_lines(self):
+        for lines in [[], ['one'], ['one', '', 'two'], ['']]:
+            with self.subTest(lines=lines):
+                self.assertEqual(unpack_lines(pack_lines(lines)), lines)
+        self.assertEqual(pack_lines([]), None)
+        self.assertEqual(pack_lines(['one', 'two']), "one\ntwo")
+
+    def test_unpack_old_format(self):
+        self.assertEqual(unpack_lines(['one', 'two']), ['one', 'two'])
+
+    def test_no_instance_dicts(self):
+        for obj in [ModFile(0), ModURL('http://example.com/'), Author(0, name='Author'), CabinetModInfo('mod.txt', [])]:
+            with self.subTest(cls=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_unserialize_old_format(self):
+        mod = ModFile.unserialize(ModFile, self.mod_dict(1))
+        self.assertEqual(mod.mod_desc, self.mod_dict(1)['d'])
+        self.assertEqual(mod.readme_desc, self.mod_dict(1)['r'])
+        self.assertEqual(mod.changelog, self.mod_dict(1)['o'])
+        self.assertEqual(mod.serialize()['d'], "\n".join(self.mod_dict(1)['d']))
+
+    def test_strings_shared(self):
+        mod1 = ModFile.unserialize(ModFile, self.mod_dict(1))
+        mod2 = ModFile.unserialize(ModFile, self.mod_dict(11))
+        self.assertIs(mod1.mod_author, mod2.mod_author)
+        self.assertIs(mod1.game, mod2.game)
+        self.assertIs(mod1.rel_path, mod2.rel_path)
+        self.assertEqual(mod1.categories, mod2.categories)
+        for cat in mod1.categories:
+            self.assertIs(cat, [c for c in mod2.categories if c == cat][0])
+
+    def retained_size(self, mod_class):
+        """
+        Decodes a catalog of mods from JSON and turns each one into a
+        `mod_class` object, returning how much memory those objects hold
+        onto once the decoded data is gone.
+        """
+        raw = json.dumps(dict([(str(num), self.mod_dict(num)) for num in range(500)]))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            data = json.loads(raw)
+            mods = [mod_class(mod_dict) for mod_dict in data.values()]
+            del data
+            gc.collect()
+            (mods_size, _) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(mods), 500)
+        return mods_size
+
+    def test_catalog_size(self):
+        """
+        Once unserialized, our mods should take up noticeably less memory
+        than they did when they were plain objects holding lists of strings.
+        """
+        old_size = self.retained_size(OldModFile)
+        new_size = self.retained_size(lambda mod_dict: ModFile.unserialize(ModFile, mod_dict))
+        self.assertLess(new_size, old_size*.75)
@@ -138,3 +138,25 @@ class ModFileAutodetectTests(unittest.TestCase):
         self.assertEqual(mf.seen, True)
         self.assertEqual(mf.mod_title, 'Mod Name')
         self.assertEqual(mf.mod_desc, ['Testing Mod'])
+
+    def test_latin1(self):
+        full_file = os.path.join(self.full_mod_dir, 'filename')
+        with open(full_file, 'w', encoding='latin1') as df:
+            print('#<Caf\u00e9 Mod>', file=df)
+            print('', file=df)
+            print('Testing Caf\u00e9', file=df)
+            print('', file=df)
+            print('set foo bar baz', file=df)
+        self.dirinfo.lower_mapping['filename'] = full_file
+        mf = ModFile(0, dirinfo=self.dirinfo, filename='filename')
+        self.assertEqual(mf.mod_title, 'Caf\u00e9 Mod')
+        self.assertEqual(mf.mod_desc, ['Testing Caf\u00e9'])
+
+    def test_crlf(self):
+        full_file = os.path.join(self.full_mod_dir, 'filename')
+        with open(full_file, 'wb') as df:
+            df.write(b'<BLCMM v="1">\r\n<category name="Mod Name">\r\n<comment>Testing Mod</comment>\r\n</category>\r\n')
+        self.dirinfo.lower_mapping['filename'] = full_file
+        mf = ModFile(0, dirinfo=self.dirinfo, filename='filename')
+        self.assertEqual(mf.mod_title, 'Mod Name')
+        self.assertEqual(mf.mod_desc, ['Testing Mod'])
@@ -264,3 +264,43 @@ class ModFileDataSetTests(unittest.TestCase):
                 self.assertTrue(modfile.seen)
                 self.assertEqual(modfile.readme_desc, ['readme'])
                 self.assertEqual(modfile.status, end_status)
+
+    def test_changed_fields_initial(self):
+        for (initial_status, changed_fields) in [
+                (ModFile.S_UNKNOWN, ModFile.F_ALL),
+                (ModFile.S_CACHED, 0),
+                (ModFile.S_NEW, ModFile.F_ALL),
+                (ModFile.S_UPDATED, ModFile.F_ALL),
+                ]:
+            with self.subTest(initial_status=initial_status):
+                modfile = ModFile(0, initial_status=initial_status)
+                self.assertEqual(modfile.changed_fields, changed_fields)
+
+    def test_changed_fields_unchanged(self):
+        modfile = ModFile(0, initial_status=ModFile.S_CACHED)
+        modfile.set_categories([])
+        modfile.set_title_display(None)
+        modfile.set_wiki_filename_base(None)
+        modfile.set_related_links([])
+        modfile.set_urls([])
+        modfile.update_use_mod_desc(True)
+        modfile.update_readme_desc(None, [])
+        modfile.update_changelog([])
+        self.assertEqual(modfile.changed_fields, 0)
+        self.assertEqual(modfile.status, ModFile.S_CACHED)
+
+    def test_changed_fields_set(self):
+        for (method, args, field) in [
+                ('set_categories', (['cat1'],), ModFile.F_CATEGORIES),
+                ('set_title_display', ('Title',), ModFile.F_TITLE_DISPLAY),
+                ('set_wiki_filename_base', ('Title',), ModFile.F_WIKI_FILENAME),
+                ('set_urls', (['https://example.com/'],), ModFile.F_URLS),
+                ('update_use_mod_desc', (False,), ModFile.F_USE_MOD_DESC),
+                ('update_readme_desc', (None, ['desc']), ModFile.F_README),
+                ('update_changelog', (['change'],), ModFile.F_CHANGELOG),
+                ]:
+            with self.subTest(method=method):
+                modfile = ModFile(0, initial_status=ModFile.S_CACHED)
+                getattr(modfile, method)(*args)
+                self.assertEqual(modfile.changed_fields, field)
+                self.assertEqual(modfile.status, ModFile.S_UPDATED)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import unittest
+from cabinetsorter.app import ModFileReader
+
+class ModFileReaderTests(unittest.TestCase):
+    """
+    Testing our lazy line-by-line mod file reader
+    """
+
+    def new_reader(self, data, chunk_size=None):
+        """
+        Returns a new ModFileReader reading from the given bytes `data`,
+        optionally with a different chunk size.  Also returns the underlying
+        binary file object.
+        """
+        raw_df = io.BytesIO(data)
+        reader = ModFileReader(raw_df)
+        if chunk_size is not None:
+            reader.chunk_size = chunk_size
+        return (reader, raw_df)
+
+    def test_empty(self):
+        (reader, raw_df) = self.new_reader(b'')
+        self.assertEqual(reader.readline(), '')
+        self.assertEqual(list(reader), [])
+
+    def test_lines(self):
+        (reader, raw_df) = self.new_reader(b'one\ntwo\nthree')
+        self.assertEqual(list(reader), ['one\n', 'two\n', 'three'])
+
+    def test_line_endings(self):
+        (reader, raw_df) = self.new_reader(b'one\r\ntwo\rthree\nfour\r\n')
+        self.assertEqual(list(reader), ['one\n', 'two\n', 'three\n', 'four\n'])
+
+    def test_chunk_boundaries(self):
+        data = b'one\r\ntwo\rthree\nfour\r\nfive'
+        expected = ['one\n', 'two\n', 'three\n', 'four\n', 'five']
+        for chunk_size in range(1, len(data)+1):
+            with self.subTest(chunk_size=chunk_size):
+                (reader, raw_df) = self.new_reader(data, chunk_size=chunk_size)
+                self.assertEqual(list(reader), expected)
+
+    def test_utf8(self):
+        (reader, raw_df) = self.new_reader('Café\nMod\n'.encode('utf-8'))
+        self.assertEqual(list(reader), ['Café\n', 'Mod\n'])
+        self.assertEqual(reader.encoding, 'utf-8')
+
+    def test_latin1(self):
+        (reader, raw_df) = self.new_reader('Café\nMod\n'.encode('latin1'))
+        self.assertEqual(list(reader), ['Café\n', 'Mod\n'])
+        self.assertEqual(reader.encoding, 'latin1')
+
+    def test_latin1_later(self):
+        (reader, raw_df) = self.new_reader('Mod\nCafé\nCafé\n'.encode('latin1'))
+        self.assertEqual(list(reader), ['Mod\n', 'Café\n', 'Café\n'])
+        self.assertEqual(reader.encoding, 'latin1')
+
+    def test_seek(self):
+        (reader, raw_df) = self.new_reader(b'one\ntwo\nthree\n')
+        self.assertEqual(reader.readline(), 'one\n')
+        reader.seek(0)
+        self.assertEqual(list(reader), ['one\n', 'two\n', 'three\n'])
+
+    def test_seek_nonzero(self):
+        (reader, raw_df) = self.new_reader(b'one\n')
+        with self.assertRaises(ValueError):
+            reader.seek(1)
+
+    def test_lazy(self):
+        (reader, raw_df) = self.new_reader(b'one\n' + (b'x'*100 + b'\n')*100, chunk_size=10)
+        self.assertEqual(reader.readline(), 'one\n')
+        self.assertLess(raw_df.tell(), 20)
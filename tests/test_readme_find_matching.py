@@ -23,7 +23,7 @@
 
 import io
 import unittest
-from cabinetsorter.app import Readme
+from cabinetsorter.app import Readme, Cacheable
 
 class ReadmeReadFindMatchingTests(unittest.TestCase):
     """
@@ -145,3 +145,95 @@ class ReadmeReadFindMatchingTests(unittest.TestCase):
             ])
         self.assertEqual(self.readme.find_matching('xyzzy', single_mod=False),
                 [])
+
+    def test_multi_mod_batch(self):
+        self.read([
+            'Beginning Text',
+            '# xyzzyz',
+            'Testing',
+            '# Foobar',
+            'Also Testing',
+            '# Unrelated',
+            'Not Matched',
+            ])
+        self.assertEqual(self.readme.find_matching_batch(['xyzzy', 'foobar', 'baz'], single_mod=False),
+                [['Testing'], ['Also Testing'], []])
+
+    def test_single_mod_batch_overview(self):
+        self.read([
+            'Beginning Text',
+            '# Overview',
+            'Testing',
+            '# Foobar',
+            'Not Matched',
+            ])
+        self.assertEqual(self.readme.find_matching_batch(['foobar', 'xyzzy'], single_mod=True),
+                [['Testing'], ['Testing']])
+
+    def test_batch_first_match(self):
+        self.read([
+            'Beginning Text',
+            '# xyzzyzz',
+            'First',
+            '# xyzzy',
+            'Second',
+            ])
+        self.assertEqual(self.readme.find_matching_batch(['xyzzy'], single_mod=False),
+                [['First']])
+
+    def test_match_sections_length_bounds(self):
+        self.read([
+            '# ab',
+            'Too Short',
+            '# abcdefghi',
+            'Too Long',
+            '# abcdef',
+            'Matched',
+            ])
+        self.assertEqual(self.readme.match_sections(['abcdef', 'abc', 'xyz']),
+                ['abcdef', None, None])
+
+    def test_matches_remembered(self):
+        self.read([
+            'Beginning Text',
+            '# xyzzyz',
+            'Testing',
+            '# Foobar',
+            'Not Matched',
+            ])
+        self.assertEqual(self.readme.find_matching('XYZZY', single_mod=False),
+                ['Testing'])
+        self.assertEqual(self.readme.find_matching('baz', single_mod=False),
+                [])
+        self.assertEqual(self.readme.matches, {'xyzzy': 'xyzzyz', 'baz': None})
+        self.assertEqual(self.readme.matches_changed, True)
+
+    def test_remembered_match_used(self):
+        self.read([
+            'Beginning Text',
+            '# xyzzy',
+            'Testing',
+            '# Foobar',
+            'Also Testing',
+            ])
+        self.readme.matches = {'xyzzy': 'foobar'}
+        self.assertEqual(self.readme.find_matching('xyzzy', single_mod=False),
+                ['Also Testing'])
+        self.assertEqual(self.readme.matches_changed, False)
+
+    def test_matches_serialized(self):
+        self.read([
+            'Beginning Text',
+            '# xyzzy',
+            'Testing',
+            ])
+        self.readme.find_matching('xyzzy', single_mod=False)
+        new_readme = Readme.unserialize(Readme, self.readme.serialize())
+        self.assertEqual(new_readme.matches, {'xyzzy': 'xyzzy'})
+        self.assertEqual(new_readme.is_dirty(), False)
+        self.assertEqual(new_readme.find_matching('xyzzy', single_mod=False),
+                ['Testing'])
+        self.assertEqual(new_readme.is_dirty(), False)
+        new_readme.find_matching('foobar', single_mod=False)
+        self.assertEqual(new_readme.status, Cacheable.S_CACHED)
+        self.assertEqual(new_readme.is_dirty(), True)
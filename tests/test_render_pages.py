@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import os
+import shutil
+import unittest
+import tempfile
+from cabinetsorter.app import App, Author, init_render_worker, render_page
+
+class RenderPagesTests(unittest.TestCase):
+    """
+    Testing rendering wiki pages, both in and out of worker processes
+    """
+
+    ini = """
+[mods]
+base_url = https://example.com/tree/
+download_url = https://example.com/raw/
+repo_dir = repo
+
+[wiki]
+cabinet_dir = wiki
+
+[cache]
+cache_dir = cache
+
+[processing]
+workers = 2
+
+[logging]
+log_dir = logs
+default_level = ERROR
+"""
+
+    template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+
+    def setUp(self):
+        """
+        Initialize some vars we'll need on every test.
+        """
+        self.app = App(io.StringIO(self.ini))
+        self.app.template_dir = self.template_dir
+        self.app.template_cache_dir = tempfile.mkdtemp()
+        self.app.load_templates()
+        self.shared_context = {
+                'games': self.app.games,
+                'cats': self.app.categories,
+                'base_url': self.app.base_url,
+                'dl_base_url': self.app.dl_base_url,
+                }
+        self.jobs = []
+        for num in range(5):
+            author = Author(0, name='Author {}'.format(num))
+            author.mods = {'BL2': set(['[[Mod {}|Mod-{}]]'.format(num, num)])}
+            self.jobs.append(('author.md', {'author': author}))
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.app.template_cache_dir)
+
+    def render(self, min_parallel):
+        """
+        Renders our jobs, parallelizing if there are at least `min_parallel`
+        of them.
+        """
+        return list(self.app.render_pages(self.jobs, self.shared_context, min_parallel=min_parallel))
+
+    def test_render_page(self):
+        init_render_worker(self.template_dir, self.shared_context)
+        content = render_page(self.jobs[0])
+        self.assertIn('# Mods by Author 0', content)
+        self.assertIn('- [[Mod 0|Mod-0]]', content)
+
+    def test_serial(self):
+        pages = self.render(min_parallel=100)
+        self.assertEqual(len(pages), 5)
+        for (num, page) in enumerate(pages):
+            self.assertIn('# Mods by Author {}'.format(num), page)
+
+    def test_parallel_matches_serial(self):
+        self.assertEqual(self.render(min_parallel=1), self.render(min_parallel=100))
+
+    def test_no_jobs(self):
+        self.jobs = []
+        self.assertEqual(self.render(min_parallel=1), [])
+
+    def test_templates_lazy(self):
+        self.assertEqual(len(self.app.jinja_env.cache), 0)
+        self.assertEqual(os.listdir(self.app.template_cache_dir), [])
+        self.render(min_parallel=100)
+        self.assertEqual(len(self.app.jinja_env.cache), 1)
+        self.assertEqual(len(os.listdir(self.app.template_cache_dir)), 1)
+
+    def test_bytecode_cache_reused(self):
+        first = self.render(min_parallel=100)
+
+        # A fresh environment should be able to pick up the compiled
+        # template without compiling it again.
+        self.app.load_templates()
+        def no_compile(*args, **kwargs):
+            raise Exception('Template should not have been compiled')
+        self.app.jinja_env.compile = no_compile
+        self.assertEqual(self.render(min_parallel=100), first)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import shutil
+import sqlite3
+import unittest
+import tempfile
+from cabinetsorter.app import SQLiteFileCache, ModFile, Readme, DirInfo, Author
+
+class SQLiteFileCacheTests(unittest.TestCase):
+    """
+    Test our SQLiteFileCache class.  Like the FileCache tests, we're
+    mostly not testing any ModFile or Readme functionality in here.
+    """
+
+    def setUp(self):
+        """
+        Things we need to do to start up every test in here
+        """
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_filename = os.path.join(self.tmpdir, 'cache.sqlite3')
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def make_file(self, filename, lines, mtime=None):
+        """
+        Creates a file inside our tmpdir named `filename`, containing the
+        list of strings `lines` as its contents.
+        """
+        full_file = os.path.join(self.tmpdir, filename)
+        with open(full_file, 'w') as df:
+            for line in lines:
+                print(line, file=df)
+        if mtime is not None:
+            stat_result = os.stat(full_file)
+            os.utime(full_file, times=(stat_result.st_atime, mtime))
+        return full_file
+
+    def make_mod(self, mtime, title):
+        """
+        Creates a ModFile with the given `mtime` and `title`
+        """
+        mod = ModFile(mtime)
+        mod.mod_title = title
+        mod.mod_desc = [title]
+        return mod
+
+    def get_rows(self, cache_key='mods'):
+        """
+        Reads the rows for `cache_key` directly out of our database,
+        returning a dict of unserialized JSON data.
+        """
+        conn = sqlite3.connect(self.db_filename)
+        rows = dict([(filename, json.loads(data)) for (filename, data) in conn.execute(
+            'select filename, data from entries where cache_key=?', (cache_key,))])
+        conn.close()
+        return rows
+
+    def set_row(self, filename, data, cache_key='mods'):
+        """
+        Overwrites a row directly in our database
+        """
+        conn = sqlite3.connect(self.db_filename)
+        with conn:
+            conn.execute('update entries set data=? where cache_key=? and filename=?',
+                    (json.dumps(data), cache_key, filename))
+        conn.close()
+
+    def test_construct_empty(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        self.assertEqual(len(cache), 0)
+        self.assertNotIn('/foo', cache)
+        self.assertEqual(list(cache.items()), [])
+
+    def test_old_version(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache.save()
+        conn = sqlite3.connect(self.db_filename)
+        with conn:
+            conn.execute('update meta set version=? where cache_key=?',
+                    (SQLiteFileCache.cache_version + 1, 'mods'))
+        conn.close()
+        with self.assertRaises(Exception):
+            SQLiteFileCache(ModFile, self.db_filename)
+
+    def test_save_and_load(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/foo'] = self.make_mod(42, 'Foo')
+        cache['/bar'] = self.make_mod(84, 'Bar')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        self.assertEqual(len(cache), 2)
+        self.assertIn('/foo', cache)
+        self.assertEqual(cache['/foo'].mod_title, 'Foo')
+        self.assertEqual(cache['/foo'].mtime, 42)
+        self.assertEqual(cache['/foo'].status, ModFile.S_CACHED)
+        self.assertEqual(cache['/bar'].mod_title, 'Bar')
+        self.assertEqual(sorted(cache.keys()), ['/bar', '/foo'])
+
+    def test_shared_database(self):
+        mod_cache = SQLiteFileCache(ModFile, self.db_filename)
+        mod_cache['/foo'] = self.make_mod(42, 'Foo')
+        mod_cache.save()
+        author_cache = SQLiteFileCache(Author, self.db_filename)
+        author_cache['Foo'] = Author(0, name='Foo')
+        author_cache.save()
+
+        mod_cache = SQLiteFileCache(ModFile, self.db_filename)
+        author_cache = SQLiteFileCache(Author, self.db_filename)
+        self.assertEqual(list(mod_cache.keys()), ['/foo'])
+        self.assertEqual(list(author_cache.keys()), ['Foo'])
+
+    def test_load_on_demand(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/foo'] = self.make_mod(42, 'Foo')
+        cache['/bar'] = self.make_mod(84, 'Bar')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        self.assertEqual(len(cache.mapping.entries), 0)
+        self.assertEqual(cache.peek('/bar')['t'], 'Bar')
+        self.assertEqual(cache['/foo'].mod_title, 'Foo')
+        self.assertEqual(sorted(cache.mapping.entries.keys()), ['/bar', '/foo'])
+        self.assertEqual(list(cache.mapping.raw_keys), ['/bar'])
+
+    def test_save_only_changed(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/foo'] = self.make_mod(42, 'Foo')
+        cache['/bar'] = self.make_mod(84, 'Bar')
+        cache.save()
+
+        # Add an extra key to the rows behind the cache's back, which won't
+        # survive being unserialized and written out again.
+        rows = self.get_rows()
+        for (filename, data) in rows.items():
+            data['sneaky'] = True
+            self.set_row(filename, data)
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        for mod in cache.values():
+            pass
+        cache['/bar'].set_categories(['cat1'])
+        cache.save()
+
+        rows = self.get_rows()
+        self.assertIn('sneaky', rows['/foo'])
+        self.assertNotIn('sneaky', rows['/bar'])
+        self.assertEqual(rows['/bar']['c'], ['cat1'])
+
+    def test_save_hash_learned(self):
+        self.make_file('filename', ['testing'], mtime=42)
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['filename'] = self.make_mod(42, 'Foo')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['filename'], blob_hashes={'filename': 'abcdef'})
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        cache.save()
+
+        self.assertEqual(self.get_rows()['filename']['h'], 'abcdef')
+
+    def test_delete(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/foo'] = self.make_mod(42, 'Foo')
+        cache['/bar'] = self.make_mod(84, 'Bar')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        del cache['/foo']
+        self.assertNotIn('/foo', cache)
+        self.assertEqual(len(cache), 1)
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        self.assertEqual(list(cache.keys()), ['/bar'])
+
+    def test_delete_not_found(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        with self.assertRaises(KeyError):
+            del cache['/foo']
+
+    def test_no_load(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/foo'] = self.make_mod(42, 'Foo')
+        cache['/bar'] = self.make_mod(84, 'Bar')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename, do_load=False)
+        self.assertEqual(len(cache), 0)
+        self.assertNotIn('/foo', cache)
+        cache['/baz'] = self.make_mod(42, 'Baz')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        self.assertEqual(list(cache.keys()), ['/baz'])
+
+    def test_load_mod_new_and_updated(self):
+        self.make_file('file1', ['one'], mtime=42)
+        self.make_file('file2', ['two'], mtime=84)
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['file2'] = self.make_mod(42, 'Foo')
+        cache.save()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        dirinfo = DirInfo(self.tmpdir, self.tmpdir, ['file1', 'file2'])
+        loaded = cache.load(dirinfo, 'file1')
+        self.assertEqual(loaded.status, ModFile.S_NEW)
+        loaded = cache.load(dirinfo, 'file2')
+        self.assertEqual(loaded.status, ModFile.S_UPDATED)
+        self.assertEqual(loaded.mod_desc, ['two'])
+        cache.save()
+
+        rows = self.get_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows['file2']['m'], 84)
+
+    def test_migrate_v1_keys(self):
+        cache = SQLiteFileCache(ModFile, self.db_filename)
+        cache['/repo/dir/game/author/mod.txt'] = self.make_mod(42, 'Foo')
+        cache['/elsewhere/mod.txt'] = self.make_mod(42, 'Bar')
+        cache.save()
+        conn = sqlite3.connect(self.db_filename)
+        with conn:
+            conn.execute('update meta set version=1 where cache_key=?', ('mods',))
+        conn.close()
+
+        cache = SQLiteFileCache(ModFile, self.db_filename, repo_dir='/repo/dir')
+        self.assertEqual(sorted(cache.keys()), ['/elsewhere/mod.txt', 'game/author/mod.txt'])
+        self.assertEqual(cache['game/author/mod.txt'].mod_title, 'Foo')
+
+        # Should only happen the once
+        cache = SQLiteFileCache(ModFile, self.db_filename, repo_dir='/elsewhere')
+        self.assertEqual(sorted(cache.keys()), ['/elsewhere/mod.txt', 'game/author/mod.txt'])
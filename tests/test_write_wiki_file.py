@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands ModCabinet Sorter.
+#
+# Borderlands ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import io
+import os
+import shutil
+import unittest
+import tempfile
+from cabinetsorter.app import App, FileCache, PageHash
+
+class WriteWikiFileTests(unittest.TestCase):
+    """
+    Testing writing out wiki pages, using our page cache to skip pages
+    which haven't changed.
+    """
+
+    ini = """
+[mods]
+base_url = https://example.com/tree/
+download_url = https://example.com/raw/
+repo_dir = repo
+
+[wiki]
+cabinet_dir = wiki
+
+[cache]
+cache_dir = cache
+
+[logging]
+log_dir = logs
+default_level = ERROR
+"""
+
+    def setUp(self):
+        """
+        Initialize some vars we'll need on every test.
+        """
+        self.tmpdir = tempfile.mkdtemp()
+        self.app = App(io.StringIO(self.ini))
+        self.app.cabinet_dir = self.tmpdir
+        self.cache_filename = os.path.join(self.tmpdir, 'pagecache.json.xz')
+        self.app.page_cache = FileCache(PageHash, self.cache_filename)
+
+    def tearDown(self):
+        """
+        Cleanup tasks after every test
+        """
+        shutil.rmtree(self.tmpdir)
+
+    def wiki_files(self):
+        """
+        Returns a dict of the files currently in our wiki dir, mapped to
+        their stat info, as `App._run` would.
+        """
+        return dict([(f, os.stat(os.path.join(self.tmpdir, f))) for f in os.listdir(self.tmpdir)])
+
+    def write(self, filename, content):
+        """
+        Writes out `filename` to our wiki dir, returning the mtime it
+        has afterwards.
+        """
+        self.app.write_wiki_file(self.wiki_files(), filename, content)
+        return os.stat(os.path.join(self.tmpdir, filename)).st_mtime_ns
+
+    def set_mtime(self, filename, mtime):
+        """
+        Sets the mtime of `filename` (and of its page cache entry, if it
+        has one) to `mtime`, so that we can tell whether or not it gets
+        written again.
+        """
+        full_filename = os.path.join(self.tmpdir, filename)
+        os.utime(full_filename, (mtime, mtime))
+        if filename in self.app.page_cache:
+            self.app.page_cache[filename].mtime = os.stat(full_filename).st_mtime
+
+    def read(self, filename):
+        """
+        Returns the contents of `filename` in our wiki dir
+        """
+        with open(os.path.join(self.tmpdir, filename)) as df:
+            return df.read()
+
+    def test_new_page(self):
+        self.write('Page.md', 'Testing')
+        self.assertEqual(self.read('Page.md'), 'Testing')
+        self.assertIn('Page.md', self.app.page_cache)
+        page = self.app.page_cache['Page.md']
+        self.assertEqual(page.digest, PageHash.hash_content('Testing'))
+        self.assertEqual(page.size, 7)
+
+    def test_unchanged_page(self):
+        self.write('Page.md', 'Testing')
+        self.set_mtime('Page.md', 1000000000)
+        self.assertEqual(self.write('Page.md', 'Testing'), 1000000000*10**9)
+
+    def test_changed_page(self):
+        self.write('Page.md', 'Testing')
+        self.set_mtime('Page.md', 1000000000)
+        self.assertNotEqual(self.write('Page.md', 'Testing 2'), 1000000000*10**9)
+        self.assertEqual(self.read('Page.md'), 'Testing 2')
+        self.assertEqual(self.app.page_cache['Page.md'].digest, PageHash.hash_content('Testing 2'))
+
+    def test_page_changed_on_disk(self):
+        self.write('Page.md', 'Testing')
+        with open(os.path.join(self.tmpdir, 'Page.md'), 'w') as df:
+            df.write('Edited')
+        self.write('Page.md', 'Testing')
+        self.assertEqual(self.read('Page.md'), 'Testing')
+
+    def test_page_without_cache_entry(self):
+        with open(os.path.join(self.tmpdir, 'Page.md'), 'w') as df:
+            df.write('Edited')
+        self.write('Page.md', 'Testing')
+        self.assertEqual(self.read('Page.md'), 'Testing')
+        self.assertIn('Page.md', self.app.page_cache)
+
+    def test_cache_saved(self):
+        self.write('Page.md', 'Testing')
+        self.app.page_cache.save()
+        new_cache = FileCache(PageHash, self.cache_filename)
+        self.assertIn('Page.md', new_cache)
+        self.assertEqual(new_cache['Page.md'].digest, PageHash.hash_content('Testing'))
+        self.assertEqual(new_cache['Page.md'].size, 7)
+        self.assertEqual(new_cache['Page.md'].mtime, os.stat(os.path.join(self.tmpdir, 'Page.md')).st_mtime)
+
+    def test_fingerprint_stored(self):
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        self.assertEqual(self.app.page_cache['Page.md'].fingerprint, 'abc')
+        self.app.page_cache.save()
+        new_cache = FileCache(PageHash, self.cache_filename)
+        self.assertEqual(new_cache['Page.md'].fingerprint, 'abc')
+
+    def test_fingerprint_updated_without_write(self):
+        self.write('Page.md', 'Testing')
+        self.set_mtime('Page.md', 1000000000)
+        self.app.page_cache['Page.md'].status = PageHash.S_CACHED
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        self.assertEqual(os.stat(os.path.join(self.tmpdir, 'Page.md')).st_mtime_ns, 1000000000*10**9)
+        self.assertEqual(self.app.page_cache['Page.md'].fingerprint, 'abc')
+        self.assertEqual(self.app.page_cache['Page.md'].status, PageHash.S_UPDATED)
+
+    def test_page_current(self):
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        self.assertTrue(self.app.is_page_current(self.wiki_files(), 'Page.md', 'abc'))
+
+    def test_page_not_current_fingerprint(self):
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        self.assertFalse(self.app.is_page_current(self.wiki_files(), 'Page.md', 'def'))
+
+    def test_page_not_current_changed_on_disk(self):
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        with open(os.path.join(self.tmpdir, 'Page.md'), 'w') as df:
+            df.write('Edited')
+        self.assertFalse(self.app.is_page_current(self.wiki_files(), 'Page.md', 'abc'))
+
+    def test_page_not_current_missing(self):
+        self.app.write_wiki_file(self.wiki_files(), 'Page.md', 'Testing', fingerprint='abc')
+        os.unlink(os.path.join(self.tmpdir, 'Page.md'))
+        self.assertFalse(self.app.is_page_current(self.wiki_files(), 'Page.md', 'abc'))
+
+    def test_hash_fingerprint(self):
+        self.assertEqual(PageHash.hash_fingerprint(['a', [('b', 'c')]]),
+                PageHash.hash_fingerprint(['a', [('b', 'c')]]))
+        self.assertNotEqual(PageHash.hash_fingerprint(['a', [('b', 'c')]]),
+                PageHash.hash_fingerprint(['a', [('c', 'b')]]))